@@ -89,6 +89,10 @@ __all__ = [
     'Music21ObjectException',
     'ElementException',
 
+    'ContextCache',
+    'ContextCacheInfo',
+    'contextCache',
+
     'Groups',
     'Music21Object',
     'ElementWrapper',
@@ -143,6 +147,141 @@ class ContextSortTuple(t.NamedTuple):
     recurseType: stream.enums.RecursionType
 
 
+class ContextCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    currentSize: int
+
+
+class ContextCache:
+    '''
+    Memoizes the results of :meth:`Music21Object.getContextByClass`, which
+    is called for every note by `.beat`, `.measureNumber`, accidental and
+    key lookups, and which otherwise walks all the context sites each time.
+
+    There is one ContextCache for the whole system, `base.contextCache`.
+    Every change to a Stream hierarchy (anything that calls
+    :meth:`~music21.stream.core.StreamCore.coreElementsChanged`, or a Stream
+    getting a new activeSite) bumps its `epoch`, and the first lookup in a
+    new epoch throws every stored result away, so results can never be stale.
+
+    >>> base.contextCache
+    <music21.base.ContextCache epoch=... size=...>
+
+    >>> p = converter.parse('tinynotation: 3/4 C4 D E 2/4 F G')
+    >>> base.contextCache.clear()
+    >>> g = p.recurse().notes.last()
+    >>> g.getContextByClass(meter.TimeSignature)
+    <music21.meter.TimeSignature 2/4>
+    >>> g.getContextByClass(meter.TimeSignature)
+    <music21.meter.TimeSignature 2/4>
+    >>> base.contextCache.info()
+    ContextCacheInfo(hits=1, misses=1, currentSize=1)
+
+    After an edit the stored results are dropped:
+
+    >>> p.measure(2).remove(p.measure(2).timeSignature)
+    >>> g.getContextByClass(meter.TimeSignature)
+    <music21.meter.TimeSignature 3/4>
+    >>> base.contextCache.info()
+    ContextCacheInfo(hits=1, misses=2, currentSize=1)
+
+    Results are only kept as weak references, so the cache never keeps
+    a Stream alive.  Set `enabled` to False to turn memoization off.
+
+    * New in v11.
+    '''
+    __slots__ = ('enabled', 'epoch', 'hits', 'misses', '_entries', '_entriesEpoch')
+
+    def __init__(self) -> None:
+        self.enabled: bool = True
+        self.epoch: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: dict[tuple, tuple] = {}
+        self._entriesEpoch: int = 0
+
+    def __repr__(self) -> str:
+        return (f'<{self.__module__}.{self.__class__.__name__} '
+                f'epoch={self.epoch} size={len(self._entries)}>')
+
+    def lookup(self, key: tuple, obj: Music21Object) -> tuple[bool, Music21Object|None]:
+        '''
+        Return a tuple of whether a result for `key` was found and the result.
+
+        When the result was found inside a site, that site again becomes
+        the result's activeSite, just as when it was first found.
+        '''
+        if self._entriesEpoch != self.epoch:
+            self._entries = {}
+            self._entriesEpoch = self.epoch
+        entry = self._entries.get(key)
+        if entry is not None:
+            objRef, activeSiteRef, resultRef, siteRef = entry
+            if (objRef() is obj
+                    and (activeSiteRef() if activeSiteRef is not None else None)
+                        is obj.activeSite):
+                if resultRef is None:
+                    self.hits += 1
+                    return (True, None)
+                result = resultRef()
+                site = siteRef() if siteRef is not None else None
+                if result is not None and (siteRef is None or site is not None):
+                    if site is not None:
+                        try:
+                            site.coreSelfActiveSite(result)
+                        except SitesException:
+                            pass
+                    self.hits += 1
+                    return (True, result)
+        self.misses += 1
+        return (False, None)
+
+    def store(self,
+              key: tuple,
+              epoch: int,
+              obj: Music21Object,
+              result: Music21Object|None,
+              site: stream.Stream|None) -> None:
+        '''
+        Store the `result` of a search for `obj`, begun during `epoch`, that
+        was found in `site` (or None if it was not found inside a site).
+        If the hierarchy changed while searching, nothing is stored.
+        '''
+        if epoch != self.epoch or epoch != self._entriesEpoch:
+            return
+        activeSite = obj.activeSite
+        self._entries[key] = (
+            weakref.ref(obj),
+            weakref.ref(activeSite) if activeSite is not None else None,
+            weakref.ref(result) if result is not None else None,
+            weakref.ref(site) if site is not None else None,
+        )
+
+    def clear(self) -> None:
+        '''
+        Remove all stored results and reset the hit and miss counters.
+        '''
+        self._entries = {}
+        self._entriesEpoch = self.epoch
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> ContextCacheInfo:
+        '''
+        Return a ContextCacheInfo named tuple of hits, misses, and
+        the number of results currently stored.
+        '''
+        if self._entriesEpoch != self.epoch:
+            currentSize = 0
+        else:
+            currentSize = len(self._entries)
+        return ContextCacheInfo(self.hits, self.misses, currentSize)
+
+
+contextCache = ContextCache()
+
+
 # pseudo class for returning splitAtX() type commands.
 class _SplitTuple(tuple):
     '''
@@ -456,11 +595,6 @@ class Music21Object(prebase.ProtoM21Object):
 
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR: dict[str, str] = {
-        'groups': '''An instance of a :class:`~music21.base.Groups`
-            object which describes
-            arbitrary `Groups` that this object belongs to.''',
-        'sites': '''a :class:`~music21.sites.Sites` object that stores
-            references to Streams that hold this object.''',
         'isStream': '''Boolean value for quickly identifying
             :class:`~music21.stream.Stream` objects (False by default).''',
         'classSortOrder': '''Property which returns a number (int or otherwise)
@@ -533,11 +667,11 @@ class Music21Object(prebase.ProtoM21Object):
             duration.client = self
         self._priority = 0  # default is zero
 
-        # store cached values here:
-        self._cache: dict[str, t.Any] = {}
-
-        self.groups = groups or Groups()
-        self.sites = sites or Sites()
+        # cached values, groups, and sites are created when first needed;
+        # many objects (such as the Notes in a Chord) never need some of them.
+        self._cacheDict: dict[str, t.Any]|None = None
+        self._groups: Groups|None = groups or None
+        self._sites: Sites|None = sites
 
         # a duration object is not created until the .duration property is
         # accessed with _getDuration(); this is a performance optimization
@@ -608,12 +742,13 @@ class Music21Object(prebase.ProtoM21Object):
         '''
         if other.id != id(other):
             self.id = other.id
-        self.groups = copy.deepcopy(other.groups)
+        self._groups = copy.deepcopy(other._groups) if other._groups else None
 
     def _deepcopySubclassable(self,
                               memo: dict[int, t.Any]|None = None,
                               *,
-                              ignoreAttributes: set[str]|None = None) -> t.Self:
+                              ignoreAttributes: set[str]|None = None,
+                              copyDict: bool = False) -> t.Self:
         '''
         Subclassable __deepcopy__ helper so that the same attributes
         do not need to be called for each Music21Object subclass.
@@ -622,12 +757,18 @@ class Music21Object(prebase.ProtoM21Object):
         the default deepcopy style. More can be passed to it.  But calling
         functions are responsible
 
+        If copyDict is True, the attributes are copied straight from `__dict__`
+        with :func:`~music21.common.misc.dictDeepcopy`.  The most frequently copied
+        leaf classes (Note, Rest, Chord) ask for this for their exact types only,
+        since a subclass may keep state elsewhere.
+
         * Changed in v9: removeFromIgnore removed;
           never used and this is performance critical.
+        * Changed in v11: added copyDict.
         '''
-        defaultIgnoreSet = {'_derivation', '_activeSite', '_sites', '_cache'}
-        if not self.groups:
-            defaultIgnoreSet.add('groups')
+        defaultIgnoreSet = {'_derivation', '_activeSite', '_sites', '_cacheDict'}
+        if not self._groups:
+            defaultIgnoreSet.add('_groups')
         # duration is smart enough to do itself.
         # sites is smart enough to do itself
 
@@ -636,11 +777,17 @@ class Music21Object(prebase.ProtoM21Object):
         else:
             ignoreAttributes = ignoreAttributes | defaultIgnoreSet
 
-        new = common.defaultDeepcopy(self, memo, ignoreAttributes=ignoreAttributes)
-        new._cache = {}
-        new._sites = Sites()
-        if 'groups' in defaultIgnoreSet:
-            new.groups = Groups()
+        if copyDict:
+            new = common.dictDeepcopy(self, memo, ignoreAttributes=ignoreAttributes)
+        else:
+            new = common.defaultDeepcopy(self, memo, ignoreAttributes=ignoreAttributes)
+        new._cacheDict = None
+        # the copy is not in any Stream yet, so only the sites that purgeOrphans()
+        # keeps are copied, rather than copying them all and searching
+        # each Stream for the copy.
+        new._sites = self._sites.copyStorageSites() if self._sites is not None else None
+        if '_groups' in defaultIgnoreSet:
+            new._groups = None
 
         # was: keep the old ancestor but need to update the client
         # 2.1 : NO, add a derivation of __deepcopy__ to the client
@@ -651,7 +798,8 @@ class Music21Object(prebase.ProtoM21Object):
         # None activeSite is correct for new value
 
         # must do this after copying
-        new.purgeOrphans()
+        if new._sites is not None:
+            new.purgeOrphans()
 
         return new
 
@@ -703,6 +851,13 @@ class Music21Object(prebase.ProtoM21Object):
         return state
 
     def __setstate__(self, state: dict[str, t.Any]):
+        # objects stored before sites, groups, and the cache were created lazily
+        if 'sites' in state:
+            state['_sites'] = state.pop('sites')
+        if 'groups' in state:
+            state['_groups'] = state.pop('groups')
+        if '_cache' in state:
+            state['_cacheDict'] = state.pop('_cache')
         # defining self.__dict__ upon initialization currently breaks everything
         object.__setattr__(self, '__dict__', state)
 
@@ -899,6 +1054,60 @@ class Music21Object(prebase.ProtoM21Object):
     def derivation(self, newDerivation: Derivation|None) -> None:
         self._derivation = newDerivation
 
+    @property
+    def _cache(self) -> dict[str, t.Any]:
+        '''
+        A dict of cached values, created when first needed.  Setting
+        it to a new dict clears it.
+        '''
+        if self._cacheDict is None:
+            self._cacheDict = {}
+        return self._cacheDict
+
+    @_cache.setter
+    def _cache(self, newCache: dict[str, t.Any]) -> None:
+        self._cacheDict = newCache
+
+    @property
+    def groups(self) -> Groups:
+        '''
+        An instance of a :class:`~music21.base.Groups` object which describes
+        arbitrary `Groups` that this object belongs to.  Created when first needed.
+
+        >>> n = note.Note()
+        >>> n.groups
+        []
+        >>> n.groups.append('flute')
+        >>> n.groups
+        ['flute']
+        '''
+        if self._groups is None:
+            self._groups = Groups()
+        return self._groups
+
+    @groups.setter
+    def groups(self, new: Groups) -> None:
+        self._groups = new
+
+    @property
+    def sites(self) -> Sites:
+        '''
+        A :class:`~music21.sites.Sites` object that stores
+        references to Streams that hold this object.  Created when first needed.
+
+        >>> n = note.Note()
+        >>> s = stream.Stream([n])
+        >>> s in n.sites
+        True
+        '''
+        if self._sites is None:
+            self._sites = Sites()
+        return self._sites
+
+    @sites.setter
+    def sites(self, new: Sites) -> None:
+        self._sites = new
+
     def clearCache(self, **keywords) -> None:
         '''
         A number of music21 attributes (especially with Chords and RomanNumerals, etc.)
@@ -919,7 +1128,7 @@ class Music21Object(prebase.ProtoM21Object):
         '''
         # do not replace with self._cache.clear() -- leaves terrible
         # state for shallow copies.
-        self._cache = {}
+        self._cacheDict = None
 
     @overload
     def getOffsetBySite(
@@ -1260,7 +1469,9 @@ class Music21Object(prebase.ProtoM21Object):
         D shares a slur with C
         E shares a slur with C
         '''
-        found = self.sites.getSitesByClass('SpannerStorage')
+        if self._sites is None:
+            return []
+        found = self._sites.getSitesByClass('SpannerStorage')
         post: list[spanner.Spanner] = []
         if spannerClassList is not None:
             if not common.isIterable(spannerClassList):
@@ -1764,57 +1975,80 @@ class Music21Object(prebase.ProtoM21Object):
         if getElementMethod in AT_METHODS and className in self.classSet:
             return self
 
-        for site, positionStart, searchType in self.contextSites(
-            returnSortTuples=True,
-            sortByCreationTime=sortByCreationTime,
-            followDerivation=followDerivation,
-            priorityTargetOnly=priorityTargetOnly,
-        ):
-            if searchType in ('elementsOnly', 'elementsFirst'):
-                contextEl = payloadExtractor(site,
-                                             flatten=False,
-                                             innerPositionStart=positionStart)
-
-                if contextEl is not None and wellFormed(contextEl, site):
-                    try:
-                        site.coreSelfActiveSite(contextEl)
-                    except SitesException:
-                        pass
-                    return contextEl
-                # otherwise, continue to check for flattening
-
-            if searchType != 'elementsOnly':  # flatten or elementsFirst
-                if (getElementMethod in AFTER_METHODS
-                        and (not className
-                             or className in site.classSet)):
-                    if getElementMethod in NOT_SELF_METHODS and self is site:
-                        pass
-                    elif getElementMethod not in NOT_SELF_METHODS:  # for 'After' we can't do the
-                        # containing site because that comes before.
-                        return site  # if the site itself is the context, return it
-
-                contextEl = payloadExtractor(site,
-                                             flatten='semiFlat',
-                                             innerPositionStart=positionStart)
-                if contextEl is not None and wellFormed(contextEl, site):
-                    try:
-                        site.coreSelfActiveSite(contextEl)
-                    except SitesException:
-                        pass
-                    return contextEl
-
-                if (getElementMethod in BEFORE_METHODS
-                        and (not className
-                             or className in site.classSet)):
-                    if getElementMethod in NOT_SELF_METHODS and self is site:
-                        pass
-                    else:
-                        return site  # if the site itself is the context, return it
+        def searchContextSites() -> tuple[Music21Object|None, stream.Stream|None]:
+            '''
+            Returns the context element and the site that it was found in and
+            that is now its activeSite (or None).
+            '''
+            for site, positionStart, searchType in self.contextSites(
+                returnSortTuples=True,
+                sortByCreationTime=sortByCreationTime,
+                followDerivation=followDerivation,
+                priorityTargetOnly=priorityTargetOnly,
+            ):
+                if searchType in ('elementsOnly', 'elementsFirst'):
+                    contextEl = payloadExtractor(site,
+                                                 flatten=False,
+                                                 innerPositionStart=positionStart)
+
+                    if contextEl is not None and wellFormed(contextEl, site):
+                        try:
+                            site.coreSelfActiveSite(contextEl)
+                        except SitesException:
+                            # found by flattening: not directly in site.
+                            return (contextEl, None)
+                        return (contextEl, site)
+                    # otherwise, continue to check for flattening
+
+                if searchType != 'elementsOnly':  # flatten or elementsFirst
+                    if (getElementMethod in AFTER_METHODS
+                            and (not className
+                                 or className in site.classSet)):
+                        if getElementMethod in NOT_SELF_METHODS and self is site:
+                            pass
+                        elif getElementMethod not in NOT_SELF_METHODS:
+                            # for 'After' we can't do the
+                            # containing site because that comes before.
+                            return (site, None)  # if the site itself is the context, return it
+
+                    contextEl = payloadExtractor(site,
+                                                 flatten='semiFlat',
+                                                 innerPositionStart=positionStart)
+                    if contextEl is not None and wellFormed(contextEl, site):
+                        try:
+                            site.coreSelfActiveSite(contextEl)
+                        except SitesException:
+                            # found by flattening: not directly in site.
+                            return (contextEl, None)
+                        return (contextEl, site)
+
+                    if (getElementMethod in BEFORE_METHODS
+                            and (not className
+                                 or className in site.classSet)):
+                        if getElementMethod in NOT_SELF_METHODS and self is site:
+                            pass
+                        else:
+                            return (site, None)  # if the site itself is the context, return it
 
-                # otherwise, continue to check in next contextSite.
+                    # otherwise, continue to check in next contextSite.
 
-        # nothing found
-        return None
+            # nothing found
+            return (None, None)
+
+        if not contextCache.enabled:
+            return searchContextSites()[0]
+
+        derivationOrigin = self._derivation.origin if self._derivation is not None else None
+        cacheKey = (id(self), className, getElementMethod, sortByCreationTime,
+                    followDerivation, priorityTargetOnly,
+                    id(self.activeSite), id(derivationOrigin))
+        found, result = contextCache.lookup(cacheKey, self)
+        if found:
+            return result
+        epoch = contextCache.epoch
+        result, resultSite = searchContextSites()
+        contextCache.store(cacheKey, epoch, self, result, resultSite)
+        return result
 
 
     @overload
@@ -2453,6 +2687,11 @@ class Music21Object(prebase.ProtoM21Object):
         else:
             self._activeSiteStoredOffset = None
 
+        # the order in which contexts are searched from inside a Stream
+        # depends on the Stream's activeSite.
+        if self.isStream and site is not self.activeSite:
+            contextCache.epoch += 1
+
         if WEAKREF_ACTIVE:
             if site is None:  # leave None alone
                 self._activeSite = None
@@ -2821,10 +3060,12 @@ class Music21Object(prebase.ProtoM21Object):
 
         subclass this to do very interesting things.
         '''
-        for s in self.sites.get():
+        if self._sites is None:
+            return
+        for s in self._sites.get():
             if hasattr(s, 'coreElementsChanged'):
                 # noinspection PyCallingNonCallable
-                s.coreElementsChanged(updateIsFlat=False, keepIndex=True)
+                s.coreElementsChanged(updateIsFlat=False, keepIndex=True, keepClassIndex=True)
 
     def _getPriority(self):
         return self._priority
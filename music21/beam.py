@@ -73,9 +73,11 @@ To get rid of beams on a note do:
 from __future__ import annotations
 
 from collections.abc import Iterable
+import copy
 import typing as t
 import unittest
 
+from music21 import common
 from music21 import exceptions21
 from music21 import duration
 from music21 import environment
@@ -168,6 +170,39 @@ class Beam(prebase.ProtoM21Object, EqualSlottedObjectMixin, style.StyleMixin):
         # this should be called something else.
         self.id = id(self)
 
+    # SPECIAL METHODS #
+
+    def __deepcopy__(self, memo=None):
+        '''
+        A Beam is copied with every Note that is copied, so the slots of
+        a plain Beam are set directly:
+
+        >>> import copy
+        >>> b = beam.Beam('partial', 'left', number=2)
+        >>> b.style.color = 'red'
+        >>> b2 = copy.deepcopy(b)
+        >>> b2
+        <music21.beam.Beam 2/partial/left>
+        >>> b2.style is b.style
+        False
+        >>> b2.style.color
+        'red'
+
+        * New in v11.
+        '''
+        if type(self) is not Beam:  # pylint: disable=unidiomatic-typecheck
+            return common.defaultDeepcopy(self, memo)
+        new = Beam.__new__(Beam)
+        new.type = self.type
+        new.direction = self.direction
+        new.independentAngle = self.independentAngle
+        new.number = self.number
+        new.id = self.id
+        new._style = copy.deepcopy(self._style, memo) if self._style is not None else None
+        new._editorial = (copy.deepcopy(self._editorial, memo)
+                          if self._editorial is not None else None)
+        return new
+
     # PRIVATE METHODS #
 
     def _reprInternal(self):
@@ -237,6 +272,32 @@ class Beams(prebase.ProtoM21Object, EqualSlottedObjectMixin):
     def __eq__(self, other):
         return isinstance(other, self.__class__) and repr(self) == repr(other)
 
+    def __deepcopy__(self, memo=None):
+        '''
+        Every Note has a Beams object, so a plain Beams is copied without
+        going through the general deepcopy machinery.
+
+        >>> import copy
+        >>> bs = beam.Beams()
+        >>> bs.fill('16th', type='start')
+        >>> bs2 = copy.deepcopy(bs)
+        >>> bs2
+        <music21.beam.Beams <music21.beam.Beam 1/start>/<music21.beam.Beam 2/start>>
+        >>> bs2.beamsList is bs.beamsList
+        False
+        >>> bs2.beamsList[0] is bs.beamsList[0]
+        False
+
+        * New in v11.
+        '''
+        if type(self) is not Beams:  # pylint: disable=unidiomatic-typecheck
+            return common.defaultDeepcopy(self, memo)
+        new = Beams.__new__(Beams)
+        new.beamsList = [copy.deepcopy(b, memo) for b in self.beamsList]
+        new.feathered = self.feathered
+        new.id = self.id
+        return new
+
     def __hash__(self):
         return id(self) >> 4
 
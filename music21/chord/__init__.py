@@ -170,12 +170,27 @@ class ChordBase(note.NotRest):
         As Chord objects have one or more Volume, objects, and Volume
         objects store weak refs to the client object, need to specialize
         deepcopy handling depending on if the chord has its own volume object.
+
+        A Chord (but not a subclass) is copied straight from its `__dict__`:
+
+        >>> import copy
+        >>> c = chord.Chord('C4 E4 G4')
+        >>> c2 = copy.deepcopy(c)
+        >>> c2 == c
+        True
+        >>> c2.notes[0] is c.notes[0]
+        False
+        >>> c2.notes[0]._chordAttached is c2
+        True
+
+        * Changed in v11: a Chord is copied from its `__dict__`.
         '''
         # environLocal.printDebug(['calling NotRest.__deepcopy__', self])
-        # as this inherits from NotRest, can use that __deepcopy__ as basis
+        # as this inherits from NotRest, can use that _deepcopySubclassable as basis
         # that looks only to _volume to see if it is not None; with a
         # Chord, _volume will always be None
-        new = super().__deepcopy__(memo=memo)
+        isExactClass = type(self) is Chord  # pylint: disable=unidiomatic-typecheck
+        new = self._deepcopySubclassable(memo, copyDict=isExactClass)
         # after copying, if a Volume exists, it is linked to the old object
         # look at _volume so as not to create object if not already there
         # noinspection PyProtectedMember
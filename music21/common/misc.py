@@ -28,6 +28,7 @@ import weakref
 __all__ = [
     'cleanedFlatNotation',
     'defaultDeepcopy',
+    'dictDeepcopy',
     'flattenList',
     'getMissingImportStr',
     'getPlatform',
@@ -304,6 +305,58 @@ def defaultDeepcopy(
     return new
 
 
+def dictDeepcopy(
+    obj: t.Any,
+    memo: dict[int, t.Any]|None = None,
+    *,
+    ignoreAttributes: Iterable[str] = ()
+) -> t.Any:
+    '''
+    A faster version of :func:`defaultDeepcopy` for objects whose state
+    (apart from the ignoreAttributes) is simply their `__dict__`.
+    The new object is made with `__new__` and its `__dict__` is filled in directly,
+    skipping `__reduce_ex__` and `setattr`.  Attributes in ignoreAttributes
+    are set to None.
+
+    Only use this for classes known not to customize their state
+    (through `__getstate__`, `__reduce_ex__`, or `__slots__`) beyond the ignoreAttributes.
+
+    >>> class Holder:
+    ...     pass
+    >>> h = Holder()
+    >>> h.name = 'outer'
+    >>> h.contents = [[1, 2], [3]]
+    >>> h.owner = h
+    >>> h.scratch = {'big': 'cache'}
+    >>> h2 = common.dictDeepcopy(h, ignoreAttributes={'scratch'})
+    >>> h2.name
+    'outer'
+    >>> h2.contents == h.contents, h2.contents[0] is h.contents[0]
+    (True, False)
+    >>> h2.owner is h2
+    True
+    >>> print(h2.scratch)
+    None
+
+    * New in v11.
+    '''
+    if memo is None:
+        memo = {}
+
+    cls = obj.__class__
+    new = cls.__new__(cls)
+    memo[id(obj)] = new
+    newDict = new.__dict__
+    for attr, value in obj.__dict__.items():
+        if attr in ignoreAttributes:
+            newDict[attr] = None
+        elif type(value) in _IMMUTABLE_DEEPCOPY_TYPES:
+            newDict[attr] = value
+        else:
+            newDict[attr] = copy.deepcopy(value, memo)
+    return new
+
+
 def cleanedFlatNotation(music_str: str) -> str:
     '''
     Returns a copy of the given string where each occurrence of a flat note
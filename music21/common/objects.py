@@ -159,6 +159,9 @@ class SingletonCounter:
 
 # ------------------------------------------------------------------------------
 
+# the slots of each class never change, so they are found once per class
+_slotsByClass: dict[type, frozenset[str]] = {}
+
 
 class SlottedObjectMixin:
     r'''
@@ -223,7 +226,7 @@ class SlottedObjectMixin:
         for slot, value in state.items():
             setattr(self, slot, value)
 
-    def _getSlotsRecursive(self) -> set[str]:
+    def _getSlotsRecursive(self) -> frozenset[str]:
         '''
         Find all slots recursively.
 
@@ -233,7 +236,7 @@ class SlottedObjectMixin:
         >>> b = beam.Beam()
         >>> sSet = b._getSlotsRecursive()
 
-        sSet is a set -- independent order.  Thus, for the doctest
+        sSet is a frozenset -- independent order.  Thus, for the doctest
         we need to preserve the order:
 
         >>> sorted(list(sSet))
@@ -249,11 +252,21 @@ class SlottedObjectMixin:
         >>> sorted(list(sSet))
         ['_editorial', '_style', 'direction', 'funkiness', 'groovability',
             'id', 'independentAngle', 'number', 'type']
+
+        * Changed in v11: the slots are found only once per class and
+          returned as a frozenset.
         '''
+        cls = self.__class__
+        try:
+            return _slotsByClass[cls]
+        except KeyError:
+            pass
         slots: set[str] = set()
-        for cls in self.__class__.mro():
-            slots.update(getattr(cls, '__slots__', ()))
-        return slots
+        for mroCls in cls.mro():
+            slots.update(getattr(mroCls, '__slots__', ()))
+        frozenSlots = frozenset(slots)
+        _slotsByClass[cls] = frozenSlots
+        return frozenSlots
 
 
 class EqualSlottedObjectMixin(SlottedObjectMixin):
@@ -1442,7 +1442,13 @@ def toData(obj: base.Music21Object, fmt: str, **keywords) -> str|bytes:
         **keywords)
 
 
-def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib') -> pathlib.Path:
+def freeze(streamObj,
+           fmt=None,
+           fp=None,
+           fastButUnsafe=False,
+           zipType='zlib',
+           *,
+           timespanTrees=False) -> pathlib.Path:
     # noinspection PyShadowingNames
     '''
     Given a StreamObject and a file path, serialize and store the Stream to a file.
@@ -1484,13 +1490,30 @@ def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib') ->
         {3.0} <music21.note.Note F>
         {4.0} <music21.bar.Barline type=final>
 
+    If `timespanTrees` is True, the TimespanTrees that have been made with
+    :meth:`~music21.stream.Stream.asTimespans` are stored as well, so that analyses
+    of the thawed Stream do not need to build them again:
+
+    >>> scoreTree = c.asTimespans(classList=(note.Note,))
+    >>> fp2 = converter.freeze(c, timespanTrees=True)
+    >>> d = converter.thaw(fp2)
+    >>> [ts.element for ts in d.asTimespans(classList=(note.Note,))]
+    [<music21.note.Note C>, <music21.note.Note D>, <music21.note.Note E>, <music21.note.Note F>]
+    >>> d.asTimespans(classList=(note.Note,))[0].element in d.recurse()
+    True
+
     OMIT_FROM_DOCS
 
     >>> import os
     >>> os.remove(fp)
+    >>> os.remove(fp2)
+
+    * Changed in v11: added `timespanTrees`.
     '''
     from music21 import freezeThaw
-    v = freezeThaw.StreamFreezer(streamObj, fastButUnsafe=fastButUnsafe)
+    v = freezeThaw.StreamFreezer(streamObj,
+                                 fastButUnsafe=fastButUnsafe,
+                                 timespanTrees=timespanTrees)
     return v.write(fmt=fmt, fp=fp, zipType=zipType)  # returns fp
 
 
@@ -1508,7 +1531,7 @@ def thaw(fp, zipType='zlib'):
     return v.stream
 
 
-def freezeStr(streamObj, fmt=None):
+def freezeStr(streamObj, fmt=None, *, timespanTrees=False):
     '''
     Given a StreamObject
     serialize and return a serialization string.
@@ -1537,9 +1560,14 @@ def freezeStr(streamObj, fmt=None):
     {1.0} <music21.note.Note D>
     {2.0} <music21.note.Note E>
     {3.0} <music21.note.Note F>
+
+    `timespanTrees` stores the TimespanTrees cached on the Stream,
+    as in :func:`~music21.converter.freeze`.
+
+    * Changed in v11: added `timespanTrees`.
     '''
     from music21 import freezeThaw
-    v = freezeThaw.StreamFreezer(streamObj)
+    v = freezeThaw.StreamFreezer(streamObj, timespanTrees=timespanTrees)
     return v.writeStr(fmt=fmt)  # returns a string
 
 
@@ -1804,8 +1804,44 @@ class Duration(prebase.ProtoM21Object, SlottedObjectMixin):
 
     def __deepcopy__(self, memo):
         '''
-        Don't copy client when creating
+        Don't copy client when creating.
+
+        A plain Duration is copied slot by slot: the components and dotGroups
+        are immutable tuples and can be shared, so only the Tuplets need to be
+        copied.
+
+        >>> import copy
+        >>> d = duration.Duration(1/3)
+        >>> d.client = note.Note()
+        >>> d2 = copy.deepcopy(d)
+        >>> d2
+        <music21.duration.Duration 1/3>
+        >>> d2.client is None
+        True
+        >>> d2.expressionIsInferred
+        True
+        >>> d2.tuplets[0] is d.tuplets[0]
+        False
+
+        * Changed in v11: a plain Duration keeps all of its state, including
+          expressionIsInferred, on copying.
         '''
+        if type(self) is Duration:  # pylint: disable=unidiomatic-typecheck
+            new = Duration.__new__(Duration)
+            new._linked = self._linked
+            new._components = self._components
+            new._qtrLength = self._qtrLength
+            new._tuplets = (tuple(copy.deepcopy(tup, memo) for tup in self._tuplets)
+                            if self._tuplets else ())
+            new._componentsNeedUpdating = self._componentsNeedUpdating
+            new._quarterLengthNeedsUpdating = self._quarterLengthNeedsUpdating
+            new._typeNeedsUpdating = self._typeNeedsUpdating
+            new._unlinkedType = self._unlinkedType
+            new._dotGroups = self._dotGroups
+            new.expressionIsInferred = self.expressionIsInferred
+            new.client = None
+            return new
+
         if self._componentsNeedUpdating:
             return common.defaultDeepcopy(self, memo, ignoreAttributes={'client'})
 
@@ -1835,9 +1871,17 @@ class Duration(prebase.ProtoM21Object, SlottedObjectMixin):
         self._quarterLengthNeedsUpdating = False
         if self.linked and self.expressionIsInferred:
             qlc = quarterConversion(self._qtrLength)
-            self.components = tuple(qlc.components)
+            # set the components and tuplets directly rather than through
+            # clear(), addDurationTuple() and the tuplets setter, which would each
+            # inform the client (and all its sites) of a passing change
+            # in quarterLength, the first time to zero.
+            self._dotGroups = (0,)
+            self._components = tuple(qlc.components)
             if qlc.tuplet is not None:
-                self.tuplets = (copy.deepcopy(qlc.tuplet),)
+                self._tuplets = (copy.deepcopy(qlc.tuplet),)
+            self._componentsNeedUpdating = False
+            self._quarterLengthNeedsUpdating = True
+            self.informClient()
         self._componentsNeedUpdating = False
 
     # PUBLIC METHODS #
@@ -4184,6 +4228,18 @@ class Test(unittest.TestCase):
         self.assertTrue(o.tuplet)
         self.assertEqual(o.tuplet.tupletMultiplier(), fractions.Fraction(2, 3))
 
+    def testInferredComponentsDoNotInformSites(self):
+        from music21 import note
+        from music21 import stream
+        n = note.Note(quarterLength=1 / 3)
+        s = stream.Stream([n])
+        self.assertEqual(s.highestTime, fractions.Fraction(1, 3))
+        # getting the type makes the components and tuplets from the quarterLength,
+        # which does not change, so the stream's caches are kept.
+        self.assertEqual(n.duration.type, 'eighth')
+        self.assertEqual(len(n.duration.tuplets), 1)
+        self.assertIn('HighestTime', s._cache)
+
 
 # -------------------------------------------------------------------------------
 # define presented order in documentation
@@ -200,7 +200,13 @@ class StreamFreezer(StreamFreezeThawBase):
     >>> os.remove(fp2)
     '''
 
-    def __init__(self, streamObj=None, fastButUnsafe=False, topLevel=True, streamIds=None):
+    def __init__(self,
+                 streamObj=None,
+                 fastButUnsafe=False,
+                 topLevel=True,
+                 streamIds=None,
+                 *,
+                 timespanTrees=False):
         super().__init__()
         # must make a deepcopy, as we will be altering .sites
         self.stream = None
@@ -210,6 +216,12 @@ class StreamFreezer(StreamFreezeThawBase):
 
         self.subStreamFreezers = {}  # this will keep track of sub freezers for spanners
 
+        # must be packed before the deepcopy, since the trees point to the
+        # elements of streamObj and not to their copies.
+        self.packedTimespanTrees = {}
+        if streamObj is not None and timespanTrees:
+            self.packedTimespanTrees = self.packTimespanTrees(streamObj)
+
         if streamObj is not None and fastButUnsafe is False:
             # deepcopy necessary because we mangle sites in the objects
             # before serialization
@@ -237,8 +249,34 @@ class StreamFreezer(StreamFreezeThawBase):
             streamObj = self.stream
         self.setupSerializationScaffold(streamObj)
         storage = {'stream': streamObj, 'm21Version': base.VERSION}
+        if self.packedTimespanTrees:
+            storage['timespanTrees'] = self.packedTimespanTrees
         return storage
 
+    def packTimespanTrees(self, streamObj):
+        '''
+        Pack each TimespanTree that :meth:`~music21.stream.Stream.asTimespans`
+        has cached on `streamObj` and return a dictionary of
+        the packed trees by their cache keys.  Called when a StreamFreezer
+        is created with `timespanTrees=True`; :class:`StreamThawer` puts the
+        trees back into the cache of the thawed stream.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> tsTree = s.asTimespans()
+        >>> sf = freezeThaw.StreamFreezer()
+        >>> packedTrees = sf.packTimespanTrees(s)
+        >>> list(packedTrees)
+        ['timespanTree((), True)']
+
+        See :meth:`~music21.tree.timespanTree.TimespanTree.pack` for the format.
+
+        * New in v11.
+        '''
+        cachedTrees = [(key, value) for key, value in streamObj._cache.items()
+                       if key.startswith('timespanTree') and value is not None]
+        return {key: cachedTree.pack(streamObj) for key, cachedTree in cachedTrees}
+
     def setupSerializationScaffold(self, streamObj=None):
         '''
         Prepare this stream and all of its contents for pickle/pickling, that
@@ -878,8 +916,25 @@ class StreamThawer(StreamFreezeThawBase):
         streamObj = storage['stream']
 
         self.teardownSerializationScaffold(streamObj)
+        if 'timespanTrees' in storage:
+            self.restoreTimespanTrees(streamObj, storage['timespanTrees'])
         return streamObj
 
+    def restoreTimespanTrees(self, streamObj, packedTrees):
+        '''
+        Unpack the TimespanTrees stored by :meth:`StreamFreezer.packTimespanTrees`
+        and put them into the cache of `streamObj`, so that
+        :meth:`~music21.stream.Stream.asTimespans` returns them without
+        building them again.
+
+        * New in v11.
+        '''
+        from music21.tree.timespanTree import TimespanTree
+        # unpacking may sort the stream, which clears the cache, so unpack everything first.
+        restoredTrees = {key: TimespanTree.unpack(packed, streamObj)
+                         for key, packed in packedTrees.items()}
+        streamObj._cache.update(restoredTrees)
+
     def parseOpenFmt(self, storage):
         '''
         Look at the file and determine the format.
@@ -1225,6 +1280,45 @@ class Test(unittest.TestCase):
             d.parts[1].flatten().notes[20].volume.client,
             note.NotRest)
 
+    def testFreezeThawTimespanTrees(self):
+        from music21 import converter
+        from music21 import corpus
+        from music21 import note
+        from music21 import tree
+
+        c = corpus.parse('bwv66.6')
+        treeKeywords = [{'classList': (note.Note,)}, {'flatten': False}]
+        oldTrees = [c.asTimespans(**keywords) for keywords in treeKeywords]
+
+        for fmt in ('pickle', 'jsonpickle'):
+            data = converter.freezeStr(c, fmt, timespanTrees=True)
+            d = converter.thawStr(data)
+            allElements = {id(el) for el in d.recurse()}
+            for keywords, oldTree in zip(treeKeywords, oldTrees):
+                newTree = d.asTimespans(**keywords)
+                # restored from the frozen data, not rebuilt
+                self.assertIs(newTree, d.asTimespans(**keywords))
+                self.assertEqual(newTree.rootNode.debug(), oldTree.rootNode.debug())
+                self.assertIs(newTree.source, d)
+                for oldTs, newTs in zip(oldTree, newTree):
+                    self.assertIs(type(newTs), type(oldTs))
+                    self.assertEqual(newTs.offset, oldTs.offset)
+                    self.assertEqual(newTs.endTime, oldTs.endTime)
+                    self.assertIn(id(newTs.element), allElements)
+                    if isinstance(oldTs, tree.spans.PitchedTimespan):
+                        self.assertEqual(newTs.element.nameWithOctave,
+                                         oldTs.element.nameWithOctave)
+                        self.assertEqual(newTs.measureNumber, oldTs.measureNumber)
+                        self.assertEqual(newTs.part.id, oldTs.part.id)
+
+            v1 = oldTrees[0].getVerticalityAt(17.0)
+            v2 = d.asTimespans(classList=(note.Note,)).getVerticalityAt(17.0)
+            self.assertEqual(repr(v1.toChord().pitches), repr(v2.toChord().pitches))
+
+        # without timespanTrees the trees are built anew.
+        d = converter.thawStr(converter.freezeStr(c))
+        self.assertEqual(d._cache, {})
+
 
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
@@ -47,9 +47,10 @@ from music21.midi.percussion import MIDIPercussionException, PercussionMapper
 
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterable
     import pathlib
     from music21 import base
-    from music21.common.types import OffsetQLIn
+    from music21.common.types import OffsetQL, OffsetQLIn
 
 
 environLocal = environment.Environment('midi.translate')
@@ -1418,7 +1419,7 @@ def elementToMidiEventList(
 
 
 def streamToPackets(
-    s: stream.Stream,
+    s: stream.Stream|Iterable[tuple[OffsetQL, base.Music21Object]],
     trackId: int = 1,
     addStartDelay: bool = False,
     encoding: str = 'utf-8',
@@ -1433,14 +1434,34 @@ def streamToPackets(
     In converting from a Stream to MIDI, this is called first,
     resulting in a collection of packets by offset.
     Then, getPacketFromMidiEvent is called.
+
+    Instead of a Stream, sorted (offset, element) pairs can be given, such as those from
+    :meth:`~music21.repeat.UnrolledView.iterElements`, so that
+    packets can be made for a Stream with its repeats expanded without copying it:
+
+    >>> p = converter.parse('tinynotation: 2/4 c2 d2')
+    >>> p.makeMeasures(inPlace=True)
+    >>> p.measure(2).rightBarline = bar.Repeat(direction='end')
+    >>> packets = midi.translate.streamToPackets(p.unrolledView().iterElements())
+    >>> [(packet['offset'], packet['midiEvent'].pitch) for packet in packets
+    ...     if packet['midiEvent'].isNoteOn()]
+    [(0, 60), (20160, 62), (40320, 60), (60480, 62)]
+
+    * Changed in v11: (offset, element) pairs can be given instead of a Stream.
     '''
     # store all events by offset without delta times
     # as (absTime, event)
     packetsByOffset = []
     lastInstrument: instrument.Instrument|None = None
 
-    # s should already be flat and sorted
-    for el in s:
+    offsetElementPairs: Iterable[tuple[OffsetQL, base.Music21Object]]
+    if isinstance(s, stream.Stream):
+        # s should already be flat and sorted
+        offsetElementPairs = ((s.elementOffset(el), el) for el in s)
+    else:
+        offsetElementPairs = s
+
+    for elOffset, el in offsetElementPairs:
         midiEventList = elementToMidiEventList(el, encoding=encoding)
         if isinstance(el, instrument.Instrument):
             lastInstrument = el  # store last instrument
@@ -1463,9 +1484,9 @@ def streamToPackets(
                 firstNotePlayed = True
 
             if firstNotePlayed is False:
-                o = offsetToMidiTicks(s.elementOffset(el), addStartDelay=False)
+                o = offsetToMidiTicks(elOffset, addStartDelay=False)
             else:
-                o = offsetToMidiTicks(s.elementOffset(el), addStartDelay=addStartDelay)
+                o = offsetToMidiTicks(elOffset, addStartDelay=addStartDelay)
 
             if midiEvent.type != ChannelVoiceMessages.NOTE_OFF:
                 # use offset
@@ -1052,8 +1052,11 @@ class NotRest(GeneralNote):
     def _deepcopySubclassable(self,
                               memo: dict[int, t.Any]|None = None,
                               *,
-                              ignoreAttributes: set[str]|None = None) -> t.Self:
-        new = super()._deepcopySubclassable(memo, ignoreAttributes={'_chordAttached'})
+                              ignoreAttributes: set[str]|None = None,
+                              copyDict: bool = False) -> t.Self:
+        new = super()._deepcopySubclassable(memo,
+                                            ignoreAttributes={'_chordAttached'},
+                                            copyDict=copyDict)
         if t.TYPE_CHECKING:
             new = t.cast(t.Self, new)
         # let the chord restore _chordAttached
@@ -1611,8 +1614,30 @@ class Note(NotRest):
     def __deepcopy__(self, memo=None) -> t.Self:
         '''
         After doing a deepcopy of the pitch, be sure to set the client
+
+        A Note (but not a subclass) is copied straight from its `__dict__`,
+        giving the same result as the general deepcopy path, only faster:
+
+        >>> import copy
+        >>> n = note.Note('F#4', type='eighth')
+        >>> n.beams.fill('eighth', type='start')
+        >>> n.lyric = 'la'
+        >>> n2 = copy.deepcopy(n)
+        >>> n2 == n
+        True
+        >>> n2.pitch._client is n2
+        True
+        >>> n2.beams == n.beams, n2.beams is n.beams
+        (True, False)
+        >>> n2.lyrics[0] is n.lyrics[0]
+        False
+        >>> n2.derivation.origin is n
+        True
+
+        * Changed in v11: a Note is copied from its `__dict__`.
         '''
-        new = self._deepcopySubclassable(memo)
+        isExactClass = type(self) is Note  # pylint: disable=unidiomatic-typecheck
+        new = self._deepcopySubclassable(memo, copyDict=isExactClass)
         # noinspection PyProtectedMember
         new.pitch._client = new
         return new
@@ -2037,6 +2062,23 @@ class Rest(GeneralNote):
         # TODO: fullMeasure=='always' does not work properly
         self.fullMeasure = fullMeasure  # see docs; True, False, 'always',
 
+    def __deepcopy__(self, memo=None) -> t.Self:
+        '''
+        A Rest (but not a subclass) is copied straight from its `__dict__`:
+
+        >>> import copy
+        >>> r = note.Rest('half', stepShift=2)
+        >>> r2 = copy.deepcopy(r)
+        >>> r2 == r, r2 is r
+        (True, False)
+        >>> r2.stepShift
+        2
+
+        * New in v11.
+        '''
+        isExactClass = type(self) is Rest  # pylint: disable=unidiomatic-typecheck
+        return self._deepcopySubclassable(memo, copyDict=isExactClass)
+
     def _reprInternal(self):
         duration_name = self.duration.fullName.lower()
         if len(duration_name) < 15:  # dotted quarter = 14
@@ -82,6 +82,10 @@ TWELFTH_ROOT_OF_TWO = 2.0 ** (1 / 12)
 # where 1 is a half step. this means that 4 significant digits of cents will be kept
 PITCH_SPACE_SIG_DIGITS = 6
 
+# attributes of a Pitch that can only hold a scalar, so they are shared on deepcopy
+_PITCH_SCALAR_ATTRIBUTES = frozenset(['_step', '_overridden_freq440',
+                                      '_octave', 'spellingIsInferred'])
+
 # basic accidental string and symbol definitions;
 # additional symbolic and text-based alternatives
 # are given in the set Accidental.set() method
@@ -2060,17 +2064,15 @@ class Pitch(prebase.ProtoM21Object):
         '''
         if type(self) is Pitch:  # pylint: disable=unidiomatic-typecheck
             new = Pitch.__new__(Pitch)
-            for k in self.__dict__:
-                v = getattr(self, k, None)
-                if k in ('_step', '_overridden_freq440',
-                         '_octave', 'spellingIsInferred'):
-                    setattr(new, k, v)
+            newDict = new.__dict__
+            for k, v in self.__dict__.items():
+                if v is None or k in _PITCH_SCALAR_ATTRIBUTES:
+                    # common -- save time over deepcopy.
+                    newDict[k] = v
                 elif k == '_client':
-                    setattr(new, k, None)
-                elif v is None:  # common -- save time over deepcopy.
-                    setattr(new, k, None)
+                    newDict[k] = None
                 else:
-                    setattr(new, k, copy.deepcopy(v, memo))
+                    newDict[k] = copy.deepcopy(v, memo)
             return new
         else:  # pragma: no cover
             return common.defaultDeepcopy(self, memo)
@@ -17,10 +17,12 @@ the :class:`~music21.bar.Repeat` which represents a normal barline repeat.
 '''
 from __future__ import annotations
 
+from collections.abc import Iterator
 import copy
 import string
 import typing as t
 
+from music21.common.numberTools import opFrac
 from music21 import environment
 from music21 import exceptions21
 from music21 import expressions
@@ -30,7 +32,10 @@ from music21 import style
 
 
 if t.TYPE_CHECKING:
+    from music21 import base
+    from music21.common.types import OffsetQL
     from music21 import stream
+    from music21 import tempo
 
 
 environLocal = environment.Environment('repeat')
@@ -862,6 +867,78 @@ class Expander[StreamType: 'music21.stream.Stream']:
                 indexList.append(measureNumberNoSuffixDict[measureNumberNoSuffixList[i]])
         return indexList
 
+    def performanceOrder(self) -> list[int]:
+        '''
+        Returns a list where for each measure in the expanded stream, the index of
+        the measure in the original stream is given, like
+        :meth:`measureMap`, but without copying the contents of any measure
+        and without relying on measure numbers being unique.
+
+        The repeats are expanded on empty stand-in measures that
+        carry only the barlines, repeat expressions, and repeat brackets
+        of the originals.
+
+        >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.    G4 a b   c2.')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end', times=3)
+        >>> s.measure(4).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(4).rightBarline = bar.Repeat(direction='end', times=2)
+        >>> e = repeat.Expander(s)
+        >>> e.performanceOrder()
+        [0, 1, 1, 1, 2, 3, 3, 4]
+
+        A Stream without repeats is played in order:
+
+        >>> e = repeat.Expander(s.measures(1, 1))
+        >>> e.performanceOrder()
+        [0]
+
+        * New in v11.
+        '''
+        from music21 import stream
+
+        canExpand = self.isExpandable()
+        if canExpand is False:
+            raise ExpanderException(
+                'cannot expand Stream: badly formed repeats or repeat expressions')
+        if canExpand is None:
+            return list(range(self._srcMeasureCount))
+
+        standIns = stream.Part()
+        standInByMeasureId: dict[int, stream.Measure] = {}
+        indexByStandInId: dict[int, int] = {}
+        for i, m in enumerate(self._srcMeasureStream):
+            standIn = stream.Measure(number=m.number)
+            standIn.numberSuffix = m.numberSuffix
+            if m.leftBarline is not None:
+                standIn.leftBarline = copy.deepcopy(m.leftBarline)
+            if m.rightBarline is not None:
+                standIn.rightBarline = copy.deepcopy(m.rightBarline)
+            for e in m.getElementsByClass(RepeatExpression):
+                standIn.insert(m.elementOffset(e), copy.deepcopy(e))
+            for v in m.voices:
+                repeatExpressions = v.getElementsByClass(RepeatExpression)
+                if repeatExpressions:
+                    vNew = stream.Voice()
+                    for e in repeatExpressions:
+                        vNew.insert(v.elementOffset(e), copy.deepcopy(e))
+                    standIn.insert(m.elementOffset(v), vNew)
+            standIns.insert(self._srcMeasureStream.elementOffset(m), standIn)
+            standInByMeasureId[id(m)] = standIn
+            indexByStandInId[id(standIn)] = i
+
+        for rb in self._repeatBrackets:
+            rbNew = copy.deepcopy(rb)
+            for m in rb.getSpannedElements():
+                if id(m) in standInByMeasureId:
+                    rbNew.replaceSpannedElement(m, standInByMeasureId[id(m)])
+            standIns.insert(0, rbNew)
+
+        post = Expander(standIns).process()
+        return [indexByStandInId[id(m.derivation.rootDerivation)]
+                for m in post.getElementsByClass(stream.Measure)]
+
     def _stripRepeatBarlines(self, m, newType='double'):
         '''
         Given a measure, strip barlines if they are repeats, and
@@ -1894,7 +1971,180 @@ class Expander[StreamType: 'music21.stream.Stream']:
         self._stripRepeatExpressions(new)
         return new
 
-    _DOC_ORDER = ['process', 'measureMap']
+    _DOC_ORDER = ['process', 'measureMap', 'performanceOrder']
+
+
+class UnrolledView(prebase.ProtoM21Object):
+    '''
+    A read-only view of a Stream of Measures with all of its repeats expanded,
+    in performance order, without copying anything.  The measures in the
+    view are the measures of the original Stream, each appearing once for
+    every time it is played, together with the offset at which
+    it sounds in the expanded Stream.
+
+    Normally obtained from :meth:`~music21.stream.Stream.unrolledView`.
+
+    >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.    G4 a b   c2.')
+    >>> s.makeMeasures(inPlace=True)
+    >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+    >>> s.measure(2).rightBarline = bar.Repeat(direction='end', times=3)
+    >>> view = repeat.UnrolledView(s)
+    >>> view
+    <music21.repeat.UnrolledView 7 measures from 5>
+    >>> view.measureIndices
+    [0, 1, 1, 1, 2, 3, 4]
+    >>> for offset, m in view.items():
+    ...     print(offset, m)
+    0.0 <music21.stream.Measure 1 offset=0.0>
+    3.0 <music21.stream.Measure 2 offset=3.0>
+    6.0 <music21.stream.Measure 2 offset=3.0>
+    9.0 <music21.stream.Measure 2 offset=3.0>
+    12.0 <music21.stream.Measure 3 offset=6.0>
+    15.0 <music21.stream.Measure 4 offset=9.0>
+    18.0 <music21.stream.Measure 5 offset=12.0>
+    >>> view.highestTime
+    21.0
+    >>> view[1] is view[2] is s.measure(2)
+    True
+
+    The elements of the measures (including those in voices) are available
+    with the offsets at which they sound:
+
+    >>> for offset, n in view.iterElements(note.Note):
+    ...     if offset < 10:
+    ...         print(offset, n)
+    0.0 <music21.note.Note A>
+    3.0 <music21.note.Note C>
+    4.0 <music21.note.Note D>
+    5.0 <music21.note.Note E>
+    6.0 <music21.note.Note C>
+    7.0 <music21.note.Note D>
+    8.0 <music21.note.Note E>
+    9.0 <music21.note.Note C>
+
+    Times in seconds use the tempo indications in the order they are played:
+
+    >>> s.measure(2).insert(0, tempo.MetronomeMark(number=60))
+    >>> s.measure(3).insert(0, tempo.MetronomeMark(number=120))
+    >>> view = repeat.UnrolledView(s)
+    >>> view.tempoMap().offsetToSeconds(15.0)
+    12.0
+    >>> s.expandRepeats().tempoMap().offsetToSeconds(15.0)
+    12.0
+
+    (As above, the view is not updated if the Stream changes
+    afterwards; make a new one instead.)  To get
+    a real Stream, with the measure numbers and barlines of each pass,
+    call :meth:`stream`, which is the same as
+    :meth:`~music21.stream.Stream.expandRepeats`.
+
+    * New in v11.
+    '''
+    def __init__(self, streamObj: stream.Stream):
+        self.src = streamObj
+        expander = Expander(streamObj)
+        self._srcMeasures: list[stream.Measure] = list(expander._srcMeasureStream)
+        self.measureIndices: list[int] = expander.performanceOrder()
+
+        self.offsets: list[OffsetQL] = []
+        if expander.isExpandable() is None:
+            # not expanded: the measures stay where they are
+            measureOffsets = [streamObj.elementOffset(m) for m in self._srcMeasures]
+            self.offsets = [measureOffsets[i] for i in self.measureIndices]
+        else:
+            # expanded measures are appended one after the other
+            o: OffsetQL = 0.0
+            for i in self.measureIndices:
+                self.offsets.append(o)
+                o = opFrac(o + self._srcMeasures[i].duration.quarterLength)
+        self._flatElements: dict[int, list[tuple[OffsetQL, base.Music21Object]]] = {}
+
+    def _reprInternal(self) -> str:
+        return f'{len(self)} measures from {len(self._srcMeasures)}'
+
+    def __len__(self) -> int:
+        return len(self.measureIndices)
+
+    def __getitem__(self, i: int) -> stream.Measure:
+        return self._srcMeasures[self.measureIndices[i]]
+
+    def __iter__(self) -> Iterator[stream.Measure]:
+        for i in self.measureIndices:
+            yield self._srcMeasures[i]
+
+    def items(self) -> Iterator[tuple[OffsetQL, stream.Measure]]:
+        '''
+        Yield (offset, measure) pairs in performance order.
+        '''
+        for o, i in zip(self.offsets, self.measureIndices):
+            yield o, self._srcMeasures[i]
+
+    @property
+    def highestTime(self) -> OffsetQL:
+        '''
+        The offset of the end of the last measure played.
+        '''
+        if not self.measureIndices:
+            return 0.0
+        return opFrac(self.offsets[-1]
+                      + self._srcMeasures[self.measureIndices[-1]].duration.quarterLength)
+
+    def iterElements(
+        self,
+        classFilter: t.Iterable[str|type]|str|type = (),
+    ) -> Iterator[tuple[OffsetQL, base.Music21Object]]:
+        '''
+        Yield (offset, element) pairs for each element of each measure
+        in performance order, sorted as in a flattened Stream, where offset is
+        when the element sounds.  Only elements matching `classFilter`,
+        if given, are yielded.
+
+        These pairs can be given to
+        :func:`~music21.midi.translate.streamToPackets`
+        in place of a flat Stream.
+        '''
+        if isinstance(classFilter, (str, type)):
+            classFilter = (classFilter,)
+        classFilterSet = frozenset(classFilter)
+        for o, i in zip(self.offsets, self.measureIndices):
+            if i not in self._flatElements:
+                flat = self._srcMeasures[i].flatten()
+                self._flatElements[i] = [(flat.elementOffset(el), el) for el in flat]
+            for elOffset, el in self._flatElements[i]:
+                if classFilterSet and classFilterSet.isdisjoint(el.classSet):
+                    continue
+                yield opFrac(o + elOffset), el
+
+    def tempoMap(self) -> tempo.TempoMap:
+        '''
+        Return a :class:`~music21.tempo.TempoMap` for the expanded offsets,
+        with the same boundaries that
+        :meth:`~music21.stream.Stream.metronomeMarkBoundaries` would
+        give on the expanded Stream.
+        '''
+        from music21 import tempo
+
+        lowestOffset: OffsetQL = self.offsets[0] if self.offsets else 0.0
+        highestTime = self.highestTime
+        offsetPairs: list[tuple[OffsetQL, tempo.MetronomeMark]] = [
+            (o, ti.getSoundingMetronomeMark())
+            for o, ti in self.iterElements(tempo.TempoIndication)
+            if isinstance(ti, tempo.TempoIndication)
+        ]
+        if not offsetPairs or offsetPairs[0][0] > lowestOffset:
+            offsetPairs.insert(0, (lowestOffset, tempo.MetronomeMark(number=120)))
+        mmBoundaries = []
+        for j, (o, mm) in enumerate(offsetPairs):
+            end = offsetPairs[j + 1][0] if j + 1 < len(offsetPairs) else highestTime
+            mmBoundaries.append((o, end, mm))
+        return tempo.TempoMap(mmBoundaries)
+
+    def stream(self) -> stream.Stream:
+        '''
+        Return a new Stream with the repeats expanded, by calling
+        :meth:`~music21.stream.Stream.expandRepeats` on the source Stream.
+        '''
+        return self.src.expandRepeats()
 
 # ---------------------------------------------------------
 
@@ -13,7 +13,6 @@ sites.py -- Objects for keeping track of relationships among Music21Objects
 '''
 from __future__ import annotations
 
-import collections
 from collections.abc import Generator, MutableMapping
 import typing as t
 from typing import overload  # for some reason does not work in PyCharm if not directly imported
@@ -175,6 +174,10 @@ _NoneSiteRef.siteIndex = -2
 
 _singletonCounter = common.SingletonCounter()
 
+# a Sites object with at least this many entries looks for dead sites to remove
+# when a new site is added.
+_MIN_SWEEP_SIZE = 8
+
 
 class Sites(common.SlottedObjectMixin):
     '''
@@ -184,30 +187,53 @@ class Sites(common.SlottedObjectMixin):
     Most of these objects are locations (also called sites), or Streams that
     contain this object.
 
-    All defined contexts are stored as dictionaries in a dictionary. The
-    outermost dictionary stores objects.
+    All defined contexts are stored as SiteRefs in a dictionary (`.siteDict`), keyed
+    by the id() of the site, in the order they were added.
+
+    Elements that pass through many short-lived Streams (flattened Streams,
+    `.stream()` calls on iterators, derived Streams) would keep a SiteRef for
+    each of these Streams after it is gone, so when a new site is added to a
+    Sites object that has grown to twice its size after the last check, the
+    dead sites are removed.  This keeps the cost of removing them constant per
+    addition, and the number of dead sites at most that of the live ones.
+
+    >>> n = note.Note()
+    >>> streams = [stream.Stream([n]) for i in range(31)]
+    >>> len(n.sites)
+    32
+    >>> del streams
+    >>> import gc
+    >>> numObjectsCollected = gc.collect()  # make sure to garbage collect
+    >>> len(n.sites)
+    32
+    >>> s = stream.Stream([n])
+    >>> len(n.sites)
+    2
+
+    * Changed in v11: dead sites are removed automatically; `.siteDict` is a
+      plain dict.
     '''
 
     # CLASS VARIABLES #
 
     __slots__ = (
         'siteDict',
-        '_lastID',
         '_siteIndex',
+        '_sweepSize',
     )
 
     # INITIALIZER #
 
     def __init__(self):
         # .siteDict is a dictionary of siteRefs.  None is a singleton.
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
+        self.siteDict: dict[int|None, SiteRef] = {None: _NoneSiteRef}
 
         # store an index of numbers for tagging the order of creation of defined contexts;
         # this is used to be able to discern the order of context as added
         self._siteIndex = 0
 
-        # cache for performance
-        self._lastID = -1  # cannot be None
+        # the size of .siteDict at which to next look for dead sites
+        self._sweepSize = _MIN_SWEEP_SIZE
 
     # SPECIAL METHODS #
     def __deepcopy__(self, memo=None):
@@ -240,6 +266,36 @@ class Sites(common.SlottedObjectMixin):
         # TODO: it may be a problem that sites are being transferred to deep
         #     copies; this functionality is used at times in context searches, but
         #     may be a performance hog.
+        return self._copySiteRefs(storageSitesOnly=False)
+
+    def __setstate__(self, state):
+        # Sites pickled before v11 kept an unused _lastID and no _sweepSize
+        state.pop('_lastID', None)
+        state.setdefault('_sweepSize', _MIN_SWEEP_SIZE)
+        state['siteDict'] = dict(state['siteDict'])
+        super().__setstate__(state)
+
+    def copyStorageSites(self) -> Sites:
+        '''
+        Return a new, independent Sites object with only those sites that are
+        SpannerStorage or VariantStorage Streams (or that are not Streams at all).
+
+        These are the sites that a deepcopy of a Music21Object keeps: the copy
+        is not in any of the other Streams of the original, so
+        :meth:`~music21.base.Music21Object.purgeOrphans` would remove them.
+
+        >>> n = note.Note()
+        >>> s = stream.Stream()
+        >>> s.insert(0, n)
+        >>> sl = spanner.Slur(n)
+        >>> [site for site in n.sites.copyStorageSites().get() if site is not None]
+        [<music21.stream.SpannerStorage for music21.spanner.Slur>]
+
+        * New in v11.
+        '''
+        return self._copySiteRefs(storageSitesOnly=True)
+
+    def _copySiteRefs(self, *, storageSitesOnly: bool) -> Sites:
         new = self.__class__()
         # environLocal.printDebug(['Sites.__deepcopy__',
         #    'self.siteDict.keys()', self.siteDict.keys()])
@@ -249,12 +305,19 @@ class Sites(common.SlottedObjectMixin):
             oldSite = self.siteDict[idKey]
             if oldSite.isDead:
                 continue  # do not copy dead references
+            site = oldSite.site
+            if (storageSitesOnly
+                    and site is not None
+                    and site.isStream
+                    and 'SpannerStorage' not in site.classes
+                    and 'VariantStorage' not in site.classes):
+                continue
             newSite = SiteRef()
-            newSite.site = oldSite.site
-            if oldSite.site is None:
+            newSite.site = site
+            if site is None:
                 newIdKey = None
             else:
-                newIdKey = id(newSite.site)
+                newIdKey = id(site)
             newSite.siteIndex = oldSite.siteIndex
             newSite.globalSiteIndex = _singletonCounter()
             newSite.classString = oldSite.classString
@@ -384,14 +447,28 @@ class Sites(common.SlottedObjectMixin):
         siteRef.globalSiteIndex = _singletonCounter()  # increments
         ##
         if not updateNotAdd:  # add new/missing information to dictionary
+            if len(self.siteDict) >= self._sweepSize:
+                self._removeDeadSites()
             self.siteDict[idKey] = siteRef
 
+    def _removeDeadSites(self) -> None:
+        '''
+        Remove all sites that no longer exist and set the size at which
+        to look again to twice the number of live sites.
+        '''
+        siteDict = self.siteDict
+        dead = [idKey for idKey, siteRef in siteDict.items()
+                if idKey is not None and siteRef.site is None]
+        for idKey in dead:
+            del siteDict[idKey]
+        self._sweepSize = max(_MIN_SWEEP_SIZE, 2 * len(siteDict))
+
     def clear(self):
         '''
         Clear all stored data.
         '''
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
-        self._lastID = -1  # cannot be None
+        self.siteDict = {None: _NoneSiteRef}
+        self._sweepSize = _MIN_SWEEP_SIZE
 
     @overload
     def yieldSites(self,
@@ -953,9 +1030,6 @@ class Sites(common.SlottedObjectMixin):
         3
 
         '''
-        # must clear
-        self._lastID = -1  # cannot be None
-
         siteId = None
         if site is not None:
             siteId = id(site)
@@ -974,9 +1048,6 @@ class Sites(common.SlottedObjectMixin):
         Remove a site entry by id key,
         which is id() of the object.
         '''
-        # must clear if removing
-        if idKey == self._lastID:
-            self._lastID = -1  # cannot be None
         if idKey is None:
             raise SitesException('trying to remove None idKey is not allowed')
 
@@ -1049,6 +1120,29 @@ class Test(unittest.TestCase):
         lastNoteClef = lastNote.getContextByClass(clef.Clef)
         self.assertIsInstance(lastNoteClef, clef.TrebleClef)
 
+    def testRemoveDeadSites(self):
+        import gc
+        from music21 import stream
+
+        siteObj = Sites()
+        shortLived = [stream.Stream() for unused in range(100)]
+        # explicit idKeys, so that the new Streams below cannot reuse
+        # the entries of the dead ones.
+        for i in range(len(shortLived)):
+            siteObj.add(shortLived[i], idKey=i)
+        self.assertEqual(len(siteObj), 101)
+        del shortLived
+        gc.collect()
+
+        # the dead sites are removed once the Sites object has doubled in size
+        # since it last looked for them, which was at 64 sites.
+        kept = [stream.Stream() for unused in range(30)]
+        for s in kept:
+            siteObj.add(s)
+        self.assertEqual(len(siteObj), 31)
+        self.assertEqual(siteObj.getSiteCount(), 30)
+        self.assertEqual(siteObj.get(excludeNone=True), kept)
+
 
 # ----------------------------------------------------------------------------
 _DOC_ORDER = [SiteRef, Sites]
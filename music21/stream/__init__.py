@@ -36,6 +36,8 @@ from music21.stream import enums
 from music21.stream import filters
 from music21.stream import iterator
 from music21.stream import makeNotation
+from music21.stream import noteTable
+from music21.stream.noteTable import fromNoteTable
 from music21.stream import streamStatus
 from music21.stream import tools
 
@@ -57,8 +59,10 @@ __all__ = [
     'core',
     'enums',
     'filters',
+    'fromNoteTable',
     'iterator',
     'makeNotation',
+    'noteTable',
     'streamStatus',
     'tools',
 ]
@@ -21,14 +21,19 @@ and :class:`~music21.stream.Score` objects, are also in this module.
 from __future__ import annotations
 
 from collections import deque, namedtuple, OrderedDict
-from collections.abc import Collection, Iterable, Sequence
+from collections.abc import Collection, Generator, Iterable, Sequence
+import bisect
+import contextlib
 import copy
+import enum
 from fractions import Fraction
+import hashlib
 import itertools
 import math
 from math import isclose
 import os
 import pathlib
+import threading
 import types
 import typing as t
 from typing import overload  # pycharm bug disallows alias
@@ -38,7 +43,7 @@ import warnings
 from music21 import base
 from music21 import bar
 from music21 import common
-from music21.common.enums import GatherSpanners, OffsetSpecial
+from music21.common.enums import ElementSearch, GatherSpanners, OffsetSpecial
 from music21.common.numberTools import opFrac
 from music21.common.types import (
     StreamType, ChangedM21ObjType, OffsetQL, OffsetQLIn, OffsetQLSpecial
@@ -62,9 +67,11 @@ from music21 import repeat
 from music21 import sites
 from music21 import style
 from music21 import tempo
+from music21 import tree
 
 from music21.stream import core
 from music21.stream import makeNotation
+from music21.stream import noteTable
 from music21.stream import streamStatus
 from music21.stream import iterator
 from music21.stream import filters
@@ -80,6 +87,9 @@ environLocal = environment.Environment('stream')
 StreamException = exceptions21.StreamException
 ImmutableStreamException = exceptions21.ImmutableStreamException
 
+# held while a frozen Stream fills a cache that freeze() did not fill.
+_frozenStreamLock = threading.RLock()
+
 T = t.TypeVar('T')
 type RecursiveLyricList = note.Lyric|None|list[RecursiveLyricList]
 
@@ -88,6 +98,157 @@ BestQuantizationMatch = namedtuple(
     ['remainingGap', 'error', 'tick', 'match', 'signedError', 'divisor']
 )
 
+
+def _bestQuantizationMatches(
+    targets: Sequence[float],
+    quarterLengthDivisors: Iterable[int],
+    *,
+    zeroAllowed: Sequence[bool]|None = None,
+    gapsToFill: Sequence[float]|None = None,
+) -> tuple[list[float], list[float]]:
+    '''
+    The quantization engine of :meth:`~music21.stream.Stream.quantize`:
+    for each of the (non-negative) `targets`, find the nearest multiple
+    of one over each of the `quarterLengthDivisors`, and choose among them
+    as a :class:`BestQuantizationMatch` would be chosen: by smallest
+    remaining gap (if `gapsToFill` are given), then smallest error
+    (rounded to seven places), then smallest tick.  If `zeroAllowed` is
+    given, targets where it is False are never matched to zero.
+
+    All targets are handled at once with NumPy, in one array operation
+    per divisor.  Returns a list of the matches and a list of the
+    signed errors (target minus match).
+
+    >>> from music21.stream.base import _bestQuantizationMatches
+    >>> matches, errors = _bestQuantizationMatches([0.1, 0.49, 0.9, 1.49, 1.76], [4, 3])
+    >>> matches
+    [0.0, 0.5, 1.0, 1.5, 1.75]
+    >>> errors
+    [0.1, -0.01, -0.1, -0.01, 0.01]
+
+    >>> _bestQuantizationMatches([0.1, 0.1], [4], zeroAllowed=[True, False])[0]
+    [0.0, 0.25]
+    '''
+    import numpy as np
+
+    def roundErrors(errors):
+        # np.round() rounds the scaled float, which can differ from Python's
+        # round() just at a half; redo those few with round().
+        rounded = np.round(errors, 7)
+        scaled = errors * 1e7
+        nearHalf = np.abs(np.abs(scaled - np.rint(scaled)) - 0.5) < 1e-6
+        for i in np.flatnonzero(nearHalf):
+            rounded[i] = round(float(errors[i]), 7)
+        return rounded
+
+    targetArray = np.asarray(targets, dtype=np.float64)
+    zeroAllowedArray = None
+    if zeroAllowed is not None:
+        zeroAllowedArray = np.asarray(zeroAllowed, dtype=bool)
+    gapArray = None
+    if gapsToFill is not None:
+        gapArray = np.asarray(gapsToFill, dtype=np.float64)
+
+    # start with matches that every divisor beats: infinite gap, error, and tick
+    bestMatch = np.zeros_like(targetArray)
+    bestSignedError = np.zeros_like(targetArray)
+    bestError = np.full_like(targetArray, np.inf)
+    bestGap = np.full_like(targetArray, np.inf)
+    bestTick = np.full_like(targetArray, np.inf)
+    divisorFound = False
+    for div in quarterLengthDivisors:
+        divisorFound = True
+        tick = 1 / div  # divisor expressed as QL, e.g. 0.25
+        # as in common.nearestMultiple()
+        mult = np.floor(targetArray / tick)
+        matchLow = tick * mult
+        matchHigh = tick * (mult + 1)
+        useLow = (matchLow <= targetArray) & (targetArray <= matchLow + tick / 2.0)
+        match = np.where(useLow, matchLow, matchHigh)
+        signedError = roundErrors(targetArray - match)
+        if zeroAllowedArray is not None:
+            moveOffZero = ~zeroAllowedArray & (match == 0.0)
+            if moveOffZero.any():
+                match = np.where(moveOffZero, tick, match)
+                signedError = np.where(moveOffZero,
+                                       roundErrors(targetArray - tick),
+                                       signedError)
+        error = np.abs(signedError)
+        if gapArray is None:
+            remainingGap = np.zeros_like(targetArray)
+        else:
+            remainingGap = np.where(np.mod(gapArray, tick) == 0,
+                                    0.0,
+                                    np.maximum(gapArray - match, 0.0))
+
+        # sort by remainingGap, then unsigned error, then tick
+        better = ((remainingGap < bestGap)
+                  | ((remainingGap == bestGap)
+                     & ((error < bestError)
+                        | ((error == bestError) & (tick < bestTick)))))
+        bestMatch = np.where(better, match, bestMatch)
+        bestSignedError = np.where(better, signedError, bestSignedError)
+        bestError = np.where(better, error, bestError)
+        bestGap = np.where(better, remainingGap, bestGap)
+        bestTick = np.where(better, tick, bestTick)
+
+    if not divisorFound:
+        raise StreamException('quarterLengthDivisors cannot be empty')
+    return bestMatch.tolist(), bestSignedError.tolist()
+
+
+# attributes besides the equalityAttributes that describe the content of an element
+# for Stream.contentHash(); those that an element does not have are skipped.
+_CONTENT_HASH_ATTRIBUTES: tuple[str, ...] = (
+    'notes', 'articulations', 'expressions', 'lyrics',
+    'content', 'text', 'figure', 'tonic', 'mode', 'number', 'value', 'referent',
+)
+_contentHashAttributesByClass: dict[type, tuple[str, ...]] = {}
+
+
+def _contentSignature(value: t.Any) -> str:
+    '''
+    Return a string describing the content of `value` for
+    :meth:`Stream.contentHash`: the same in every session for equal content,
+    and never containing memory addresses.
+
+    >>> stream.base._contentSignature(clef.TrebleClef())
+    "music21.clef.TrebleClef(duration=zero.0.0.0[],line=2,octaveChange=0,sign='G')"
+    '''
+    if value is None or isinstance(value, (bool, int, float, str, Fraction)):
+        return repr(value)
+    if isinstance(value, enum.Enum):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_contentSignature(v) for v in value) + ']'
+    if isinstance(value, Stream):
+        return value.contentHash()
+    if isinstance(value, duration.Duration):
+        tuplets = [(tup.numberNotesActual, tup.numberNotesNormal) for tup in value.tuplets]
+        return f'{value.type}.{value.dots}.{value.quarterLength!r}{tuplets}'
+    if isinstance(value, base.Music21Object):
+        cls = type(value)
+        attributes = _contentHashAttributesByClass.get(cls, None)
+        if attributes is None:
+            attributes = tuple(sorted(
+                base._getEqualityAttributes(t.cast(type, cls)).union(_CONTENT_HASH_ATTRIBUTES)
+            ))
+            _contentHashAttributesByClass[cls] = attributes
+        attributeSignatures = []
+        for attr in attributes:
+            try:
+                attrValue = getattr(value, attr)
+            except AttributeError:
+                continue
+            attributeSignatures.append(f'{attr}={_contentSignature(attrValue)}')
+        return f'{cls.__module__}.{cls.__qualname__}(' + ','.join(attributeSignatures) + ')'
+    # Pitch, Tie, Beams, Lyric, etc. show their content in their repr
+    valueRepr = repr(value)
+    if ' at 0x' in valueRepr:
+        return type(value).__qualname__
+    return valueRepr
+
+
 class StreamDeprecationWarning(UserWarning):
     # Do not subclass Deprecation warning, because these
     # warnings need to be passed to users
@@ -97,6 +258,7 @@ class StreamDeprecationWarning(UserWarning):
 # -----------------------------------------------------------------------------
 # Metaclass
 OffsetMap = namedtuple('OffsetMap', ['element', 'offset', 'endTime', 'voiceIndex'])
+BeatMap = namedtuple('BeatMap', ['element', 'beat', 'beatStrength', 'beatDuration'])
 
 
 class SecondsMapEntry(t.TypedDict):
@@ -274,6 +436,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
     isMeasure = False
     classSortOrder: int|float = -20
     recursionType: RecursionType = RecursionType.ELEMENTS_FIRST
+    treeStorage: bool = False
 
     _styleClass = style.StreamStyle
 
@@ -303,6 +466,35 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             Boolean describing whether the Stream is automatically sorted by
             offset whenever necessary.
             ''',
+        'treeStorage': '''
+            Boolean describing whether the Stream keeps its elements in an
+            :class:`~music21.tree.trees.OffsetTree` (see
+            :meth:`~music21.stream.core.StreamCore.coreElementTree`) as well as in
+            order, so that inserting or removing an element anywhere in a long
+            Stream takes O(log n) time instead of sorting
+            the Stream again or searching every element.  It is False by default,
+            since it makes building up a Stream from start to finish slightly
+            slower; set it to True on a Stream that is going to be edited heavily.
+
+            Only `.insert()`, `.remove()`, `.pop()`, and `.setElementOffset()`
+            keep the tree up to date; after any other change (such as `.append()`)
+            the tree is built again the next time it is needed.
+            The Stream must use autoSort.
+
+            >>> s = stream.Stream()
+            >>> s.repeatAppend(note.Note(), 8)
+            >>> s.treeStorage = True
+            >>> s.insert(2.5, note.Rest())
+            >>> s.isSorted
+            True
+            >>> s.coreElementTree().elementsStartingAt(2.5)
+            (<music21.note.Rest quarter>,)
+            >>> s.remove(s[1])
+            >>> s.highestTime
+            8.0
+
+            * New in v11.
+            ''',
         'isFlat': '''
             Boolean describing whether this Stream contains embedded
             sub-Streams or Stream subclasses (not flat).
@@ -396,6 +588,93 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
     def __hash__(self) -> int:
         return id(self) >> 4
 
+    def contentHash(self) -> str:
+        '''
+        Return a hexadecimal SHA-256 digest of the musical content of this Stream:
+        the class of the Stream and, for each element in order, its offset and
+        its content.  The content of an element is its class and the attributes
+        that are compared by `==` (see :class:`~music21.base.Music21Object`),
+        together with the pitches of chords, articulations, expressions, lyrics,
+        and text.  Contained Streams are described by their own contentHash,
+        so the hash is built from the bottom up.
+
+        Unlike `==`, which is True only for the same Stream, two Streams with
+        the same content have the same contentHash, even across sessions:
+
+        >>> s1 = converter.parse('tinyNotation: 3/4 c4 d8 e f4 g2.')
+        >>> s2 = converter.parse('tinyNotation: 3/4 c4 d8 e f4 g2.')
+        >>> s1 == s2
+        False
+        >>> s1.contentHash() == s2.contentHash()
+        True
+        >>> len(s1.contentHash())
+        64
+
+        Ids, sites, and measure numbers are not content, so measures with the same
+        music have the same hash wherever they are.  A new Measure 5, not in any
+        Stream, with the music of the first measure of `s1`:
+
+        >>> m = stream.Measure(number=5)
+        >>> m.append([note.Note('C4'), note.Note('D4', type='eighth'),
+        ...           note.Note('E4', type='eighth'), note.Note('F4')])
+        >>> m.insert(0, meter.TimeSignature('3/4'))
+        >>> m.insert(0, clef.TrebleClef())
+        >>> m.contentHash() == s1.measure(1).contentHash()
+        True
+
+        The hash is cached until the elements of the Stream, or of a Stream in it,
+        change:
+
+        >>> oldHash = s1.contentHash()
+        >>> s1.measure(2).append(note.Rest())
+        >>> s1.contentHash() == oldHash
+        False
+
+        Changes to an element that are not reported to the Stream, such as a new
+        pitch, need a call to :meth:`~music21.stream.core.StreamCore.coreElementsChanged`:
+
+        >>> oldHash = s2.contentHash()
+        >>> n = s2.recurse().notes.first()
+        >>> n.pitch.name = 'C#'
+        >>> s2.contentHash() == oldHash
+        True
+        >>> n.activeSite.coreElementsChanged()
+        >>> s2.contentHash() == oldHash
+        False
+
+        * New in v11.
+        '''
+        cached = self._cache.get('contentHash', None)
+        if cached is not None:
+            return cached
+        if self._frozen:
+            with _frozenStreamLock:
+                # the marker below must not be seen by other threads
+                return self._contentHashUnfrozen()
+        return self._contentHashUnfrozen()
+
+    def _contentHashUnfrozen(self) -> str:
+        cached = self._cache.get('contentHash', None)
+        if cached is not None:
+            return cached
+        if 'contentHash' in self._cache:
+            # being computed: a spanner in this Stream spans this Stream.
+            return type(self).__qualname__
+
+        if not self.isSorted and self.autoSort:
+            self.sort()
+        cls = type(self)
+        contentHash = hashlib.sha256(f'{cls.__module__}.{cls.__qualname__}'.encode())
+        self._cache['contentHash'] = None
+        try:
+            for e in itertools.chain(self._elements, self._endElements):
+                contentHash.update(f'\n{self.elementOffset(e)!r}:'.encode())
+                contentHash.update(_contentSignature(e).encode())
+        finally:
+            self._cache.pop('contentHash', None)
+        self._cache['contentHash'] = contentHash.hexdigest()
+        return self._cache['contentHash']
+
     def _reprInternal(self) -> str:
         if self.id is not None:
             if self.id != id(self) and str(self.id) != str(id(self)):
@@ -1422,8 +1701,9 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         if not isinstance(other, Stream):
             return
 
+        # not '_mutable': the new Stream is being filled, even if other is frozen.
         for attr in ('autoSort', 'isSorted', 'definesExplicitSystemBreaks',
-                     'definesExplicitPageBreaks', '_atSoundingPitch', '_mutable'):
+                     'definesExplicitPageBreaks', '_atSoundingPitch'):
             if hasattr(other, attr):
                 setattr(self, attr, getattr(other, attr))
 
@@ -1572,6 +1852,15 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         objId = id(el)
 
+        if self.treeStorage and self.isSorted:
+            # the elements are kept in order, so a binary search will find el.
+            i = bisect.bisect_left(self._elements,
+                                   el.sortTuple(self),
+                                   key=lambda e: e.sortTuple(self))
+            if i < len(self._elements) and self._elements[i] is el:
+                self._cache['index'][objId] = i
+                return i
+
         count = 0
 
         for e in self._elements:
@@ -1747,6 +2036,10 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         shiftDur = 0.0  # for shiftOffsets
 
+        if self.treeStorage and not shiftOffsets and 'elementTree' not in self._cache:
+            # build the tree now, so that each removal only needs to update it.
+            self.coreElementTree()
+
         for i, target in enumerate(targetList):
             try:
                 indexInStream = self.index(target)
@@ -1779,12 +2072,17 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             if match is not None:
                 if shiftOffsets:
                     matchOffset = self.elementOffset(match)
+                if not matchedEndElement:
+                    self.coreUpdateElementTree(match, removed=True)
 
                 try:
                     del self._offsetDict[id(match)]
                 except KeyError:  # pragma: no cover
                     pass
-                self.coreElementsChanged(clearIsSorted=False)
+                # shifting offsets moves other elements, so the tree cannot be kept.
+                self.coreElementsChanged(updateIsFlat=match.isStream,
+                                         clearIsSorted=False,
+                                         keepElementTree=not shiftOffsets)
                 match.sites.remove(self)
                 match.activeSite = None
 
@@ -1809,7 +2107,9 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                         self.coreSetElementOffset(e, elementOffset - shiftDur)
             # if renumberMeasures is True and matchedEndElement is False:
             #     pass  # This should maybe just call a function renumberMeasures
-        self.coreElementsChanged(clearIsSorted=False)
+        self.coreElementsChanged(updateIsFlat=False,
+                                 clearIsSorted=False,
+                                 keepElementTree=not shiftOffsets)
 
     def pop(self, index: int|None = None) -> base.Music21Object:
         '''
@@ -1832,19 +2132,26 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         >>> len(a)
         10
         '''
+        if self.treeStorage and self.isSorted and 'elementTree' not in self._cache:
+            self.coreElementTree()
         eLen = len(self._elements)
         # if less than base length, it is in _elements
+        fromEndElements = False
         if index is None:
             if self._endElements:
                 post = self._endElements.pop()
+                fromEndElements = True
             else:
                 post = self._elements.pop()
         elif index < eLen:
             post = self._elements.pop(index)
         else:  # it is in the _endElements
             post = self._endElements.pop(index - eLen)
+            fromEndElements = True
 
-        self.coreElementsChanged(clearIsSorted=False)
+        if not fromEndElements:
+            self.coreUpdateElementTree(post, removed=True)
+        self.coreElementsChanged(clearIsSorted=False, keepElementTree=True)
 
         try:
             del self._offsetDict[id(post)]
@@ -1942,6 +2249,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                               memo: dict[int, t.Any]|None = None,
                               *,
                               ignoreAttributes=None,
+                              copyDict: bool = False,
                               ) -> t.Self:
         # NOTE: this is a performance critical operation
         defaultIgnoreSet = {
@@ -1954,13 +2262,20 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         # PyCharm seems to think that this is a StreamCore
         # noinspection PyTypeChecker
-        new: t.Self = super()._deepcopySubclassable(memo, ignoreAttributes=ignoreAttributes)
+        new: t.Self = super()._deepcopySubclassable(memo,
+                                                    ignoreAttributes=ignoreAttributes,
+                                                    copyDict=copyDict)
 
         # new._offsetDict will get filled when ._elements is copied.
         newOffsetDict: dict[int, tuple[OffsetQLSpecial, base.Music21Object]] = {}
         new._offsetDict = newOffsetDict
         new._elements = []
         new._endElements = []
+        new._batchEditDepth = 0
+        new._batchEditUpdateIsFlat = False
+        # copies of frozen or immutable Streams can be edited
+        new._mutable = True
+        new._frozen = False
 
         # streamStatus's deepcopy is smart enough to ignore client.  set new
         new.streamStatus.client = new
@@ -2025,6 +2340,13 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         # only proceed if there are spanners, otherwise creating semiFlat
         if not newSpannerBundle:
             return
+        # index the spanners by the elements they span, rather than asking
+        # every spanner about every element, which is quadratic.
+        spannersBySpannedId: dict[int, list[spanner.Spanner]] = {}
+        for sp in newSpannerBundle:
+            for spanned in sp.spannerStorage._elements:
+                spannersBySpannedId.setdefault(id(spanned), []).append(sp)
+
         # iterate over complete semi-flat (need containers); find
         # all new/old pairs
         for e in new.recurse(includeSelf=False):
@@ -2041,13 +2363,16 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             if origin.sites.hasSpannerSite():
                 # environLocal.printDebug(['Stream.__deepcopy__', 'replacing component to', e])
                 # this will clear and replace the proper locations on
-                # the SpannerStorage Stream
-                newSpannerBundle.replaceSpannedElement(origin, e)
+                # the SpannerStorage Stream, as SpannerBundle.replaceSpannedElement() does
+                for sp in spannersBySpannedId.get(id(origin), ()):
+                    sp._cache = {}
+                    sp.replaceSpannedElement(origin, e)
 
                 # need to remove the old SpannerStorage Stream from this element;
                 # however, all we have here is the new Spanner and new elements
                 # this must be done here, not when originally copying
                 e.purgeOrphans(excludeStorageStreams=False)
+        newSpannerBundle._cache.clear()
 
     def setElementOffset(
         self,
@@ -2098,6 +2423,26 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         * Changed in v7: addElement is removed;
           see :meth:`~music21.stream.core.StreamCoreMixin.coreSetElementOffset`.
         '''
+        if (self.treeStorage
+                and self.autoSort
+                and self.isSorted
+                and not self._frozen
+                and not getattr(self, '_batchEditDepth', 0)
+                and id(element) in self._offsetDict
+                and isinstance(offset, (int, float, Fraction))):
+            # take the element out and put it back in at its new place.
+            if 'elementTree' not in self._cache:
+                self.coreElementTree()
+            i = self.index(element)
+            if i < len(self._elements):
+                del self._elements[i]
+                self.coreUpdateElementTree(element, removed=True)
+                self.coreInsertInOrder(offset, element)
+                self.coreElementsChanged(updateIsFlat=False,
+                                         clearIsSorted=False,
+                                         keepElementTree=True)
+                return
+
         self.coreSetElementOffset(element,
                                   offset,
                                   )
@@ -2321,6 +2666,18 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         self.coreGuardBeforeAddElement(element)
         # main insert procedure here
 
+        if getattr(self, '_batchEditDepth', 0):
+            # highestTime is not kept during a batch edit, so checking
+            # whether the Stream is still sorted is more work than sorting later.
+            ignoreSort = True
+        elif self.treeStorage and self.autoSort and not ignoreSort:
+            if not self.isSorted:
+                self.sort()
+            self.coreInsertInOrder(offset, element, setActiveSite=setActiveSite)
+            self.coreElementsChanged(updateIsFlat=element.isStream,
+                                     clearIsSorted=False,
+                                     keepElementTree=True)
+            return
         storeSorted = self.coreInsert(offset,
                                       element,
                                       ignoreSort=ignoreSort,
@@ -2328,10 +2685,70 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         updateIsFlat = False
         if element.isStream:
             updateIsFlat = True
-        self.coreElementsChanged(updateIsFlat=updateIsFlat)
+        self.coreElementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True)
         if not ignoreSort:
             self.isSorted = storeSorted
 
+    def insertMany(
+        self,
+        offsetElementPairs: Iterable[tuple[OffsetQLIn, base.Music21Object]],
+    ) -> None:
+        '''
+        Insert many elements at once, given an iterable of (offset, element) pairs.
+
+        The result is the same as calling :meth:`insert` on each pair, but all the
+        elements are checked before any are inserted, and the Stream is
+        sorted and its caches are cleared only once, rather than for each element.
+        For large numbers of elements this is much faster.
+
+        >>> s = stream.Stream()
+        >>> s.insertMany([(2.0, note.Note('E')), (0.0, note.Note('C')), (1.0, note.Note('D'))])
+        >>> s.show('text')
+        {0.0} <music21.note.Note C>
+        {1.0} <music21.note.Note D>
+        {2.0} <music21.note.Note E>
+        >>> s.highestTime
+        3.0
+
+        A generator works as well:
+
+        >>> s2 = stream.Stream()
+        >>> s2.insertMany((i / 2, note.Note(quarterLength=0.5)) for i in range(10000))
+        >>> len(s2)
+        10000
+
+        If any element cannot be inserted, nothing is inserted:
+
+        >>> n = note.Note('F')
+        >>> s.insertMany([(3.0, n), (4.0, n)])
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: the object (<music21.note.Note F>, id()=...
+            appears more than once in the elements to add
+        >>> s.insertMany([(3.0, n), ('four', note.Note('G'))])
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: Offset 'four' must be a number.
+        >>> len(s)
+        3
+
+        * New in v11.
+        '''
+        pairs: list[tuple[float, base.Music21Object]] = []
+        for offset, element in offsetElementPairs:
+            try:  # as in insert()
+                pairs.append((float(offset), element))
+            except (ValueError, TypeError) as ve:
+                raise StreamException(f'Offset {offset!r} must be a number.') from ve
+        if not pairs:
+            return
+        self.coreGuardBeforeAddElements([element for unused_offset, element in pairs])
+
+        updateIsFlat = False
+        for offset, element in pairs:
+            self.coreInsert(offset, element, ignoreSort=True)
+            if element.isStream:
+                updateIsFlat = True
+        self.coreElementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True)
+
     def insertIntoNoteOrChord(self, offset, noteOrChord, chordsOnly: bool = False):
         # noinspection PyShadowingNames
         '''
@@ -2605,11 +3022,51 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         {0.0} <music21.clef.TrebleClef>
         {0.0} <music21.meter.TimeSignature 4/4>
         '''
-        # store and increment the highest time for insert offset
-        highestTime = self.highestTime
         if not common.isListLike(others):
             # back into a list for list processing if single
             others = [others]
+        self._appendElements(others)
+
+    def appendMany(self, elements: Iterable[base.Music21Object]) -> None:
+        '''
+        Append many elements at once, one after the other, from any iterable
+        (including a generator).
+
+        The result is the same as calling :meth:`append` on each element,
+        but all the elements are checked before any are appended,
+        and the Stream's caches are cleared only once.
+
+        >>> s = stream.Stream()
+        >>> s.appendMany(note.Note(quarterLength=ql) for ql in (1.0, 0.5, 0.5, 2.0))
+        >>> s.show('text')
+        {0.0} <music21.note.Note C>
+        {1.0} <music21.note.Note C>
+        {1.5} <music21.note.Note C>
+        {2.0} <music21.note.Note C>
+
+        If any element cannot be appended, nothing is appended:
+
+        >>> s.appendMany([note.Note('D'), 'E'])
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: The object you tried to add to
+            the Stream, 'E', is not a Music21Object.  Use an ElementWrapper
+            object if this is what you intend.
+        >>> len(s)
+        4
+
+        * New in v11.
+        '''
+        elementList = list(elements)
+        self.coreGuardBeforeAddElements(elementList)
+        self._appendElements(elementList, guard=False)
+
+    def _appendElements(self, others: Sequence[base.Music21Object], *, guard=True) -> None:
+        '''
+        The main work of :meth:`append` and :meth:`appendMany`.  If `guard` is False,
+        the caller has already run coreGuardBeforeAddElement on each element.
+        '''
+        # store and increment the highest time for insert offset
+        highestTime = self.highestTime
 
         clearIsSorted = False
         if self._elements:
@@ -2619,7 +3076,8 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         updateIsFlat = False
         for e in others:
-            self.coreGuardBeforeAddElement(e)
+            if guard:
+                self.coreGuardBeforeAddElement(e)
             if e.isStream:  # any on that is a Stream req update
                 updateIsFlat = True
             # add this Stream as a location for the new elements, with
@@ -2629,6 +3087,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # need to explicitly set the activeSite of the element
             self.coreSelfActiveSite(e)
             self._elements.append(e)
+            self.coreUpdateClassIndex(e)
 
             if e.duration.quarterLength != 0:
                 # environLocal.printDebug(['incrementing highest time',
@@ -2648,7 +3107,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             storeSorted = self.isSorted
 
         # we cannot keep the index cache here b/c we might
-        self.coreElementsChanged(updateIsFlat=updateIsFlat)
+        self.coreElementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True)
         self.isSorted = storeSorted
         self._setHighestTime(opFrac(highestTime))  # call after to store in cache
 
@@ -2697,7 +3156,51 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         self.coreStoreAtEnd(element)
         # Streams cannot reside in end elements, thus do not update is flat
-        self.coreElementsChanged(updateIsFlat=False)
+        self.coreElementsChanged(updateIsFlat=False, keepClassIndex=True)
+
+    @contextlib.contextmanager
+    def batchEdit(self) -> Generator[t.Self, None, None]:
+        '''
+        A context manager for making many changes to a Stream, during which
+        the work that follows each change (telling the Streams that contain
+        this one about it, checking whether the Stream is still flat or sorted)
+        is put off until the end of the block, where it is done only once.
+
+        >>> p = stream.Part()
+        >>> with p.batchEdit():
+        ...     for i in range(4):
+        ...         p.insert(i * 4.0, stream.Measure(number=i + 1))
+        ...         p.append(note.Note())
+        >>> p.isFlat
+        False
+        >>> len(p.getElementsByClass(stream.Measure))
+        4
+
+        The Stream can be used during the block; it will just be slower than usual
+        if it needs to be sorted after each change:
+
+        >>> s = stream.Stream()
+        >>> with s.batchEdit() as sBatch:
+        ...     sBatch.insert(2.0, note.Note('E'))
+        ...     sBatch.insert(0.0, note.Note('C'))
+        ...     print(sBatch.first().name)
+        C
+
+        Blocks can be nested; the work is done when the outermost block ends.
+
+        * New in v11.
+        '''
+        self._batchEditDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchEditDepth -= 1
+            if not self._batchEditDepth:
+                updateIsFlat = self._batchEditUpdateIsFlat
+                self._batchEditUpdateIsFlat = False
+                self.coreElementsChanged(updateIsFlat=updateIsFlat,
+                                         clearIsSorted=False,
+                                         keepClassIndex=True)
 
     # --------------------------------------------------------------------------
     # all the following call either insert() or append()
@@ -4130,13 +4633,19 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         '''
         # NOTE: this is a performance critical method
 
-        # TODO: switch to trees if more than a certain number of elements.
         # TODO: allow sortTuple as a parameter (in all getElementBy/At routines)
 
         candidates = []
         offset: OffsetQL = opFrac(offset)
         nearestTrailSpan = offset  # start with max time
 
+        if self.autoSort and not self.isSorted:
+            self.sort()
+        offsetIndex = self.coreOffsetIndex()
+        if offsetIndex is not None:
+            return self._getElementAtOrBeforeIndexed(
+                offset, offsetIndex, classList, _beforeNotAt=_beforeNotAt)
+
         sIterator = self.iter()
         if classList:
             sIterator = sIterator.getElementsByClass(classList)
@@ -4165,6 +4674,67 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             return element[1]
         return None
 
+    def _getElementAtOrBeforeIndexed(
+        self,
+        offset: OffsetQL,
+        offsetIndex: core.OffsetIndex,
+        classList,
+        *,
+        _beforeNotAt: bool = False,
+    ) -> base.Music21Object|None:
+        '''
+        The part of :meth:`getElementAtOrBefore` that uses the offset index of
+        a sorted Stream: walks backwards from the last element at or before `offset`
+        instead of checking every element in the Stream.
+
+        Gives the same results as the scan.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 100)
+        >>> s.insert(50, clef.BassClef())
+        >>> s._getElementAtOrBeforeIndexed(70.5, s.coreOffsetIndex(), [clef.Clef])
+        <music21.clef.BassClef>
+        '''
+        classFilter = filters.ClassFilter(classList) if classList else None
+
+        # elements stored at the end are always at highestTime, which
+        # is at or after the offset of any element in _elements, and they
+        # sort after all of them.
+        if self._endElements:
+            highestTime = self.highestTime
+            if highestTime < offset or (highestTime == offset and not _beforeNotAt):
+                endCandidates = [e for e in self._endElements
+                                 if classFilter is None or classFilter(e)]
+                if endCandidates:
+                    element = max(endCandidates, key=lambda x: x.sortTuple(self))
+                    self.coreSelfActiveSite(element)
+                    return element
+
+        offsets = offsetIndex.offsets
+        elements = self._elements
+        i = offsetIndex.numberAtOrBefore(offset, includeOffset=not _beforeNotAt) - 1
+        # as in the scan, elements at negative offsets are never found.
+        while i >= 0 and offsets[i] >= 0:
+            e = elements[i]
+            if classFilter is None or classFilter(e):
+                break
+            i -= 1
+        else:
+            return None
+
+        # gather everything else that matches at the same offset
+        foundOffset = offsets[i]
+        candidates = [elements[i]]
+        i -= 1
+        while i >= 0 and offsets[i] == foundOffset:
+            e = elements[i]
+            if classFilter is None or classFilter(e):
+                candidates.append(e)
+            i -= 1
+        element = max(candidates, key=lambda x: x.sortTuple(self))
+        self.coreSelfActiveSite(element)
+        return element
+
     def getElementBeforeOffset(
         self,
         offset: OffsetQL,
@@ -4624,7 +5194,12 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # placing missing objects in outer container, not Measure
             found = startMeasure.getContextByClass(className)
             if found is not None:
-                if startMeasure is not None:
+                if startMeasure is not None and self._frozen:
+                    # a frozen Stream cannot be told that the priority changed,
+                    # so change it on a copy, without telling the sites.
+                    found = copy.deepcopy(found)
+                    found._priority = startMeasure.priority - 1
+                elif startMeasure is not None:
                     found.priority = startMeasure.priority - 1
                     # TODO: This should not change global priority on found, but
                     #   instead priority, like offset, should be a per-site attribute
@@ -6410,19 +6985,15 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         >>> cn[0].pitches
         (<music21.pitch.Pitch C4>, <music21.pitch.Pitch D#4>)
         '''
-        def chordifyOneMeasure(templateInner, streamToChordify):
+        def chordifyOneMeasure(templateInner, timespans):
             '''
-            streamToChordify is either a Measure or a Score=MeasureSlice
+            timespans are those of a Measure (from each Part) or of the whole Stream,
+            sorted by offset and endTime.
             '''
-            timespanTree = streamToChordify.asTimespans(classList=(note.GeneralNote,))
-            allTimePoints = timespanTree.allTimePoints()
-            if 0 not in allTimePoints:
-                allTimePoints = (0,) + allTimePoints
-
-            for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
-                if isclose(offset, endTime, abs_tol=1e-7):
+            for vert, endTime in tree.verticality.sweepVerticalities(timespans, startOffset=0):
+                offset = vert.offset
+                if endTime is None or isclose(offset, endTime, abs_tol=1e-7):
                     continue
-                vert = timespanTree.getVerticalityAt(offset)
                 quarterLength = endTime - offset
                 if quarterLength < 0:  # pragma: no cover
                     environLocal.warn(
@@ -6464,17 +7035,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             templateInner.insert(startOffset, rNew)
 
         # --------------------------------------
-        if toSoundingPitch:
-            # environLocal.printDebug(['at sounding pitch', allParts[0].atSoundingPitch])
-            if (self.hasPartLikeStreams()
-                    and self.getElementsByClass('Stream').first().atSoundingPitch is False):
-                workObj = self.toSoundingPitch(inPlace=False)
-            elif self.atSoundingPitch is False:  # do not simplify, can be False
-                workObj = self.toSoundingPitch(inPlace=False)
-            else:
-                workObj = self
-        else:
-            workObj = self
+        workObj = self._chordifySource(toSoundingPitch)
 
         if self.hasPartLikeStreams():
             # use the measure boundaries of the first Part as a template.
@@ -6486,17 +7047,33 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                                            removeClasses=('GeneralNote',),
                                            retainVoices=False)
 
+        classList = (note.GeneralNote,)
         if template.hasMeasures():
+            # gather the measures of each part once, rather than getting a
+            # measure slice of the whole score for each measure.
+            partMeasureLists: list[list[Measure]]
+            if isinstance(workObj, Score):
+                partMeasureLists = [list(p.getElementsByClass(Measure))
+                                    for p in workObj.getElementsByClass(Part)]
+            else:
+                partMeasureLists = [list(workObj.getElementsByClass(Measure))]
+
             measureIterator = template.getElementsByClass(Measure)
             for i, templateMeasure in enumerate(measureIterator):
-                # measurePart is likely a Score (MeasureSlice), not a measure
-                measurePart = workObj.measure(i, collect=(), indicesNotNumbers=True)
-                if measurePart is not None:
-                    chordifyOneMeasure(templateMeasure, measurePart)
-                else:
+                if not isinstance(workObj, Score) and i >= len(partMeasureLists[0]):
                     environLocal.warn(f'Malformed Part object, {workObj}, at measure index {i}')
+                    continue
+                timespans = []
+                for measureList in partMeasureLists:
+                    if i < len(measureList):
+                        timespans.extend(tree.fromStream.sortedTimespans(measureList[i],
+                                                                         classList=classList))
+                # each part's timespans are sorted; this merges them in part order.
+                timespans.sort(key=lambda ts: (ts.offset, ts.endTime))
+                chordifyOneMeasure(templateMeasure, timespans)
         else:
-            chordifyOneMeasure(template, workObj)
+            chordifyOneMeasure(template,
+                               tree.fromStream.sortedTimespans(workObj, classList=classList))
 
         # accidental displayStatus needs to change.
         for p in template.pitches:
@@ -6510,6 +7087,133 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         return template
 
+    def _chordifySource(self, toSoundingPitch: bool) -> Stream:
+        '''
+        Return the Stream that :meth:`chordify` and :meth:`chordifyIter` should
+        work on: this Stream, or a copy of it at sounding pitch if
+        `toSoundingPitch` is True and it is not already at sounding pitch.
+        '''
+        if toSoundingPitch:
+            # environLocal.printDebug(['at sounding pitch', allParts[0].atSoundingPitch])
+            if self.hasPartLikeStreams():
+                firstPart = self.getElementsByClass(Stream).first()
+                if firstPart is not None and firstPart.atSoundingPitch is False:
+                    return self.toSoundingPitch(inPlace=False)
+            if self.atSoundingPitch is False:  # do not simplify, can be False
+                return self.toSoundingPitch(inPlace=False)
+        return self
+
+    def chordifyIter(
+        self,
+        *,
+        makeElements=False,
+        addTies=True,
+        addPartIdAsGroup=False,
+        removeRedundantPitches=True,
+        toSoundingPitch=True,
+        copyPitches=True,
+    ) -> Generator[tuple[OffsetQL, OffsetQL, tuple[pitch.Pitch, ...]]
+                   | note.Rest | chord.Chord, None, None]:
+        '''
+        Like :meth:`chordify`, but yields each chordified moment of the whole
+        Stream (ignoring Measures) one by one, instead of building a new Stream,
+        so that big scores can be reduced without holding all the output in memory.
+
+        By default, a tuple of (offset, quarterLength, pitches) is yielded for
+        each change of pitch, where pitches is a tuple of the Pitch objects
+        sounding, lowest first.  Consecutive moments without pitches are joined.
+
+        >>> s = stream.Score()
+        >>> p1 = stream.Part()
+        >>> p1.insert(4, note.Note('E4'))
+        >>> p1.insert(5.5, note.Rest())
+        >>> p2 = stream.Part()
+        >>> p2.insert(3, note.Note('D-4', type='half'))
+        >>> s.insert(0, p1)
+        >>> s.insert(0, p2)
+        >>> for offset, quarterLength, pitches in s.chordifyIter():
+        ...     print(offset, quarterLength, pitches)
+        0.0 3.0 ()
+        3.0 1.0 (<music21.pitch.Pitch D-4>,)
+        4.0 1.0 (<music21.pitch.Pitch D-4>, <music21.pitch.Pitch E4>)
+        5.0 1.5 ()
+
+        The Pitch objects are those of the notes in the Stream, so do not change them.
+
+        If `makeElements` is True then each moment is yielded as a Chord or Rest,
+        made as in chordify() (with the other keywords given here),
+        with its `.offset` set but not in any Stream:
+
+        >>> for el in s.chordifyIter(makeElements=True):
+        ...     print(el.offset, el)
+        0.0 <music21.note.Rest dotted-half>
+        3.0 <music21.chord.Chord D-4>
+        4.0 <music21.chord.Chord D-4 E4>
+        5.0 <music21.note.Rest dotted-quarter>
+
+        With `makeElements=True, copyPitches=False` the Chords are lighter,
+        because their Notes share Pitch objects with the Stream.
+
+        * New in v11.
+        '''
+        workObj = self._chordifySource(toSoundingPitch)
+        timespans = tree.fromStream.sortedTimespans(workObj, classList=(note.GeneralNote,))
+
+        restOffset: OffsetQL|None = None
+        restEnd: OffsetQL = 0.0
+        for vert, endTime in tree.verticality.sweepVerticalities(timespans, startOffset=0.0):
+            offset = vert.offset
+            if endTime is None or isclose(offset, endTime, abs_tol=1e-7):
+                continue
+            if makeElements:
+                hasPitches = bool(vert.pitchSet)
+            elif removeRedundantPitches:
+                pitches = tuple(sorted(vert.pitchSet, key=lambda p: p.ps))
+                hasPitches = bool(pitches)
+            else:
+                pitches = tuple(sorted(
+                    (p for ts in vert.startAndOverlapTimespans
+                        if isinstance(ts, tree.spans.PitchedTimespan)
+                        for p in ts.pitches),
+                    key=lambda p: p.ps))
+                hasPitches = bool(pitches)
+
+            if not hasPitches:
+                if restOffset is None:
+                    restOffset = offset
+                restEnd = endTime
+                continue
+            if restOffset is not None:
+                yield self._chordifyIterRest(restOffset, restEnd, makeElements)
+                restOffset = None
+
+            if makeElements:
+                el = vert.makeElement(endTime - offset,
+                                      addTies=addTies,
+                                      addPartIdAsGroup=addPartIdAsGroup,
+                                      removeRedundantPitches=removeRedundantPitches,
+                                      copyPitches=copyPitches)
+                el.offset = offset
+                yield el
+            else:
+                yield (opFrac(offset), opFrac(endTime - offset), pitches)
+
+        if restOffset is not None:
+            yield self._chordifyIterRest(restOffset, restEnd, makeElements)
+
+    @staticmethod
+    def _chordifyIterRest(offset, endTime, makeElements):
+        '''
+        Make a Rest or an empty (offset, quarterLength, pitches) tuple for
+        chordifyIter() from offset to endTime.
+        '''
+        if not makeElements:
+            return (opFrac(offset), opFrac(endTime - offset), ())
+        r = note.Rest()
+        r.duration.quarterLength = endTime - offset
+        r.offset = offset
+        return r
+
     def splitByClass(self, classObj, fx):
         # noinspection PyShadowingNames
         '''
@@ -7030,10 +7734,11 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         #     lastBarlineType = 'final'
 
         # retrieve necessary spanners; insert only if making a copy
-        returnStream.coreGatherMissingSpanners(
-            insert=not inPlace,
-            # definitely do NOT put a constrainingSpannerBundle constraint
-        )
+        # (in place, nothing would be done with the spanners found, so do not search)
+        if not inPlace:
+            returnStream.coreGatherMissingSpanners(
+                # definitely do NOT put a constrainingSpannerBundle constraint
+            )
         # only use inPlace arg on first usage
         if not returnStream.hasMeasures():
             # only try to make voices if no Measures are defined
@@ -7351,12 +8056,17 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         # that come before the first Note, such as a SystemLayout object
         # or there could be ChordSymbols with zero (unrealized) durations
         f = returnObj.flatten()
-        notes_and_rests: StreamType = f.notesAndRests.addFilter(
+        notes_and_rests_stream: StreamType = f.notesAndRests.addFilter(
             lambda el, _iterator: el.quarterLength > 0
         ).stream()
+        # index a list, since changing the duration of a note below would
+        # make the Stream sort itself again at the next index lookup.
+        notes_and_rests: list[note.GeneralNote] = list(notes_and_rests_stream)
 
-        posConnected = []  # temporary storage for index of tied notes
-        posDelete = []  # store deletions to be processed later
+        posConnected: list[int] = []  # temporary storage for index of tied notes
+        posDelete: list[int] = []  # store deletions to be processed later
+        # spanners of f, by id; gathered when first needed
+        spannerIds: set[int]|None = None
 
         def updateEndMatch(nInner) -> bool:
             '''
@@ -7394,7 +8104,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # find out if the last index is in position connected
             # if the pitches are the same for each note
             if (nLast is not None
-                    and iLast in posConnected
+                    and lastConnected
                     and hasattr(nLast, 'pitch')
                     and hasattr(nInner, 'pitch')
                     # before doing pitch comparison, need to
@@ -7406,7 +8116,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # looking for two chords of equal size
             if (nLast is not None
                     and not isinstance(nInner, note.Note)
-                    and iLast in posConnected
+                    and lastConnected
                     and hasattr(nLast, 'pitches')
                     and hasattr(nInner, 'pitches')):
                 if len(nLast.pitches) != len(nInner.pitches):
@@ -7421,7 +8131,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
             return False
 
-        def allTiesAreContinue(nr: note.NotRest) -> bool:
+        def allTiesAreContinue(nr: note.GeneralNote) -> bool:
             if nr.tie is None:  # pragma: no cover
                 return False
             if nr.tie.type != 'continue':
@@ -7436,6 +8146,47 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                         return False
             return True
 
+        def mergeConnected() -> None:
+            '''
+            Add the durations of the notes at posConnected to the first one,
+            and mark the others to be deleted.
+            '''
+            nonlocal spannerIds
+            # get sum of durations for all notes
+            # do not include first; will add to later; do not delete
+            durSum: OffsetQL = 0
+            for q in posConnected[1:]:  # all but the first
+                durSum += notes_and_rests[q].quarterLength
+                posDelete.append(q)  # store for deleting later
+            # dur sum should always be greater than zero
+            if durSum == 0:
+                raise StreamException('aggregated ties have a zero duration sum')
+            # change the duration of the first note to be self + sum
+            # of all others
+            changing_note = notes_and_rests[posConnected[0]]
+
+            qLen = changing_note.quarterLength
+            if not changing_note.duration.linked:
+                # obscure bug found from some inexact musicxml files.
+                changing_note.duration.linked = True
+            changing_note.quarterLength = opFrac(qLen + durSum)
+
+            # set tie to None on first note
+            changing_note.tie = None
+
+            # let the site know that we've changed duration.
+            changing_note.informSites()
+
+            # replace removed elements in spanners
+            if spannerIds is None:
+                spannerIds = {id(sp) for sp in f.spanners}
+            if spannerIds:
+                for index in posConnected[1:]:
+                    removed_note = notes_and_rests[index]
+                    for sp in removed_note.getSpannerSites():
+                        if id(sp) in spannerIds:
+                            sp.replaceSpannedElement(removed_note, changing_note)
+
         for i in range(len(notes_and_rests)):
             endMatch = None  # can be True, False, or None
             n = notes_and_rests[i]
@@ -7445,6 +8196,11 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             else:
                 iLast = None
                 nLast = None
+            # positions are added to posConnected in increasing order, so
+            # the last position can only be connected if it is the last one there.
+            lastConnected = (iLast is not None
+                             and bool(posConnected)
+                             and posConnected[-1] == iLast)
 
             # See if we have a tie, and it has started.
             # A start typed tie may not be a true start tie
@@ -7452,11 +8208,11 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                     and n.tie is not None
                     and n.tie.type == 'start'):
                 # find a true start, add to known connected positions
-                if iLast is None or iLast not in posConnected:
+                if not lastConnected:
                     posConnected = [i]  # reset list with start
                 # find a continuation: the last note was a tie
                 # start and this note is a tie start (this may happen)
-                elif iLast in posConnected:
+                else:
                     posConnected.append(i)
                 # a connection has been started or continued, so no endMatch
                 endMatch = False
@@ -7515,56 +8271,64 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                     posConnected = []
                     continue
 
-                # get sum of durations for all notes
-                # do not include first; will add to later; do not delete
-                durSum = 0
-                for q in posConnected[1:]:  # all but the first
-                    durSum += notes_and_rests[q].quarterLength
-                    posDelete.append(q)  # store for deleting later
-                # dur sum should always be greater than zero
-                if durSum == 0:
-                    raise StreamException('aggregated ties have a zero duration sum')
-                # change the duration of the first note to be self + sum
-                # of all others
-                changing_note = t.cast(note.GeneralNote, notes_and_rests[posConnected[0]])
-
-                qLen = changing_note.quarterLength
-                if not changing_note.duration.linked:
-                    # obscure bug found from some inexact musicxml files.
-                    changing_note.duration.linked = True
-                changing_note.quarterLength = opFrac(qLen + durSum)
-
-                # set tie to None on first note
-                changing_note.tie = None
-
-                # let the site know that we've changed duration.
-                changing_note.informSites()
-
-                # replace removed elements in spanners
-                for sp in f.spanners:
-                    for index in posConnected[1:]:
-                        if notes_and_rests[index] in sp:
-                            sp.replaceSpannedElement(
-                                notes_and_rests[index],
-                                changing_note
-                            )
-
+                mergeConnected()
                 posConnected = []  # reset to empty
 
         # all results have been processed
-        posDelete.reverse()  # start from highest and go down
-
-        for i in posDelete:
-            # environLocal.printDebug(['removing note', notes[i]])
-            # get the obj ref
-            nTarget = notes_and_rests[i]
-            # Recurse rather than depend on the containers being Measures
-            # https://github.com/cuthbertLab/music21/issues/266
-            returnObj.remove(nTarget, recurse=True)
+        # Recurse rather than depend on the containers being Measures
+        # https://github.com/cuthbertLab/music21/issues/266
+        returnObj._removeRecurseMany([notes_and_rests[i] for i in posDelete])
 
         if not inPlace:
             return returnObj
 
+    def _removeRecurseMany(self, targets: Iterable[base.Music21Object]) -> None:
+        '''
+        Remove each of `targets` from the first Stream holding it, found
+        in the same order as `remove(target, recurse=True)`: this Stream and then
+        the Streams within it.
+
+        Unlike calling `remove(recurse=True)` for each target, the hierarchy is
+        gone through only once and each Stream is changed only once.
+
+        >>> m1 = stream.Measure([note.Note('C'), note.Note('D')])
+        >>> m2 = stream.Measure([note.Note('E'), note.Note('F')])
+        >>> p = stream.Part([m1, m2])
+        >>> p._removeRecurseMany([m1.notes[1], m2.notes[0]])
+        >>> p.show('text')
+        {0.0} <music21.stream.Measure 0 offset=0.0>
+            {0.0} <music21.note.Note C>
+        {2.0} <music21.stream.Measure 0 offset=2.0>
+            {1.0} <music21.note.Note F>
+        '''
+        remaining = {id(el): el for el in targets}
+        if not remaining:
+            return
+        if not self._mutable:  # pragma: no cover
+            raise ImmutableStreamException('Cannot remove from an immutable stream')
+
+        for s in list(self.recurse(streamsOnly=True, includeSelf=True)):
+            removed: list[base.Music21Object] = []
+            for section in (s._elements, s._endElements):
+                if not any(id(el) in remaining for el in section):
+                    continue
+                kept = []
+                for el in section:
+                    if id(el) in remaining:
+                        removed.append(remaining.pop(id(el)))
+                    else:
+                        kept.append(el)
+                section[:] = kept
+            if not removed:
+                continue
+            for el in removed:
+                del s._offsetDict[id(el)]
+                el.sites.remove(s)
+                el.activeSite = None
+            s.coreElementsChanged(clearIsSorted=False)
+            if not remaining:
+                return
+
     def extendTies(self, ignoreRests=False, pitchAttr='nameWithOctave'):
         '''
         Connect any adjacent pitch space values that are the
@@ -7678,6 +8442,8 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                 updateIsFlat=False,
                 clearIsSorted=False,
                 keepIndex=False,  # this is False by default, but just to be sure for later
+                keepContextCache=True,  # contexts come from sortTuples, not the order
+                keepElementTree=True,  # the tree does not depend on the order either
             )
             self.isSorted = True
             # environLocal.printDebug(['_elements', self._elements])
@@ -7761,6 +8527,9 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         cache_sorted = self._cache.get('sorted')
         if cache_sorted is not None:
             return cache_sorted
+        if self._frozen:
+            # already sorted; a copy would add a site to every element.
+            return self
         shallowElements = copy.copy(self._elements)  # already a copy
         shallowEndElements = copy.copy(self._endElements)  # already a copy
         s = copy.copy(self)
@@ -7780,7 +8549,7 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         self._cache['sorted'] = s
         return s
 
-    def flatten(self, retainContainers=False) -> t.Self:
+    def flatten(self, retainContainers=False, *, incremental=False) -> t.Self:
         '''
         A very important method that returns a new Stream
         that has all sub-containers "flattened" within it,
@@ -7988,7 +8757,36 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             requests them to be. The way to tell a modern IDE that a process may
             have consequences is to make it a `.method()` not a `.property`.
 
+        Normally, any change to a Stream in the hierarchy means that the next call
+        to `.flatten()` creates the flat Stream again from scratch, which makes
+        editing a large score and flattening after each edit slow.  With
+        `incremental=True`, the flat Stream is kept and only the elements of the
+        Streams that have changed are added to, moved in, or removed from it.
+        The same Stream object is returned each time, updated in place, so it
+        should not itself be edited.
+
+        >>> m1 = stream.Measure([note.Note('C', type='whole')], number=1)
+        >>> m2 = stream.Measure([note.Note('D', type='whole')], number=2)
+        >>> p = stream.Part([m1, m2])
+        >>> pf = p.flatten(incremental=True)
+        >>> m1.insert(2, note.Note('E'))
+        >>> m2.remove(m2.notes.first())
+        >>> p.flatten(incremental=True) is pf
+        True
+        >>> pf.show('text')
+        {0.0} <music21.note.Note C>
+        {2.0} <music21.note.Note E>
+
+        The result is always the same as flattening from scratch:
+
+        >>> import copy
+        >>> pf.elements == p.flatten().elements
+        True
+        >>> pf.elements == copy.deepcopy(p).flatten().elements
+        True
+
         * Changed in v.10: Derivation method names changed to flatten and flatten_retain_containers
+        * New in v11: `incremental`
         '''
         # environLocal.printDebug(['flatten(): self', self,
         #  'self.activeSite', self.activeSite])
@@ -7997,36 +8795,28 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         else:
             method = 'flatten'
 
+        if incremental and not self._frozen:
+            return self._flattenIncremental(method, retainContainers)
+
         cached_version = self._cache.get(method)
         if cached_version is not None:
             return cached_version
+        if self._frozen:
+            # flattening adds a site to every element: one thread at a time.
+            with _frozenStreamLock:
+                cached_version = self._cache.get(method)
+                if cached_version is None:
+                    cached_version = self._flattenUncached(method, retainContainers)
+                    cached_version._freezeWithCaches()
+                return cached_version
+        return self._flattenUncached(method, retainContainers)
 
-        # this copy will have a shared sites object
-        # note that copy.copy() in some cases seems to not cause secondary
-        # problems that self.__class__() does
-        sNew = copy.copy(self)
-
-        if sNew.id != id(sNew):
-            sOldId = sNew.id
-            if isinstance(sOldId, int) and sOldId > defaults.minIdNumberToConsiderMemoryLocation:
-                sOldId = hex(sOldId)
-
-            newId = str(sOldId) + '_' + method
-            sNew.id = newId
-
-        sNew_derivation = derivation.Derivation(sNew)
-        sNew_derivation.origin = self
-        sNew_derivation.method = method
-
-        sNew.derivation = sNew_derivation
-
-        # storing .elements in here necessitates
-        # create a new, independent cache instance in the flat representation
-        sNew._cache = {}
-        sNew._offsetDict = {}
-        sNew._elements = []
-        sNew._endElements = []
-        sNew.coreElementsChanged()
+    def _flattenUncached(self, method: str, retainContainers: bool) -> t.Self:
+        '''
+        Does the work of `.flatten()` when there is no flattened Stream
+        in the cache, and stores the new one there.
+        '''
+        sNew = self._newFlattenedStream(method)
 
         # TODO (MSAC 2026): because of sorting, currently flatten() operates in O(n log n) time,
         #    but in most cases (where there are no negative offsets or overlapping measures, etc.)
@@ -8062,6 +8852,67 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         return sNew
 
+    def _newFlattenedStream(self, method: str) -> t.Self:
+        '''
+        Return an empty copy of this Stream derived from it by `method`,
+        ready to have the elements of a flattened Stream added.
+        '''
+        # this copy will have a shared sites object
+        # note that copy.copy() in some cases seems to not cause secondary
+        # problems that self.__class__() does
+        sNew = copy.copy(self)
+
+        if sNew.id != id(sNew):
+            sOldId = sNew.id
+            if isinstance(sOldId, int) and sOldId > defaults.minIdNumberToConsiderMemoryLocation:
+                sOldId = hex(sOldId)
+
+            newId = str(sOldId) + '_' + method
+            sNew.id = newId
+
+        sNew_derivation = derivation.Derivation(sNew)
+        sNew_derivation.origin = self
+        sNew_derivation.method = method
+
+        sNew.derivation = sNew_derivation
+
+        # storing .elements in here necessitates
+        # create a new, independent cache instance in the flat representation
+        sNew._cache = {}
+        sNew._offsetDict = {}
+        sNew._elements = []
+        sNew._endElements = []
+        sNew._mutable = True
+        sNew._frozen = False
+        sNew.coreElementsChanged()
+        return sNew
+
+    def _flattenIncremental(self, method: str, retainContainers: bool) -> t.Self:
+        '''
+        Does the work of `.flatten(incremental=True)`, with the
+        :class:`~music21.stream.core.IncrementalFlatten` records kept in the cache
+        (which `coreElementsChanged` keeps up to date instead of clearing).
+        '''
+        flatRecord = self._cache.get('incrementalFlatten', {}).get(method, None)
+        if flatRecord is not None:
+            flatRecord.update()
+        if flatRecord is None or not flatRecord.isValid:
+            flatRecord = core.IncrementalFlatten(self,
+                                                 self._newFlattenedStream(method),
+                                                 retainContainers=retainContainers)
+            flatRecord.build()
+        # building or updating may have sorted Streams and thus changed self._cache
+        incrementalFlatten = self._cache.setdefault('incrementalFlatten', {})
+        if not flatRecord.isValid:
+            # the same object is in the hierarchy more than once; cannot be patched.
+            incrementalFlatten.pop(method, None)
+            self._cache.pop(method, None)
+            return self.flatten(retainContainers=retainContainers)
+        incrementalFlatten[method] = flatRecord
+        sNew = t.cast(t.Self, flatRecord.flatStream)
+        self._cache[method] = sNew
+        return sNew
+
     @overload
     def recurse(self,
                 *,
@@ -8308,13 +9159,121 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         self._mutable = False
 
     def makeMutable(self, recurse=True):
+        '''
+        Undo :meth:`makeImmutable` or :meth:`freeze`.
+
+        * Changed in v11: also unfreezes.
+        '''
         self._mutable = True
+        self._frozen = False
         if recurse:
             for e in self.recurse(streamsOnly=True):
                 # do not recurse, as will get all Stream
                 e.makeMutable(recurse=False)
         self.coreElementsChanged()
 
+    def freeze(self) -> None:
+        '''
+        Make this Stream and every Stream within it read-only, so that many
+        threads can query one parsed score at the same time.
+
+        Freezing sorts each Stream, makes its flattened version, and fills
+        the caches that queries use, so that reading a frozen Stream does not
+        need to change it.  Iterating over a frozen Stream does not change the
+        activeSite of its elements: each element keeps as its activeSite the
+        Stream that directly contains it, so `.offset` is the offset there.
+        Use :meth:`elementOffset` for offsets in a flattened Stream.
+
+        >>> s = converter.parse('tinyNotation: 4/4 c4 d e f g1')
+        >>> s.freeze()
+        >>> s.isFrozen
+        True
+        >>> sFlat = s.flatten()
+        >>> sFlat.isFrozen
+        True
+        >>> s.flatten() is sFlat
+        True
+        >>> g = sFlat.notes.last()
+        >>> g.activeSite
+        <music21.stream.Measure 2 offset=4.0>
+        >>> g.offset, sFlat.elementOffset(g)
+        (0.0, 4.0)
+
+        A frozen Stream cannot be changed:
+
+        >>> s.measure(1).append(note.Note('A'))
+        Traceback (most recent call last):
+        music21.exceptions21.ImmutableStreamException: Cannot add to a frozen Stream
+
+        Caches that freezing did not fill are filled by one thread at a time.
+        Methods that put the elements into new Streams (such as `.measures()` or
+        `.stream()` on a StreamIterator) still change the shared elements, so
+        should not be used by threads; iterate instead, or make a deepcopy first.  A deepcopy
+        of a frozen Stream is not frozen:
+
+        >>> import copy
+        >>> sCopy = copy.deepcopy(s)
+        >>> sCopy.isFrozen
+        False
+        >>> sCopy.measure(1).append(note.Note('A'))
+
+        :meth:`makeMutable` unfreezes the Stream.
+
+        >>> s.makeMutable()
+        >>> s.isFrozen
+        False
+
+        * New in v11.
+        '''
+        if self._frozen:
+            return
+        with _frozenStreamLock:
+            containers = list(self.recurse(streamsOnly=True,
+                                           includeSelf=True,
+                                           restoreActiveSites=False))
+            for s in containers:
+                if not s._frozen:
+                    s._mutable = True
+                    s.sort()
+            # flattening a Stream clears the caches of the Streams containing it,
+            # so the innermost Streams are flattened first.
+            flats = [s.flatten() for s in reversed(containers)]
+            for s in containers:
+                for e in s.elements:
+                    s.coreSelfActiveSite(e)
+            for s in itertools.chain(containers, flats):
+                if not s._frozen:
+                    s._freezeWithCaches()
+
+    def _freezeWithCaches(self) -> None:
+        '''
+        Fill the caches that queries use and mark this Stream alone as frozen.
+        '''
+        for unused in (self.elements, self.highestOffset, self.highestTime,
+                       self.lowestOffset, self.duration, self.spannerBundle,
+                       self.coreOffsetIndex(), self.coreClassIndex(),
+                       self.hasMeasures(), self.hasVoices(), self.hasPartLikeStreams()):
+            pass
+        if self.derivation.method == 'flatten':
+            # there are no Streams left to flatten.
+            self._cache['flatten'] = self
+        self._mutable = False
+        self._frozen = True
+
+    @property
+    def isFrozen(self) -> bool:
+        '''
+        True if :meth:`freeze` has been called on this Stream or a Stream
+        containing it.
+
+        >>> s = stream.Stream()
+        >>> s.isFrozen
+        False
+
+        * New in v11.
+        '''
+        return self._frozen
+
     # --------------------------------------------------------------------------
     # duration and offset methods and properties
 
@@ -8441,6 +9400,9 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # _endElements does not matter here, since ql > 0 on endElements not allowed.
             self._cache['HighestTime'] = 0.0
             return 0.0
+        elif self._cache.get('elementTree', None) is not None:
+            # the tree keeps track of the latest endTime of the elements in it.
+            self._cache['HighestTime'] = opFrac(max(0.0, self._cache['elementTree'].endTime))
         else:
             highestTimeSoFar = 0.0
             # TODO: optimize for a faster way of doing this.
@@ -8758,10 +9720,52 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         # 'got mmBoundaries:', mmBoundaries])
         return mmBoundaries
 
+    def tempoMap(self) -> tempo.TempoMap:
+        '''
+        Return a :class:`~music21.tempo.TempoMap` made from the
+        :meth:`metronomeMarkBoundaries` of this Stream, for converting
+        between offsets and seconds.  The TempoMap is cached until the
+        elements of this Stream (or of a Stream it contains) change.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 8)
+        >>> s.insert([6, tempo.MetronomeMark(number=240)])
+        >>> tm = s.tempoMap()
+        >>> tm.offsetToSeconds(7.0)
+        3.25
+        >>> s.tempoMap() is tm
+        True
+
+        >>> s.append(note.Note())
+        >>> s.tempoMap() is tm
+        False
+        >>> s.tempoMap().offsetToSeconds(9.0)
+        3.75
+
+        Changing the number, referent, or sounding number of a MetronomeMark
+        in place calls
+        :meth:`~music21.stream.core.StreamCore.coreElementsChanged` on the
+        Streams that contain it, so a new TempoMap is made as well:
+
+        >>> s[tempo.MetronomeMark].first().number = 120
+        >>> s.tempoMap() is tm
+        False
+        >>> s.tempoMap().offsetToSeconds(9.0)
+        4.5
+
+        * New in v11.
+        '''
+        if 'tempoMap' not in self._cache:
+            self._cache['tempoMap'] = tempo.TempoMap(self.metronomeMarkBoundaries())
+        return self._cache['tempoMap']
+
     def _accumulatedSeconds(self, mmBoundaries, oStart, oEnd):
         '''
         Given MetronomeMark boundaries, for any pair of offsets,
         determine the realized duration in seconds.
+
+        See :meth:`~music21.tempo.TempoMap.secondsBetween`, which gives the same
+        result without going through all the boundaries before oStart.
         '''
         # assume tt mmBoundaries are in order
         totalSeconds = 0.0
@@ -8796,10 +9800,15 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         '''
         if srcObj is None:
             srcObj = self
-        mmBoundaries = self.metronomeMarkBoundaries(srcObj=srcObj)
+        tempoMap = srcObj.tempoMap()
 
         # not sure if this should be taken from the flat representation
         lowestOffset = srcObj.lowestOffset
+        if tempoMap.starts and lowestOffset == tempoMap.starts[0]:
+            offsetToSeconds = tempoMap.offsetToSeconds
+        else:
+            def offsetToSeconds(o):
+                return tempoMap.secondsBetween(lowestOffset, o)
 
         secondsMap: list[SecondsMapEntry] = []  # list of start, start+dur, element
         groups: list[tuple[Stream, int|None]]
@@ -8819,8 +9828,8 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                 dur = e.duration.quarterLength
                 offset = round(e.getOffsetBySite(group), 8)
                 # calculate all time regions given this offset; all values are seconds
-                offsetSeconds = srcObj._accumulatedSeconds(mmBoundaries, lowestOffset, offset)
-                durationSeconds = srcObj._accumulatedSeconds(mmBoundaries, offset, offset + dur)
+                offsetSeconds = offsetToSeconds(offset)
+                durationSeconds = tempoMap.secondsBetween(offset, offset + dur)
                 secondsMap.append(SecondsMapEntry(
                     offsetSeconds=offsetSeconds,
                     durationSeconds=durationSeconds,
@@ -9045,6 +10054,162 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         else:
             return (myBeat, myMeas)
 
+    def computeBeats(self, classFilter=note.GeneralNote) -> list[BeatMap]:
+        '''
+        Return a list of BeatMap namedtuples of the element, `.beat`,
+        `.beatStrength`, and `.beatDuration` for every element (by default,
+        every :class:`~music21.note.GeneralNote`) found by `.recurse()`.
+
+        Reading `.beat` or `.beatStrength` for each note searches the contexts
+        for a TimeSignature and then looks up the beat in its MeterSequences.
+        This method instead finds the TimeSignatures once per Measure and
+        looks up each offset in each TimeSignature only once, so it is
+        much faster for metrical analysis of a whole score.
+
+        >>> s = converter.parse('tinynotation: 3/4 c4 d8 e f4 6/8 g8 a b c4.')
+        >>> for bm in s.computeBeats():
+        ...     print(bm.element.name, bm.beat, bm.beatStrength, bm.beatDuration.quarterLength)
+        C 1.0 1.0 1.0
+        D 2.0 0.5 1.0
+        E 2.5 0.25 1.0
+        F 3.0 0.5 1.0
+        G 1.0 1.0 1.5
+        A 4/3 0.25 1.5
+        B 5/3 0.25 1.5
+        C 2.0 0.5 1.5
+
+        The values are the same as those of the elements' own properties:
+
+        >>> [(n.beat, n.beatStrength) for n in s.recurse().notes] == [
+        ...     (bm.beat, bm.beatStrength) for bm in s.computeBeats()]
+        True
+
+        Elements that are not in Measures get their values one at a time
+        from their properties, as do Streams (whose beat is always None):
+
+        >>> s2 = stream.Stream([meter.TimeSignature('2/4'), note.Note(), note.Note()])
+        >>> [bm.beat for bm in s2.computeBeats()]
+        [1.0, 2.0]
+
+        * New in v11.
+        '''
+        post: list[BeatMap] = []
+        # id of Measure -> (sorted offsets, TimeSignatures, TimeSignature in context)
+        measureMeters: dict[int, tuple[list[OffsetQL], list[meter.TimeSignature],
+                                       meter.TimeSignature|None]] = {}
+        # the last Measure looked at and the TimeSignature in effect at its end.
+        previousMeasure: list = [None, None]
+        # id of Stream -> id of Measure -> the Measure before it in that Stream
+        measuresBefore: dict[int, dict[int, Measure|None]] = {}
+        tsMeasureOffsets: dict[int, OffsetQL] = {}
+        # (id of TimeSignature, position in meter) -> (beat, beatStrength, beatDuration)
+        beatValues: dict[tuple[int, OffsetQL], tuple] = {}
+
+        def measureBefore(m: Measure) -> Measure|None:
+            site = m.activeSite
+            try:
+                before = measuresBefore[id(site)]
+            except KeyError:
+                before = {}
+                lastM = None
+                for otherM in site.getElementsByClass(Measure):
+                    before[id(otherM)] = lastM
+                    lastM = otherM
+                measuresBefore[id(site)] = before
+            return before.get(id(m))
+
+        def metersForMeasure(m: Measure):
+            try:
+                return measureMeters[id(m)]
+            except KeyError:
+                pass
+            found = [(m.elementOffset(ts), ts)
+                     for ts in m.getElementsByClass(meter.TimeSignature)]
+            for v in m.voices:
+                vOffset = m.elementOffset(v)
+                found.extend(
+                    (opFrac(vOffset + v.elementOffset(ts)), ts)
+                    for ts in v.getElementsByClass(meter.TimeSignature)
+                )
+            found.sort(key=lambda ots: ots[0])
+            contextTs = None
+            if not found or found[0][0] != 0.0:
+                prevM, prevTs = previousMeasure
+                if (prevM is not None
+                        and m.activeSite is not None
+                        and measureBefore(m) is prevM):
+                    # the next Measure in the same Part: no need to search.
+                    # (Measures without matching elements are never looked at,
+                    # so a TimeSignature in one of them would be missed if prevM
+                    # were any earlier.)
+                    contextTs = prevTs
+                else:
+                    contextTs = m.getContextByClass(
+                        meter.TimeSignature,
+                        getElementMethod=ElementSearch.AT_OR_BEFORE_OFFSET
+                    )
+            previousMeasure[:] = [m, found[-1][1] if found else contextTs]
+            measureMeters[id(m)] = ([o for o, unused_ts in found],
+                                    [ts for unused_o, ts in found],
+                                    contextTs)
+            return measureMeters[id(m)]
+
+        for el in self.recurse().getElementsByClass(classFilter):
+            container = el.activeSite
+            if container is None or el.isStream:
+                post.append(BeatMap(el, el.beat, el.beatStrength, el.beatDuration))
+                continue
+
+            elOffset = container.elementOffset(el)
+            if isinstance(container, Measure):
+                m = container
+                position = elOffset
+                measureOffset = elOffset
+                if m.paddingLeft:
+                    measureOffset = opFrac(measureOffset + m.paddingLeft)
+            elif isinstance(container, Voice) and isinstance(container.activeSite, Measure):
+                m = container.activeSite
+                position = opFrac(m.elementOffset(container) + elOffset)
+                # like ._getMeasureOffset(), which cannot find elements in Voices
+                # in their Measure, and so uses the offset in the Voice.
+                measureOffset = elOffset
+            else:
+                post.append(BeatMap(el, el.beat, el.beatStrength, el.beatDuration))
+                continue
+
+            offsets, timeSignatures, contextTs = metersForMeasure(m)
+            i = bisect.bisect_right(offsets, position)
+            ts = timeSignatures[i - 1] if i else contextTs
+            if ts is None:
+                post.append(BeatMap(el, float('nan'), float('nan'), duration.Duration(0)))
+                continue
+
+            try:
+                tsMeasureOffset = tsMeasureOffsets[id(ts)]
+            except KeyError:
+                tsMeasureOffset = ts._getMeasureOffset(includeMeasurePadding=False)
+                tsMeasureOffsets[id(ts)] = tsMeasureOffset
+
+            # see TimeSignature.getMeasureOffsetOrMeterModulusOffset()
+            barQL = ts.barDuration.quarterLength
+            if opFrac(measureOffset + tsMeasureOffset) < barQL:
+                meterPosition = measureOffset
+            else:
+                meterPosition = opFrac((measureOffset - tsMeasureOffset) % barQL)
+
+            valuesKey = (id(ts), meterPosition)
+            try:
+                values = beatValues[valuesKey]
+            except KeyError:
+                values = (ts.getBeatProportion(meterPosition),
+                          ts.getAccentWeight(meterPosition,
+                                             forcePositionMatch=True,
+                                             permitMeterModulus=False),
+                          ts.getBeatDuration(meterPosition))
+                beatValues[valuesKey] = values
+            post.append(BeatMap(el, *values))
+        return post
+
     # --------------------------------------------------------------------------
     # transformations
 
@@ -9341,6 +10506,8 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         * Changed in v7:
            - `recurse` defaults False
            - look-ahead approach to choosing divisors to avoid gaps when processing durations
+        * Changed in v11: the offsets, then the durations, of all the elements of
+          each Stream are matched to the divisors at once, with NumPy.
 
         >>> n = note.Note()
         >>> n.quarterLength = 0.49
@@ -9442,44 +10609,6 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         # this presently is not trying to avoid overlaps that
         # result from quantization; this may be necessary
 
-        def bestMatch(
-            target,
-            divisors,
-            zeroAllowed=True,
-            gapToFill=0.0
-        ) -> BestQuantizationMatch:
-            found: list[BestQuantizationMatch] = []
-            for div in divisors:
-                tick = 1 / div  # divisor expressed as QL, e.g. 0.25
-                match, error, signedErrorInner = common.nearestMultiple(target, tick)
-                if not zeroAllowed and match == 0.0:
-                    match = tick
-                    signedErrorInner = round(target - match, 7)
-                    error = abs(signedErrorInner)
-                if gapToFill % tick == 0:
-                    remainingGap = 0.0
-                else:
-                    remainingGap = max(gapToFill - match, 0.0)
-                # Sort by remainingGap, then unsigned error, then tick
-                found.append(
-                    BestQuantizationMatch(
-                        remainingGap, error, tick, match, signedErrorInner, div))
-            # get smallest remainingGap, error, tick
-            bestMatchTuple = min(found)
-            return bestMatchTuple
-
-        def findNextElementNotCoincident(
-            useStream: Stream,
-            startIndex: int,
-            startOffset: OffsetQL,
-        ) -> tuple[base.Music21Object|None, BestQuantizationMatch|None]:
-            for next_el in useStream._elements[startIndex:]:
-                next_offset = useStream.elementOffset(next_el)
-                look_ahead_result = bestMatch(float(next_offset), quarterLengthDivisors)
-                if look_ahead_result.match > startOffset:
-                    return next_el, look_ahead_result
-            return None, None
-
         if not inPlace:
             returnStream = self.coreCopyAsDerivation('quantize')
         else:
@@ -9492,54 +10621,106 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         for useStream in useStreams:
             # coreSetElementOffset() will immediately set isSorted = False,
             # but we need to know if the stream was originally sorted to know
-            # if it's worth "looking ahead" to the next offset. If a stream
-            # is unsorted originally, this "looking ahead" could become O(n^2).
+            # if it's worth "looking ahead" to the next offset.
             originallySorted = useStream.isSorted
+            elements = list(useStream._elements)
             rests_lacking_durations: list[note.Rest] = []
-            for i, e in enumerate(useStream._elements):
+            if not elements:
+                useStream.coreElementsChanged(updateIsFlat=False)
+                continue
+
+            with useStream.batchEdit():
                 if processOffsets:
-                    o = useStream.elementOffset(e)
-                    sign = 1
-                    if o < 0:
-                        sign = -1
-                        o = -1 * o
-                    o_matchTuple = bestMatch(float(o), quarterLengthDivisors)
-                    o = o_matchTuple.match * sign
-                    useStream.coreSetElementOffset(e, o)
-                    if hasattr(e, 'editorial') and o_matchTuple.signedError != 0:
-                        e.editorial.offsetQuantizationError = o_matchTuple.signedError * sign
+                    offsets = [useStream.elementOffset(e) for e in elements]
+                    offsetMatches, offsetErrors = _bestQuantizationMatches(
+                        [abs(float(o)) for o in offsets], quarterLengthDivisors)
+                    quantizedOffsets = []
+                    for e, o, match, signedError in zip(
+                            elements, offsets, offsetMatches, offsetErrors):
+                        sign = -1 if o < 0 else 1
+                        newOffset = match * sign
+                        useStream.coreSetElementOffset(e, newOffset)
+                        quantizedOffsets.append(newOffset)
+                        if hasattr(e, 'editorial') and signedError != 0:
+                            e.editorial.offsetQuantizationError = signedError * sign
+
                 if processDurations:
-                    ql = e.duration.quarterLength
-                    ql = max(ql, 0)  # negative ql possible in buggy MIDI files?
-                    zeroAllowed = not isinstance(e, note.NotRest) or e.duration.isGrace
+                    quarterLengths = []
+                    zeroAllowed = []
+                    for e in elements:
+                        # negative ql possible in buggy MIDI files?
+                        quarterLengths.append(float(max(e.duration.quarterLength, 0)))
+                        zeroAllowed.append(not isinstance(e, note.NotRest)
+                                           or e.duration.isGrace)
+                    gapsToFill = None
                     if processOffsets and originallySorted:
-                        next_element, look_ahead_result = (
-                            findNextElementNotCoincident(
-                                useStream=useStream, startIndex=i + 1, startOffset=o))
-                        if next_element is not None and look_ahead_result is not None:
-                            gapToFill = opFrac(look_ahead_result.match - e.offset)
-                            d_matchTuple = bestMatch(
-                                float(ql), quarterLengthDivisors, zeroAllowed, gapToFill)
+                        # the duration of each element is quantized so as to
+                        # fill the gap to the next element not at its own offset.
+                        gapsToFill = []
+                        nextIndices = self._quantizeNextIndices(offsetMatches,
+                                                                quantizedOffsets)
+                        for e, j in zip(elements, nextIndices):
+                            if j is None:
+                                gapsToFill.append(0.0)
+                            else:
+                                gapsToFill.append(float(opFrac(
+                                    offsetMatches[j] - useStream.elementOffset(e))))
+                    durationMatches, durationErrors = _bestQuantizationMatches(
+                        quarterLengths,
+                        quarterLengthDivisors,
+                        zeroAllowed=zeroAllowed,
+                        gapsToFill=gapsToFill,
+                    )
+                    for e, match, signedError in zip(elements, durationMatches, durationErrors):
+                        if match == 0 and isinstance(e, note.Rest):
+                            rests_lacking_durations.append(e)
                         else:
-                            d_matchTuple = bestMatch(float(ql), quarterLengthDivisors, zeroAllowed)
-                    else:
-                        d_matchTuple = bestMatch(float(ql), quarterLengthDivisors, zeroAllowed)
-                    if d_matchTuple.match == 0 and isinstance(e, note.Rest):
-                        rests_lacking_durations.append(e)
-                    else:
-                        e.duration.quarterLength = d_matchTuple.match
-                        if hasattr(e, 'editorial') and d_matchTuple.signedError != 0:
-                            e.editorial.quarterLengthQuantizationError = d_matchTuple.signedError
+                            e.duration.quarterLength = match
+                            if hasattr(e, 'editorial') and signedError != 0:
+                                e.editorial.quarterLengthQuantizationError = signedError
 
-            # end for e in ._elements
             # ran coreSetElementOffset
             useStream.coreElementsChanged(updateIsFlat=False)
 
-            useStream.remove(rests_lacking_durations)
+            useStream._removeRecurseMany(rests_lacking_durations)
 
         if not inPlace:
             return returnStream
 
+    @staticmethod
+    def _quantizeNextIndices(
+        offsetMatches: list[float],
+        quantizedOffsets: list[float],
+    ) -> list[int|None]:
+        '''
+        For each element in a sorted Stream being quantized, return the index
+        of the next element whose quantized offset (`offsetMatches`, unsigned)
+        is later than the element's own (`quantizedOffsets`), or None
+        if there is none.
+
+        >>> stream.Stream._quantizeNextIndices([0.0, 0.0, 0.5, 1.0, 1.0], [0.0, 0.0, 0.5, 1.0, 1.0])
+        [2, 2, 3, None, None]
+        '''
+        import numpy as np
+
+        numElements = len(offsetMatches)
+        matchArray = np.asarray(offsetMatches, dtype=np.float64)
+        if numElements < 2 or np.all(matchArray[1:] >= matchArray[:-1]):
+            # the usual case: quantizing kept the order, so search the matches
+            found = np.searchsorted(matchArray, quantizedOffsets, side='right')
+            found = np.maximum(found, np.arange(1, numElements + 1))
+            return [int(j) if j < numElements else None for j in found]
+
+        post: list[int|None] = []
+        for i, o in enumerate(quantizedOffsets):
+            for j in range(i + 1, numElements):
+                if offsetMatches[j] > o:
+                    post.append(j)
+                    break
+            else:
+                post.append(None)
+        return post
+
     def expandRepeats(self, copySpanners: bool = True) -> t.Self:
         '''
         Expand this Stream with repeats. Nested repeats
@@ -9586,6 +10767,31 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
 
         return post
 
+    def unrolledView(self) -> repeat.UnrolledView:
+        '''
+        Return a :class:`~music21.repeat.UnrolledView` of this Stream:
+        its measures in the order they are played with all repeats expanded,
+        each with the offset it would have after :meth:`expandRepeats`,
+        but without copying any measure or anything in it.
+
+        >>> p = converter.parse('tinynotation: 2/4 c2 d2 e2')
+        >>> p.makeMeasures(inPlace=True)
+        >>> p.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> view = p.unrolledView()
+        >>> [(offset, m.number) for offset, m in view.items()]
+        [(0.0, 1), (2.0, 2), (4.0, 1), (6.0, 2), (8.0, 3)]
+
+        Only the elements at the Measure level are expanded.  For a Score,
+        get a view of each of its Parts.
+
+        * New in v11.
+        '''
+        if not self.hasMeasures():
+            raise StreamException(
+                'cannot process repeats on Stream that does not contain measures'
+            )
+        return repeat.UnrolledView(self)
+
     # --------------------------------------------------------------------------
     # slicing and recasting a note as many notes
 
@@ -10217,6 +11423,41 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
                 post.extend(list(e.pitches))
         return post
 
+    def toNoteTable(
+        self,
+        *,
+        expandChords: bool = True,
+        ties: t.Literal['keep', 'merge'] = 'keep',
+    ):
+        '''
+        Return a NumPy structured array (a "note table") with one row for each
+        Note (or pitch of a Chord) in this Stream, at any level, and the fields
+        `offset`, `quarterLength`, `midi`, `part`, `tie`, and `velocity`.
+        Working with the columns of the table is much faster than working
+        with the notes themselves for large-scale analysis.
+
+        >>> bach = corpus.parse('bach/bwv66.6')
+        >>> table = bach.toNoteTable()
+        >>> len(table)
+        165
+        >>> float(table['quarterLength'].sum())
+        144.0
+
+        The lowest note of the bass part:
+
+        >>> bass = table[table['part'] == 3]
+        >>> bass[bass['midi'].argmin()].tolist()
+        (11.0, 1.0, 42, 3, 0, -1)
+
+        If `expandChords` is False, each Chord gets one row (for its lowest pitch),
+        and if `ties` is 'merge', tied notes are merged into one row.
+        See :func:`~music21.stream.noteTable.toNoteTable` for details, and
+        :func:`~music21.stream.noteTable.fromNoteTable` for going back to a Stream.
+
+        * New in v11.
+        '''
+        return noteTable.toNoteTable(self, expandChords=expandChords, ties=ties)
+
     # --------------------------------------------------------------------------
     # interval routines
     @overload
@@ -11193,9 +12434,13 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
         voices = []
         for dummy in range(maxVoiceCount):
             voices.append(Voice())  # add voice classes
+        # the highestTime of each voice, kept here rather than asking
+        # each voice to recompute it after every insert
+        voiceHighestTimes: list[OffsetQL] = [0.0] * maxVoiceCount
 
         # iterate through all elements; if not in an overlap, place in
         # voice 1, otherwise, distribute
+        moved = []
         for e in returnObj.notes:
             o = e.getOffsetBySite(returnObj)
             # cannot match here by offset, as olDict keys are representative
@@ -11205,12 +12450,15 @@ class Stream[M21ObjType: base.Music21Object](core.StreamCore):
             # find a voice to place in
             # as elements are sorted, can use the highest time
             # else:
-            for v in voices:
-                if v.highestTime <= o:
+            for i, v in enumerate(voices):
+                if voiceHighestTimes[i] <= o:
                     v.insert(o, e)
+                    voiceHighestTimes[i] = opFrac(
+                        max(voiceHighestTimes[i], o + e.duration.quarterLength))
                     break
-            # remove from source
-            returnObj.remove(e)
+            moved.append(e)
+        # remove from source, all at once
+        returnObj._removeRecurseMany(moved)
         # remove any unused voices (possible if overlap group has sus)
         for v in voices:
             if v:  # skip empty voices
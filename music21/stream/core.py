@@ -22,12 +22,14 @@ All functions here will eventually begin with `.core`.
 '''
 from __future__ import annotations
 
+import bisect
+from collections.abc import Iterable
 import copy
 from fractions import Fraction
 import typing as t
 import unittest
 
-from music21.base import Music21Object
+from music21.base import Music21Object, contextCache
 from music21.common.enums import OffsetSpecial
 from music21.common.numberTools import opFrac
 from music21.common.types import OffsetQL, OffsetQLSpecial, M21ObjType
@@ -41,11 +43,447 @@ if t.TYPE_CHECKING:
     from music21.stream import Stream
 
 
+class OffsetIndex(t.NamedTuple):
+    '''
+    A sorted index of the offsets of the `_elements` of a sorted Stream, along with
+    the running maximum of their end times, so that offset-range queries can
+    use binary search instead of checking every element.
+
+    Created and cached by :meth:`~music21.stream.core.StreamCore.coreOffsetIndex`;
+    the positions in each list are the same as the positions in `_elements`.
+
+    >>> s = stream.Stream()
+    >>> s.insert(0, note.Note(type='whole'))
+    >>> s.insert(1, note.Note())
+    >>> s.insert(3, note.Note(type='half'))
+    >>> oi = s.coreOffsetIndex()
+    >>> oi
+    OffsetIndex(offsets=[0.0, 1.0, 3.0], maxEndTimes=[4.0, 4.0, 5.0])
+
+    The first element whose offset is at or after 1.0:
+
+    >>> oi.firstIndexAtOrAfter(1.0)
+    1
+
+    The first element that might still be sounding at 2.0:
+
+    >>> oi.firstIndexEndingAtOrAfter(2.0)
+    0
+
+    The number of elements that begin at or before 2.0:
+
+    >>> oi.numberAtOrBefore(2.0)
+    2
+    >>> oi.numberAtOrBefore(1.0, includeOffset=False)
+    1
+    '''
+    offsets: list[OffsetQL]
+    maxEndTimes: list[OffsetQL]
+
+    def firstIndexAtOrAfter(self, offset: OffsetQL) -> int:
+        '''
+        Return the index of the first element beginning at or after `offset`.
+        '''
+        return bisect.bisect_left(self.offsets, offset)
+
+    def firstIndexEndingAtOrAfter(self, offset: OffsetQL) -> int:
+        '''
+        Return the index of the first element that could end at or after `offset`;
+        every element before it ends before `offset`.
+        '''
+        return bisect.bisect_left(self.maxEndTimes, offset)
+
+    def numberAtOrBefore(self, offset: OffsetQL, *, includeOffset: bool = True) -> int:
+        '''
+        Return the number of elements beginning at or before `offset`
+        (or strictly before it if `includeOffset` is False).
+        '''
+        if includeOffset:
+            return bisect.bisect_right(self.offsets, offset)
+        return bisect.bisect_left(self.offsets, offset)
+
+
+class ClassIndex:
+    '''
+    A per-Stream index from class lists (as used by
+    :class:`~music21.stream.filters.ClassFilter`) to the positions in
+    `_elements` of the elements that match them.
+
+    Each class list is looked up with one pass through the elements the first time
+    it is requested; after that, elements added at the end of `_elements` by
+    `coreInsert` or `coreAppend` are added to every list already in the index, so
+    building up a Stream does not throw away the index.
+
+    Created and cached by :meth:`~music21.stream.core.StreamCore.coreClassIndex`.
+
+    >>> s = stream.Stream()
+    >>> s.append([note.Note(), note.Rest(), note.Note()])
+    >>> ci = s.coreClassIndex()
+    >>> ci
+    <music21.stream.core.ClassIndex 3 elements, 0 class lists>
+    >>> ci.positionsFor(('Note',), s._elements)
+    [0, 2]
+    >>> ci.positionsFor((note.GeneralNote,), s._elements)
+    [0, 1, 2]
+    >>> ci
+    <music21.stream.core.ClassIndex 3 elements, 2 class lists>
+
+    >>> s.append(note.Note())
+    >>> s.coreClassIndex() is ci
+    True
+    >>> ci.positionsFor(('Note',), s._elements)
+    [0, 2, 3]
+    '''
+    __slots__ = ('numElements', 'positions')
+
+    def __init__(self, numElements: int = 0) -> None:
+        # the number of elements in `_elements` that the index accounts for
+        self.numElements: int = numElements
+        self.positions: dict[tuple, list[int]] = {}
+
+    def __repr__(self) -> str:
+        return (f'<{self.__module__}.{self.__class__.__name__} '
+                f'{self.numElements} elements, {len(self.positions)} class lists>')
+
+    def positionsFor(self, classList: tuple, elements: list[Music21Object]) -> list[int]:
+        '''
+        Return the (sorted) list of positions in `elements` whose classSet
+        intersects `classList`.  The returned list is owned by the index and
+        should not be changed.
+        '''
+        try:
+            return self.positions[classList]
+        except KeyError:
+            pass
+        positions = [i for i, e in enumerate(elements)
+                     if not e.classSet.isdisjoint(classList)]
+        self.positions[classList] = positions
+        return positions
+
+    def positionsForAll(self,
+                        classLists: Iterable[tuple],
+                        elements: list[Music21Object]) -> list[int]:
+        '''
+        Return the sorted list of positions in `elements` that match every one
+        of `classLists` (as `positionsFor` does for a single class list).
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note(), note.Rest(), chord.Chord('C E')])
+        >>> ci = s.coreClassIndex()
+        >>> ci.positionsForAll([('GeneralNote',), ('NotRest',)], s._elements)
+        [0, 2]
+        '''
+        positions: list[int]|None = None
+        for classList in classLists:
+            classPositions = self.positionsFor(classList, elements)
+            if positions is None:
+                positions = classPositions
+            else:
+                classPositionSet = set(classPositions)
+                positions = [p for p in positions if p in classPositionSet]
+        return positions if positions is not None else list(range(len(elements)))
+
+    def addElement(self, element: Music21Object) -> None:
+        '''
+        Account for `element` having been appended to the end of `_elements`.
+        '''
+        position = self.numElements
+        classSet = element.classSet
+        for classList, positions in self.positions.items():
+            if not classSet.isdisjoint(classList):
+                positions.append(position)
+        self.numElements = position + 1
+
+
+class IncrementalFlatten:
+    '''
+    Keeps track of where each element of a flattened Stream came from, so that
+    when a Stream in the hierarchy changes, only the elements it contains need
+    to be added to, moved within, or removed from the flattened Stream instead
+    of flattening everything again.
+
+    Created and cached by :meth:`~music21.stream.Stream.flatten` when called with
+    `incremental=True`.  The result of patching is always the same as flattening
+    from scratch.
+
+    >>> m1 = stream.Measure([note.Note('C', type='whole')], number=1)
+    >>> m2 = stream.Measure([note.Note('D', type='whole')], number=2)
+    >>> p = stream.Part([m1, m2])
+    >>> pf = p.flatten(incremental=True)
+    >>> flatRecord = p._cache['incrementalFlatten']['flatten']
+    >>> flatRecord
+    <music21.stream.core.IncrementalFlatten of 3 Streams, 0 changed>
+    >>> flatRecord.flatStream is pf
+    True
+
+    Changing a measure notes it in the record...
+
+    >>> m2.insert(2, note.Note('E'))
+    >>> flatRecord
+    <music21.stream.core.IncrementalFlatten of 3 Streams, 1 changed>
+
+    ...and flattening again only looks at the elements of that measure:
+
+    >>> p.flatten(incremental=True) is pf
+    True
+    >>> pf.show('text')
+    {0.0} <music21.note.Note C>
+    {4.0} <music21.note.Note D>
+    {6.0} <music21.note.Note E>
+    '''
+    __slots__ = ('srcStream', 'flatStream', 'retainContainers', 'isValid',
+                 'contents', 'streams', 'parents', 'startOffsets', 'changed')
+
+    def __init__(self,
+                 srcStream: Stream,
+                 flatStream: Stream,
+                 *,
+                 retainContainers: bool = False) -> None:
+        self.srcStream = srcStream
+        self.flatStream = flatStream
+        self.retainContainers = retainContainers
+        # becomes False if something (such as the same object appearing twice in the
+        # hierarchy) means that the flat Stream must be created from scratch.
+        self.isValid: bool = True
+
+        # for each Stream in the hierarchy (by id), its elements in order
+        # (by id), with the offset of each in the Stream.
+        self.contents: dict[int, dict[int, tuple[Music21Object, OffsetQL]]] = {}
+        self.streams: dict[int, Stream] = {}
+        self.parents: dict[int, int|None] = {}
+        # offset of the beginning of each Stream in the hierarchy
+        self.startOffsets: dict[int, OffsetQL] = {}
+        # ids of Streams whose elements have changed since the last update.
+        self.changed: set[int] = set()
+
+    def __repr__(self) -> str:
+        return (f'<{self.__module__}.{self.__class__.__name__} '
+                f'of {len(self.streams)} Streams, {len(self.changed)} changed>')
+
+    def build(self) -> None:
+        '''
+        Put all the elements of the hierarchy into the (empty) flat Stream
+        in the same way that :meth:`~music21.stream.Stream.flatten` does.
+        '''
+        srcStream = self.srcStream
+        srcId = id(srcStream)
+        self.streams[srcId] = srcStream
+        self.parents[srcId] = None
+        self.startOffsets[srcId] = 0.0
+        self.contents[srcId] = self._readContents(srcStream)
+        for e, offset in self.contents[srcId].values():
+            self._addTree(e, srcId, offset)
+        self._finish(sortAll=True)
+        self.changed.clear()
+
+    def update(self) -> None:
+        '''
+        Patch the flat Stream for everything that has changed since the last
+        update or build.  If the flat Stream cannot be patched, `isValid` becomes
+        False and the flat Stream should be thrown away.
+        '''
+        streams = self.streams
+        parents = self.parents
+
+        toCheck = {sId for sId in self.changed if sId in streams}
+        # Streams whose highestTime may have changed move their elements stored at the end.
+        for sId in list(toCheck):
+            parentId = parents[sId]
+            while parentId is not None:
+                if streams[parentId]._endElements:
+                    toCheck.add(parentId)
+                parentId = parents[parentId]
+
+        def depth(sId: int) -> int:
+            d = 0
+            parentId = parents[sId]
+            while parentId is not None:
+                d += 1
+                parentId = parents[parentId]
+            return d
+
+        if not toCheck:
+            self.changed.clear()
+            return
+
+        flatStream = self.flatStream
+        sortAll = not flatStream.isSorted
+        removedIds: set[int] = set()
+        moved: dict[int, Music21Object] = {}
+        toAdd: list[tuple[Music21Object, int, OffsetQL]] = []
+
+        # first take out everything that has been removed and move what has moved,
+        # from the top of the hierarchy down, so that an element moved from one
+        # Stream to another is never in the flat Stream twice.
+        for sId in sorted(toCheck, key=depth):
+            if sId not in streams:  # already removed along with its container
+                continue
+            oldContents = self.contents[sId]
+            oldOrder = list(oldContents)
+            newContents = self._readContents(streams[sId])
+            keptOrder = []
+            for eId, (e, offset) in newContents.items():
+                oldEntry = oldContents.pop(eId, None)
+                if oldEntry is None:
+                    toAdd.append((e, sId, offset))
+                    continue
+                keptOrder.append(eId)
+                if oldEntry[1] != offset:
+                    self._moveTree(e, sId, offset, moved)
+            for e, unused_offset in oldContents.values():
+                self._removeTree(e, removedIds)
+            if keptOrder != [eId for eId in oldOrder if eId not in oldContents]:
+                # a Stream was reordered, so the insert order of the rest has changed.
+                sortAll = True
+            self.contents[sId] = newContents
+
+        for eId in removedIds:
+            # moved along with its container, then removed from it.
+            moved.pop(eId, None)
+        if removedIds or moved:
+            flatStream._elements = [e for e in flatStream._elements
+                                    if id(e) not in removedIds and id(e) not in moved]
+        numKept = len(flatStream._elements)
+        for e, sId, offset in toAdd:
+            self._addTree(e, sId, offset)
+        if not self.isValid:
+            return
+
+        if toAdd or moved:
+            self._assignInsertIndices()
+        if sortAll or not self.srcStream.autoSort:
+            self._finish(sortAll=True)
+        else:
+            toPlace = flatStream._elements[numKept:]
+            del flatStream._elements[numKept:]
+            toPlace.extend(moved.values())
+            self._finish(sortAll=False, toPlace=toPlace)
+        self.changed.clear()
+
+    def _elementsInOrder(self) -> list[Music21Object]:
+        '''
+        Return the elements of the flat Stream in the order in which flattening
+        from scratch would insert them.
+        '''
+        post: list[Music21Object] = []
+        retainContainers = self.retainContainers
+        contents = self.contents
+
+        def addContents(sId: int) -> None:
+            for e, unused_offset in contents[sId].values():
+                if e.isStream:
+                    if retainContainers:
+                        post.append(e)
+                    addContents(id(e))
+                else:
+                    post.append(e)
+
+        addContents(id(self.srcStream))
+        return post
+
+    def _assignInsertIndices(self) -> None:
+        # the insertIndex of the sortTuple breaks ties in the same order as
+        # a flat Stream created from scratch.
+        flatId = id(self.flatStream)
+        for i, e in enumerate(self._elementsInOrder()):
+            e.sites.siteDict[flatId].globalSiteIndex = i
+
+    def _finish(self,
+                *,
+                sortAll: bool,
+                toPlace: Iterable[Music21Object] = ()) -> None:
+        flatStream = self.flatStream
+        if sortAll:
+            flatStream._elements = self._elementsInOrder()
+            if self.srcStream.autoSort:
+                flatStream.isSorted = False
+                flatStream.sort()
+            else:
+                flatStream.coreElementsChanged()
+            return
+
+        def sortKey(e: Music21Object):
+            return e.sortTuple(flatStream)
+
+        flatElements = flatStream._elements
+        for e in toPlace:
+            bisect.insort(flatElements, e, key=sortKey)
+        flatStream.coreElementsChanged(updateIsFlat=False, clearIsSorted=False)
+        flatStream.isSorted = True
+
+    @staticmethod
+    def _readContents(s: Stream) -> dict[int, tuple[Music21Object, OffsetQL]]:
+        # .elements sorts the Stream if need be, as RecursiveIterator does.
+        return {id(e): (e, s.elementOffset(e)) for e in s.elements}
+
+    def _addTree(self, e: Music21Object, parentId: int, offset: OffsetQL) -> None:
+        startOffset = self.startOffsets[parentId] + offset
+        flatStream = self.flatStream
+        if e.isStream:
+            eId = id(e)
+            if eId in self.streams:
+                self.isValid = False
+                return
+            eStream = t.cast('Stream', e)
+            self.streams[eId] = eStream
+            self.parents[eId] = parentId
+            self.startOffsets[eId] = startOffset
+            if self.retainContainers:
+                flatStream.coreInsert(opFrac(startOffset), e, setActiveSite=False, ignoreSort=True)
+            contents = self._readContents(eStream)
+            self.contents[eId] = contents
+            for sub, subOffset in contents.values():
+                self._addTree(sub, eId, subOffset)
+        else:
+            if id(e) in flatStream._offsetDict:
+                self.isValid = False
+                return
+            flatStream.coreInsert(opFrac(startOffset), e, setActiveSite=False, ignoreSort=True)
+
+    def _moveTree(self,
+                  e: Music21Object,
+                  parentId: int,
+                  offset: OffsetQL,
+                  moved: dict[int, Music21Object]) -> None:
+        startOffset = self.startOffsets[parentId] + offset
+        flatStream = self.flatStream
+        eId = id(e)
+        if e.isStream:
+            self.startOffsets[eId] = startOffset
+            if self.retainContainers:
+                flatStream.coreSetElementOffset(e, startOffset)
+                moved[eId] = e
+            for sub, subOffset in self.contents[eId].values():
+                self._moveTree(sub, eId, subOffset, moved)
+        else:
+            flatStream.coreSetElementOffset(e, startOffset)
+            moved[eId] = e
+
+    def _removeTree(self, e: Music21Object, removedIds: set[int]) -> None:
+        eId = id(e)
+        if e.isStream:
+            for sub, unused_offset in self.contents.pop(eId).values():
+                self._removeTree(sub, removedIds)
+            del self.streams[eId]
+            del self.parents[eId]
+            del self.startOffsets[eId]
+            if not self.retainContainers:
+                return
+        flatStream = self.flatStream
+        del flatStream._offsetDict[eId]
+        e.sites.remove(flatStream)
+        removedIds.add(eId)
+
+
 class StreamCore(Music21Object):
     '''
     Core aspects of a Stream's behavior.  Any of these can change at any time.
     Users are encouraged only to create stream.Stream objects.
     '''
+    # set by Stream.freeze(); a class attribute so that Streams
+    # pickled before it existed are not frozen.
+    _frozen: bool = False
+
     def __init__(self, **keywords) -> None:
         super().__init__(**keywords)
         # hugely important -- keeps track of where the _elements are
@@ -65,6 +503,10 @@ class StreamCore(Music21Object):
         # should isFlat become readonly?
         self.isFlat = True  # does it have no embedded Streams
 
+        # used by Stream.batchEdit() to postpone the work of coreElementsChanged
+        self._batchEditDepth: int = 0
+        self._batchEditUpdateIsFlat: bool = False
+
         # someday
         # self._elementTree = tree.trees.ElementTree(source=self)
 
@@ -130,6 +572,7 @@ class StreamCore(Music21Object):
         # need to explicitly set the activeSite of the element
         # will be sorted later if necessary
         self._elements.append(element)
+        self.coreUpdateClassIndex(element)
         # self._elementTree.insert(float(offset), element)
         return storeSorted
 
@@ -157,6 +600,7 @@ class StreamCore(Music21Object):
         if setActiveSite:
             self.coreSelfActiveSite(element)
         self._elements.append(element)
+        self.coreUpdateClassIndex(element)
 
         # Make this faster
         # self._elementTree.insert(self.highestTime, element)
@@ -193,6 +637,8 @@ class StreamCore(Music21Object):
         '''
         # Note: not documenting 'highestTime' is on purpose, since can only be done for
         # elements already stored at end.  Infinite loop.
+        if self._frozen:
+            raise ImmutableStreamException('Cannot move an element in a frozen Stream')
         try:
             # try first, for the general case of not OffsetSpecial.
             offset = opFrac(offset)  # type: ignore
@@ -215,6 +661,9 @@ class StreamCore(Music21Object):
         clearIsSorted: bool = True,
         memo: list[int]|None = None,
         keepIndex: bool = False,
+        keepClassIndex: bool = False,
+        keepContextCache: bool = False,
+        keepElementTree: bool = False,
     ) -> None:
         '''
         NB -- a "core" stream method that is not necessary for most users.
@@ -241,6 +690,30 @@ class StreamCore(Music21Object):
         >>> a.coreElementsChanged()
         >>> a.isFlat
         False
+
+        Unless `keepContextCache` is True (as when the elements have only been
+        sorted), the epoch of :data:`music21.base.contextCache` is moved forward,
+        so that results stored by `getContextByClass()` are thrown away.
+
+        If `keepClassIndex` is True, then the
+        :class:`~music21.stream.core.ClassIndex` is kept, which is only safe if
+        `_elements` has not been reordered and nothing has been removed from it
+        (elements added by `coreInsert` and `coreAppend` are accounted for).
+        The Streams that contain this Stream always keep their class indices,
+        since their own elements have not changed.
+
+        If `keepElementTree` is True, then the tree made by
+        :meth:`~music21.stream.core.StreamCore.coreElementTree` is kept, which
+        is only safe if the caller has kept it up to date
+        with :meth:`~music21.stream.core.StreamCore.coreUpdateElementTree`.
+
+        Flat Streams made by `.flatten(incremental=True)` are not thrown away;
+        instead their :class:`~music21.stream.core.IncrementalFlatten` records
+        note which Stream changed, so that they can be patched later.
+
+        Within a :meth:`~music21.stream.Stream.batchEdit` block, only the
+        Stream's own cache and sorting are updated; informing the Streams that
+        contain it and checking flatness wait until the block ends.
         '''
         # experimental
         if not getattr(self, '_mutable', True):
@@ -254,6 +727,9 @@ class StreamCore(Music21Object):
         if id(self) in memo:
             return
         memo.append(id(self))
+        if not keepContextCache:
+            # results stored by getContextByClass() might no longer be correct.
+            contextCache.epoch += 1
 
         # WHY??? THIS SEEMS OVERKILL, esp. since the first call to .sort() in .flatten() will
         # invalidate it! TODO: Investigate if this is necessary and then remove if not necessary
@@ -264,18 +740,32 @@ class StreamCore(Music21Object):
         # ancestor so that subsequent calls get a new representation of this derivation;
         # we can do that by calling coreElementsChanged on
         # the derivation.origin
-        if self._derivation is not None:
-            sdm = self._derivation.method
-            if sdm in ('flat', 'semiflat'):
-                origin: 'music21.stream.Stream' = t.cast('music21.stream.Stream',
-                                                         self._derivation.origin)
-                origin.clearCache()
-
-        # may not always need to clear cache of all living sites, but may
-        # always be a good idea since .flatten() has changed etc.
-        # should not need to do derivation.origin sites.
-        for livingSite in self.sites:
-            livingSite.coreElementsChanged(memo=memo)
+        # getattr in case of Streams pickled before batchEdit existed.
+        if getattr(self, '_batchEditDepth', 0):
+            # in the middle of batchEdit() -- the rest will be done at the end.
+            if updateIsFlat:
+                self._batchEditUpdateIsFlat = True
+            updateIsFlat = False
+        else:
+            if self._derivation is not None:
+                sdm = self._derivation.method
+                if sdm in ('flat', 'semiflat'):
+                    origin: 'music21.stream.Stream' = t.cast('music21.stream.Stream',
+                                                             self._derivation.origin)
+                    origin.clearCache()
+
+            # may not always need to clear cache of all living sites, but may
+            # always be a good idea since .flatten() has changed etc.
+            # should not need to do derivation.origin sites.
+            livingSites = self._sites if self._sites is not None else ()
+            for livingSite in livingSites:
+                if livingSite._frozen:
+                    # a Stream sharing its sites, such as a new flattened
+                    # Stream, changed; the frozen Stream itself cannot have.
+                    continue
+                livingSite.coreElementsChanged(memo=memo,
+                                               keepClassIndex=True,
+                                               keepContextCache=keepContextCache)
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -294,14 +784,249 @@ class StreamCore(Music21Object):
         # resetting the cache removes lowest and highest time storage
         # a slight performance optimization: not creating unless needed
         if self._cache:
+            # flatten(incremental=True) patches its flat Streams instead of
+            # throwing them away: memo[0] is the Stream whose elements changed.
+            incrementalFlatten = self._cache.get('incrementalFlatten', None)
+            if incrementalFlatten is not None:
+                for flatRecord in incrementalFlatten.values():
+                    flatRecord.changed.add(memo[0])
             indexCache = None
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
+            classIndex = None
+            if keepClassIndex:
+                classIndex = self._cache.get('classIndex', None)
+            elementTree = None
+            if keepElementTree:
+                elementTree = self._cache.get('elementTree', None)
             # always clear cache when elements have changed
             # for instance, Duration will change.
             self.clearCache()
             if keepIndex and indexCache is not None:
                 self._cache['index'] = indexCache
+            if classIndex is not None:
+                self._cache['classIndex'] = classIndex
+            if elementTree is not None:
+                self._cache['elementTree'] = elementTree
+            if incrementalFlatten is not None:
+                self._cache['incrementalFlatten'] = incrementalFlatten
+
+    def coreOffsetIndex(self) -> OffsetIndex|None:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns an :class:`~music21.stream.core.OffsetIndex` of the offsets and
+        running maximum end times of `_elements`.  The Stream is sorted first
+        if it uses autoSort; otherwise None is returned for an unsorted Stream
+        (in which case callers need to check every element).
+
+        The index is built lazily and stored in the cache, so it is thrown away
+        by :meth:`~music21.stream.core.StreamCore.coreElementsChanged`.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s.coreOffsetIndex().offsets
+        [0.0, 1.0, 2.0, 3.0]
+        >>> s.coreOffsetIndex() is s.coreOffsetIndex()
+        True
+        >>> s.append(note.Note())
+        >>> s.coreOffsetIndex().offsets
+        [0.0, 1.0, 2.0, 3.0, 4.0]
+
+        >>> s.autoSort = False
+        >>> s.insert(0, note.Note())
+        >>> s.coreOffsetIndex() is None
+        True
+        '''
+        if not self.isSorted:
+            if not self.autoSort:  # type: ignore
+                return None
+            self.sort()  # type: ignore
+        offsetIndex = self._cache.get('offsetIndex', None)
+        # a length check guards against coreInsert calls that have not yet
+        # been followed by coreElementsChanged.
+        if offsetIndex is not None and len(offsetIndex.offsets) == len(self._elements):
+            return offsetIndex
+
+        offsets: list[OffsetQL] = []
+        maxEndTimes: list[OffsetQL] = []
+        lastOffset: OffsetQL = 0.0
+        maxEnd: OffsetQL = 0.0
+        elementOffset = self.elementOffset  # type: ignore
+        for i, e in enumerate(self._elements):
+            o = elementOffset(e)
+            if i and o < lastOffset:
+                # sorted by something other than offset: cannot be indexed.
+                return None
+            end = opFrac(o + e.duration.quarterLength)
+            if not i or end > maxEnd:
+                maxEnd = end
+            offsets.append(o)
+            maxEndTimes.append(maxEnd)
+            lastOffset = o
+
+        offsetIndex = OffsetIndex(offsets, maxEndTimes)
+        self._cache['offsetIndex'] = offsetIndex
+        return offsetIndex
+
+    def coreClassIndex(self) -> ClassIndex:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns the :class:`~music21.stream.core.ClassIndex` for this Stream's
+        `_elements`, creating it if need be.  It is used by
+        :class:`~music21.stream.iterator.StreamIterator` to find the elements that
+        match class filters (as in `.getElementsByClass()` or `.notes`) without
+        checking every element.
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, clef.TrebleClef())
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> s.coreClassIndex().positionsFor(('Clef',), s._elements)
+        [0]
+        '''
+        classIndex = self._cache.get('classIndex', None)
+        if classIndex is None or classIndex.numElements != len(self._elements):
+            classIndex = ClassIndex(len(self._elements))
+            self._cache['classIndex'] = classIndex
+        return classIndex
+
+    def coreUpdateClassIndex(self, element: Music21Object) -> None:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Called after `element` has been appended to `_elements` to keep
+        the class index (if any) up to date.
+        '''
+        classIndex = self._cache.get('classIndex', None)
+        if classIndex is None:
+            return
+        if classIndex.numElements != len(self._elements) - 1:
+            # _elements was changed some other way.
+            del self._cache['classIndex']
+            return
+        classIndex.addElement(element)
+
+    def coreElementTree(self) -> tree.trees.OffsetTree:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns an :class:`~music21.tree.trees.OffsetTree` of the elements of this
+        Stream (but not those stored at the end) by their offsets in the Stream.
+        The Stream is sorted first if it uses autoSort.
+
+        The tree is built lazily and stored in the cache.  Like the other
+        indices it is thrown away by
+        :meth:`~music21.stream.core.StreamCore.coreElementsChanged`, unless the
+        Stream has :attr:`~music21.stream.Stream.treeStorage` set, in which
+        case `.insert()`, `.remove()`, `.pop()` and `.setElementOffset()` keep it up to date
+        as they go.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(type='half'), 4)
+        >>> s.insert(1, note.Rest())
+        >>> et = s.coreElementTree()
+        >>> et
+        <OffsetTree {5} (0.0 to 8.0) <music21.stream.Stream 0x...>>
+        >>> et.elementsStartingAt(1.0)
+        (<music21.note.Rest quarter>,)
+        >>> s.coreElementTree() is et
+        True
+
+        * New in v11.
+        '''
+        if not self.isSorted and self.autoSort:  # type: ignore
+            self.sort()  # type: ignore
+        elementTree = self._cache.get('elementTree', None)
+        if elementTree is not None:
+            if elementTree.rootNode is not None and 'elementTreeIndexed' not in self._cache:
+                # indices are not kept up to date by coreUpdateElementTree
+                elementTree.rootNode.updateIndices()
+            self._cache['elementTreeIndexed'] = True
+            return elementTree
+
+        elementOffset = self.elementOffset  # type: ignore
+        positionsAndElements = [(elementOffset(e), e) for e in self._elements]
+        if not self.isSorted:
+            positionsAndElements.sort(key=lambda pe: pe[0])
+        elementTree = tree.trees.OffsetTree(source=self)
+        elementTree.populateFromSortedList(positionsAndElements)
+        self._cache['elementTree'] = elementTree
+        self._cache['elementTreeIndexed'] = True
+        return elementTree
+
+    def coreUpdateElementTree(self,
+                              element: Music21Object,
+                              *,
+                              removed: bool = False) -> None:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Called after `element` has been added to `_elements` (or, if `removed` is True,
+        before its offset is removed from the Stream, after taking it out of `_elements`)
+        to keep the tree of :meth:`~music21.stream.core.StreamCore.coreElementTree`
+        (if any) up to date.  This takes O(log n) time, since only the
+        endTimes of the changed part of the tree are updated.
+        The caller then runs `coreElementsChanged(keepElementTree=True)`.
+
+        * New in v11.
+        '''
+        elementTree = self._cache.get('elementTree', None)
+        if elementTree is None:
+            return
+        offset = self._offsetDict[id(element)][0]
+        self._cache.pop('elementTreeIndexed', None)
+        if removed:
+            elementTree.removeElements(element, offset, runUpdate=False)
+        else:
+            elementTree.insert(offset, element, runUpdate=False)
+
+    def coreInsertInOrder(
+        self,
+        offset: OffsetQL,
+        element: Music21Object,
+        *,
+        setActiveSite=True
+    ) -> None:
+        '''
+        N.B. -- a "core" method, not to be used by general users.  Run .insert() instead.
+
+        Like :meth:`~music21.stream.core.StreamCore.coreInsert`, but puts the element
+        in its sorted place in `_elements` (found by binary search) and in the
+        tree from :meth:`~music21.stream.core.StreamCore.coreElementTree`,
+        so that a sorted Stream stays sorted without running `.sort()`.
+        Used by `.insert()` on Streams that have
+        :attr:`~music21.stream.Stream.treeStorage` set.
+
+        The Stream must be sorted.  The caller is responsible for calling
+        `coreElementsChanged(clearIsSorted=False, keepElementTree=True)` afterward.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> r = note.Rest()
+        >>> s.coreInsertInOrder(1.5, r)
+        >>> s.coreElementsChanged(clearIsSorted=False, keepElementTree=True)
+        >>> s.isSorted
+        True
+        >>> s.index(r)
+        2
+
+        * New in v11.
+        '''
+        if 'elementTree' not in self._cache:
+            self.coreElementTree()
+        self.coreSetElementOffset(
+            element,
+            offset,  # coreSetElementOffset will opFrac for us
+            addElement=True,
+            setActiveSite=setActiveSite
+        )
+        if not element.sites.hasSiteId(id(self)):
+            # an element moved within the Stream keeps its insertIndex.
+            element.sites.add(self)
+        selfStream = t.cast('Stream', self)
+        bisect.insort(self._elements, element, key=lambda e: e.sortTuple(selfStream))
+        self.coreUpdateElementTree(element)
 
     # core method that has to live in Stream itself for typing purposes.
     def coreCopyAsDerivation(self: M21ObjType,
@@ -405,6 +1130,8 @@ class StreamCore(Music21Object):
         object if this is what you intend.
 
         '''
+        if self._frozen:
+            raise ImmutableStreamException('Cannot add to a frozen Stream')
         if element is self:  # cannot add this Stream into itself
             raise StreamException('this Stream cannot be contained within itself')
         if not isinstance(element, Music21Object):
@@ -439,6 +1166,34 @@ class StreamCore(Music21Object):
         # all get() calls.
         element.purgeLocations()
 
+    def coreGuardBeforeAddElements(self, elements: Iterable[Music21Object]) -> None:
+        '''
+        Runs :meth:`~music21.stream.core.StreamCore.coreGuardBeforeAddElement`
+        on each element before any of them are added, so that nothing is
+        added if any of them cannot be.  Also checks that no element
+        appears twice.
+
+        Returns None or raises a StreamException
+
+        >>> s = stream.Stream()
+        >>> n = note.Note()
+        >>> s.coreGuardBeforeAddElements([note.Note(), n, note.Rest()])
+        >>> s.coreGuardBeforeAddElements([n, note.Rest(), n])
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: the object (<music21.note.Note C>, id()=...
+            appears more than once in the elements to add
+        '''
+        seen: set[int] = set()
+        for element in elements:
+            self.coreGuardBeforeAddElement(element)
+            idElement = id(element)
+            if idElement in seen:
+                raise StreamException(
+                    f'the object ({element!r}, id()={idElement}) '
+                    'appears more than once in the elements to add'
+                )
+            seen.add(idElement)
+
     def coreStoreAtEnd(self, element, setActiveSite=True):
         '''
         NB -- this is a "core" method.  General users should use .storeAtEnd() instead.
@@ -496,8 +1251,9 @@ class StreamCore(Music21Object):
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
         '''
-        hashedAttributes = hash((tuple(classList or ()), flatten))
-        cacheKey = 'timespanTree' + str(hashedAttributes)
+        # the key uses repr() rather than hash() so that it is the same from one
+        # session to the next, and trees restored by freezeThaw can be found.
+        cacheKey = 'timespanTree' + repr((tuple(classList or ()), flatten))
         if cacheKey not in self._cache or self._cache[cacheKey] is None:
             hashedTimespanTree = tree.fromStream.asTimespans(self,
                                                              flatten=flatten,
@@ -511,7 +1267,12 @@ class StreamCore(Music21Object):
 
         Override for SpannerStorage, VariantStorage, which should never
         become the activeSite
+
+        Frozen Streams (see :meth:`~music21.stream.Stream.freeze`) do not change
+        the activeSite of their elements.
         '''
+        if self._frozen:
+            return
         el.activeSite = self
 
     def asTree(self, *, flatten=False, classList=None, useTimespans=False, groupOffsets=False):
@@ -695,7 +1456,11 @@ class StreamCore(Music21Object):
             sIter = self.iter()  # type: ignore
 
         collectList = []
-        for el in list(sIter):
+        elements = list(sIter)
+        # nearly every spanned element is found by identity, so check that
+        # first, rather than comparing it to every element in the stream.
+        elementIds = {id(el) for el in elements}
+        for el in elements:
             for sp in el.getSpannerSites():
                 if sp in sb:
                     continue
@@ -706,7 +1471,8 @@ class StreamCore(Music21Object):
                 if requireAllPresent:
                     allFound: bool = True
                     for spannedElement in sp.getSpannedElements():
-                        if spannedElement not in sIter:
+                        if (id(spannedElement) not in elementIds
+                                and spannedElement not in elements):
                             allFound = False
                             break
                     if not allFound:
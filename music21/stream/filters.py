@@ -399,6 +399,30 @@ class OffsetFilter(StreamFilter):
                 stopAfterEnd = False  # never stop after end on unsorted stream
         return self.isElementOffsetInRange(e, offset, stopAfterEnd=stopAfterEnd)
 
+    def firstPossibleIndex(self, offsetIndex) -> int:
+        '''
+        Given an :class:`~music21.stream.core.OffsetIndex` for a sorted Stream,
+        return the index of the first element that could possibly pass this
+        filter.  Every element before it is certain to fail.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(type='half'), 5)
+        >>> of = stream.filters.OffsetFilter(3.0, 6.0)
+        >>> of.firstPossibleIndex(s.coreOffsetIndex())
+        2
+
+        If elements that began before the span can be included, then
+        we need to start with the first element that might still be sounding:
+
+        >>> of = stream.filters.OffsetFilter(3.0, 6.0, mustBeginInSpan=False)
+        >>> of.firstPossibleIndex(s.coreOffsetIndex())
+        1
+        '''
+        if self.mustBeginInSpan:
+            return offsetIndex.firstIndexAtOrAfter(self.offsetStart)
+        # anything that ends before the start of the span is out.
+        return offsetIndex.firstIndexEndingAtOrAfter(self.offsetStart)
+
     def isElementOffsetInRange(self, e, offset, *, stopAfterEnd=False) -> bool:
         '''
         Given an element, offset, and stream, return
@@ -15,6 +15,7 @@ StreamIterators are explicitly allowed to access private methods on streams.
 '''
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable, Iterable, Sequence
 import copy
 import typing as t
@@ -144,6 +145,10 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
         # this information can help in speed later
         # noinspection PyProtectedMember
         self.elementsLength: int = len(self.srcStream._elements)
+        # coreElementsChanged() replaces the cache, so if it is still this dict,
+        # the indices kept in it describe srcStreamElements.
+        # noinspection PyProtectedMember
+        self._srcStreamCache: dict = srcStream._cache
 
         # where we are within a given section (_elements or _endElements)
         self.sectionIndex: int = -1
@@ -165,6 +170,8 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
         self.filters: list[FilterType] = filterList
         self._len: int|None = None
         self._matchingElements: dict[bool|None, list[M21ObjType]] = {}
+        # (number of filters, positions from the class index or None)
+        self._classIndexCache: tuple[int, list[int]|None]|None = None
         # keep track of where we are in the parse.
         # esp important for recursive streams
         if activeInformation is not None:
@@ -189,6 +196,26 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
         return self
 
     def __next__(self) -> M21ObjType:
+        if self.elementIndex < self.elementsLength:
+            positions = self.classIndexPositions()
+            if positions is not None:
+                # go directly to the next element that matches the class filters;
+                # no need to run the filters on it.
+                j = bisect.bisect_left(positions, self.elementIndex)
+                if j < len(positions) and positions[j] < self.elementsLength:
+                    i = positions[j]
+                    e = self.srcStreamElements[i]
+                    self.elementIndex = i + 1
+                    self.iterSection = '_elements'
+                    self.sectionIndex = i
+                    if self.restoreActiveSites is True:
+                        self.srcStream.coreSelfActiveSite(e)
+                    self.updateActiveInformation()
+                    self.activeInformation['lastYielded'] = e
+                    return e
+                # only _endElements are left to check
+                self.elementIndex = self.elementsLength
+
         while self.elementIndex < self.streamLength:
             if self.elementIndex >= self.elementsLength:
                 self.iterSection = '_endElements'
@@ -610,7 +637,7 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
         '''
         reset prior to iteration
         '''
-        self.elementIndex = 0
+        self.elementIndex = self.firstPossibleElementIndex()
         self.iterSection = '_elements'
         self.updateActiveInformation()
         self.activeInformation['lastYielded'] = None
@@ -618,6 +645,88 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
             if isinstance(f, filters.StreamFilter):
                 f.reset()
 
+    def firstPossibleElementIndex(self) -> int:
+        '''
+        Return the index in `.srcStreamElements` where iteration can begin.
+
+        This is 0 unless the iterator has an
+        :class:`~music21.stream.filters.OffsetFilter` and the source Stream is sorted,
+        in which case the Stream's offset index is used to skip over
+        elements that cannot match.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 10)
+        >>> sIter = s.iter()
+        >>> sIter.firstPossibleElementIndex()
+        0
+        >>> sIter.getElementsByOffset(6.0, 8.0).firstPossibleElementIndex()
+        6
+        >>> [n.offset for n in sIter.getElementsByOffset(6.0, 8.0)]
+        [6.0, 7.0, 8.0]
+        '''
+        startIndex = 0
+        srcStream = self.srcStream
+        for f in self.filters:
+            if not isinstance(f, filters.OffsetFilter):
+                continue
+            # noinspection PyProtectedMember
+            if (not srcStream.isSorted
+                    or srcStream._cache is not self._srcStreamCache
+                    or self.elementsLength != len(srcStream._elements)):
+                return 0
+            offsetIndex = srcStream.coreOffsetIndex()
+            if offsetIndex is None:
+                return 0
+            startIndex = max(startIndex, f.firstPossibleIndex(offsetIndex))
+        return startIndex
+
+    def classIndexPositions(self) -> list[int]|None:
+        '''
+        If every filter on this iterator is a
+        :class:`~music21.stream.filters.ClassFilter`, return the positions
+        in the source Stream's `_elements` that match all of them, using the
+        Stream's :class:`~music21.stream.core.ClassIndex`.
+        Otherwise, return None, and every element will need to be checked.
+
+        Elements in `_endElements` are not included and are always checked.
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note(), note.Rest(), note.Note(), note.Rest()])
+        >>> s.iter().notes.classIndexPositions()
+        [0, 2]
+        >>> print(s.iter().classIndexPositions())
+        None
+        >>> print(s.iter().notes.getElementsByOffset(2.0).classIndexPositions())
+        None
+
+        Iteration, of course, gives the same results either way.
+
+        >>> list(s.iter().getElementsByClass(note.Rest))
+        [<music21.note.Rest quarter>, <music21.note.Rest quarter>]
+        '''
+        # filters added through addFilter() reset this cache; the length check
+        # catches filters appended directly to .filters
+        numFilters = len(self.filters)
+        if self._classIndexCache is not None and self._classIndexCache[0] == numFilters:
+            return self._classIndexCache[1]
+
+        positions: list[int]|None = None
+        srcStream = self.srcStream
+        # noinspection PyProtectedMember
+        if (self.filters
+                and srcStream._cache is self._srcStreamCache
+                and len(srcStream._elements) == self.elementsLength
+                # pylint: disable-next=unidiomatic-typecheck
+                and all(type(f) is filters.ClassFilter for f in self.filters)):
+            # noinspection PyProtectedMember
+            positions = srcStream.coreClassIndex().positionsForAll(
+                [tuple(t.cast(filters.ClassFilter, f).classList) for f in self.filters],
+                srcStream._elements,
+            )
+
+        self._classIndexCache = (numFilters, positions)
+        return positions
+
     def resetCaches(self) -> None:
         '''
         reset any cached data. -- do not use this at
@@ -627,6 +736,7 @@ class StreamIterator[M21ObjType: base.Music21Object](prebase.ProtoM21Object, Seq
         '''
         self._len = None
         self._matchingElements = {}
+        self._classIndexCache = None
 
     def cleanup(self) -> None:
         '''
@@ -1762,6 +1872,9 @@ class RecursiveIterator[M21ObjType: base.Music21Object](
         if streamsOnly is True:
             self.filters.append(filters.ClassFilter('Stream'))
         self.childRecursiveIterator: RecursiveIterator[t.Any]|None = None
+        # (positions from classIndexPositions(), recursiveClassIndexPositions())
+        self._recursivePositionsCache: tuple[list[int]|None,
+                                             tuple[list[int], set[int]|None]|None]|None = None
         # not yet used.
         # self.parentIterator = None
 
@@ -1794,6 +1907,32 @@ class RecursiveIterator[M21ObjType: base.Music21Object](
             elif self.returnSelf is True:
                 self.returnSelf = False
 
+            if self.elementIndex < self.elementsLength:
+                positionInfo = self.recursiveClassIndexPositions()
+                if positionInfo is not None:
+                    # go directly to the next element that matches the class filters
+                    # or that must be descended into.
+                    positions, matchingPositions = positionInfo
+                    j = bisect.bisect_left(positions, self.elementIndex)
+                    if j >= len(positions) or positions[j] >= self.elementsLength:
+                        # only _endElements are left to check
+                        self.elementIndex = self.elementsLength
+                        continue
+                    i = positions[j]
+                    e = self.srcStreamElements[i]
+                    self.elementIndex = i + 1
+                    self.iterSection = '_elements'
+                    self.sectionIndex = i
+                    if e.isStream:
+                        self._startChildRecursiveIterator(e)
+                        if matchingPositions is not None and i not in matchingPositions:
+                            continue
+                    if self.restoreActiveSites is True:
+                        self.srcStream.coreSelfActiveSite(e)
+                    self.updateActiveInformation()
+                    self.activeInformation['lastYielded'] = e
+                    return e
+
             if self.elementIndex >= self.elementsLength:
                 self.iterSection = '_endElements'
                 self.sectionIndex = self.elementIndex - self.elementsLength
@@ -1812,21 +1951,7 @@ class RecursiveIterator[M21ObjType: base.Music21Object](
             # in a recursive filter, the stream does not need to match the filter,
             # only the internal elements.
             if e.isStream:
-                eStream = t.cast('streamModule.Stream', e)
-                childRecursiveIterator: RecursiveIterator[M21ObjType] = RecursiveIterator(
-                    srcStream=eStream,
-                    restoreActiveSites=self.restoreActiveSites,
-                    filterList=self.filters,  # shared list
-                    activeInformation=self.activeInformation,  # shared dict
-                    includeSelf=False,  # always for inner streams
-                    ignoreSorting=self.ignoreSorting,
-                    # parentIterator=self,
-                )
-                newStartOffset = (self.iteratorStartOffsetInHierarchy
-                                  + self.srcStream.elementOffset(e))
-
-                childRecursiveIterator.iteratorStartOffsetInHierarchy = newStartOffset
-                self.childRecursiveIterator = childRecursiveIterator
+                self._startChildRecursiveIterator(e)
             if self.matchesFilters(e) is False:
                 continue
 
@@ -1857,13 +1982,167 @@ class RecursiveIterator[M21ObjType: base.Music21Object](
         self.childRecursiveIterator = None
         super().reset()
 
+    def _startChildRecursiveIterator(self, e: base.Music21Object) -> None:
+        '''
+        Set up the RecursiveIterator for the Stream `e` (an element of
+        this iterator's Stream), so that its elements are iterated next.
+        '''
+        eStream = t.cast('streamModule.Stream', e)
+        childRecursiveIterator: RecursiveIterator[M21ObjType] = RecursiveIterator(
+            srcStream=eStream,
+            restoreActiveSites=self.restoreActiveSites,
+            filterList=self.filters,  # shared list
+            activeInformation=self.activeInformation,  # shared dict
+            includeSelf=False,  # always for inner streams
+            ignoreSorting=self.ignoreSorting,
+            # parentIterator=self,
+        )
+        newStartOffset = (self.iteratorStartOffsetInHierarchy
+                          + self.srcStream.elementOffset(e))
+
+        childRecursiveIterator.iteratorStartOffsetInHierarchy = newStartOffset
+        self.childRecursiveIterator = childRecursiveIterator
+
+    def recursiveClassIndexPositions(self) -> tuple[list[int], set[int]|None]|None:
+        '''
+        If every filter on this iterator is a
+        :class:`~music21.stream.filters.ClassFilter`, return a sorted list of
+        the positions in the source Stream's `_elements` that either match the
+        filters or hold Streams (which must be iterated into whether they match
+        or not), along with the set of positions that match, or None if every
+        position in the list matches.  Otherwise, return None, and every element
+        will need to be checked.
+
+        Iterating uses these to skip over elements that can be ignored without
+        running any filters on the elements that are left.
+
+        >>> m = stream.Measure([note.Note(), note.Rest(), stream.Voice([note.Note()])])
+        >>> ri = m.recurse().notes
+        >>> ri.recursiveClassIndexPositions()
+        ([0, 2], {0})
+        >>> m.recurse().getElementsByClass(stream.Voice).recursiveClassIndexPositions()
+        ([2], None)
+        >>> print(m.recurse().recursiveClassIndexPositions())
+        None
+        >>> list(ri)
+        [<music21.note.Note C>, <music21.note.Note C>]
+        '''
+        matching = self.classIndexPositions()
+        if matching is None:
+            return None
+        cached = self._recursivePositionsCache
+        if cached is not None and cached[0] is matching:
+            return cached[1]
+
+        srcStream = self.srcStream
+        # noinspection PyProtectedMember
+        streamPositions = srcStream.coreClassIndex().positionsFor(('Stream',),
+                                                                  srcStream._elements)
+        positionInfo: tuple[list[int], set[int]|None]
+        matchingSet = set(matching)
+        if matchingSet.issuperset(streamPositions):
+            positionInfo = (matching, None)
+        else:
+            positionInfo = (sorted(matchingSet.union(streamPositions)), matchingSet)
+        self._recursivePositionsCache = (matching, positionInfo)
+        return positionInfo
+
+    def firstPossibleElementIndex(self) -> int:
+        '''
+        Recursive iterators always start at the beginning, since offset filters
+        apply to the elements of substreams, which cannot be skipped.
+        '''
+        return 0
+
     def matchingElements(self, *, restoreActiveSites=True):
+        '''
+        Returns a list of the elements that match the filters, in the order in which
+        iterating would return them.
+
+        If every filter is a :class:`~music21.stream.filters.ClassFilter`, the list
+        is made by walking through the Streams directly, using the
+        :class:`~music21.stream.core.ClassIndex` of each, without creating
+        RecursiveIterators or running any filters.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> notes = b.recurse().notes.matchingElements()
+        >>> len(notes)
+        165
+        >>> notes == [n for n in b.recurse() if isinstance(n, note.NotRest)]
+        True
+        '''
+        if restoreActiveSites in self._matchingElements:
+            return self._matchingElements[restoreActiveSites]
+
+        # noinspection PyProtectedMember
+        if (self.filters
+                and self.srcStream._cache is self._srcStreamCache
+                # only plain ClassFilters, not subclasses, can use the class index.
+                # pylint: disable-next=unidiomatic-typecheck
+                and all(type(f) is filters.ClassFilter for f in self.filters)):
+            if restoreActiveSites is None:
+                restoreActiveSites = self.restoreActiveSites
+            classLists = [tuple(t.cast(filters.ClassFilter, f).classList) for f in self.filters]
+            me: list[M21ObjType] = []
+            if (self.includeSelf
+                    and self.streamLength
+                    and not any(self.srcStream.classSet.isdisjoint(cl) for cl in classLists)):
+                me.append(t.cast(M21ObjType, self.srcStream))
+            self._addMatchingByClass(self.srcStream, classLists, restoreActiveSites, me)
+            self._matchingElements[restoreActiveSites] = me
+            return me
+
         # saved parent iterator later?
         # will this work in mid-iteration? Test, or do not expose till then.
         with tempAttribute(self, 'childRecursiveIterator'):
             fe = super().matchingElements(restoreActiveSites=restoreActiveSites)
         return fe
 
+    def _addMatchingByClass(
+        self,
+        s: streamModule.Stream,
+        classLists: list[tuple],
+        restoreActiveSites: bool,
+        post: list,
+    ) -> None:
+        '''
+        Add to `post` the elements of `s` and the Streams within it that match
+        all the `classLists`, in iteration order.  Used by `matchingElements`.
+        '''
+        if s is not self.srcStream and not s.isSorted and s.autoSort:
+            # as in creating a RecursiveIterator for s
+            s.sort()
+        # noinspection PyProtectedMember
+        elements = s._elements
+        classIndex = s.coreClassIndex()
+        matching = classIndex.positionsForAll(classLists, elements)
+        streamPositions = classIndex.positionsFor(('Stream',), elements)
+        if not streamPositions:
+            if restoreActiveSites:
+                for i in matching:
+                    s.coreSelfActiveSite(elements[i])
+            post.extend([elements[i] for i in matching])
+        else:
+            matchingSet = set(matching)
+            for i in sorted(matchingSet.union(streamPositions)):
+                e = elements[i]
+                if i in matchingSet:
+                    if restoreActiveSites:
+                        s.coreSelfActiveSite(e)
+                    post.append(e)
+                if e.isStream:
+                    self._addMatchingByClass(t.cast('streamModule.Stream', e),
+                                             classLists, restoreActiveSites, post)
+        # noinspection PyProtectedMember
+        for e in s._endElements:
+            if not any(e.classSet.isdisjoint(cl) for cl in classLists):
+                if restoreActiveSites:
+                    s.coreSelfActiveSite(e)
+                post.append(e)
+            if e.isStream:
+                self._addMatchingByClass(t.cast('streamModule.Stream', e),
+                                         classLists, restoreActiveSites, post)
+
     def iteratorStack(self) -> list[RecursiveIterator]:
         '''
         Returns a stack of RecursiveIterators at this point in the iteration.  Last is most recent.
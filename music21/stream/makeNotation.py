@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Generator
+import bisect
 import contextlib
 import copy
 import typing as t
@@ -592,12 +593,12 @@ def makeMeasures(
     post.coreElementsChanged()
 
     # cache information about each measure (we used to do this once per element)
-    postLen = len(post)
     postMeasureList = []
+    # measure starts, in order, for finding the measure of each element by bisection
+    postMeasureStarts = []
     lastTimeSignature = meter.TimeSignature('4/4')  # default.
 
-    for i in range(postLen):
-        m = post[i]
+    for m in post:
         if m.timeSignature is not None:
             lastTimeSignature = m.timeSignature
         # get start and end offsets for each measure
@@ -609,6 +610,7 @@ def makeMeasures(
         postMeasureList.append({'measure': m,
                                 'mStart': mStart,
                                 'mEnd': mEnd})
+        postMeasureStarts.append(mStart)
 
     # populate measures with elements
     for oneOffsetMap in offsetMapList:
@@ -625,7 +627,10 @@ def makeMeasures(
 
         match = False
 
-        for i in range(postLen):
+        # measures are contiguous and in order, so the only measure that
+        # can hold this element is the last one starting at or before it
+        i = bisect.bisect_right(postMeasureStarts, start) - 1
+        if i >= 0:
             postMeasureInfo = postMeasureList[i]
             mStart = postMeasureInfo['mStart']
             mEnd = postMeasureInfo['mEnd']
@@ -635,7 +640,6 @@ def makeMeasures(
                 match = True
                 # environLocal.printDebug([
                 #    'found measure match', i, mStart, mEnd, start, end, e])
-                break
 
         if not match:
             if start == end == oMax:
@@ -657,7 +661,7 @@ def makeMeasures(
         # the element may have already been placed in this measure
         # we need to only exclude elements that are placed in the special
         # first position
-        if m.clef is e:
+        if isinstance(e, clef.Clef) and m.clef is e:
             continue
         # do not accept another time signature at the zero position: this
         # is handled above
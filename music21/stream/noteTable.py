@@ -0,0 +1,376 @@
+# -----------------------------------------------------------------------------
+# Name:         stream/noteTable.py
+# Purpose:      columnar (NumPy) views of the notes in a Stream
+#
+# Authors:      agent
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert
+# License:      BSD, see license.txt
+# -----------------------------------------------------------------------------
+'''
+Functions for turning the notes of a Stream into a "note table" -- a NumPy
+structured array with one row per sounding pitch -- and for making a
+minimal Part or Score from such a table.
+
+Note tables are much smaller and faster to work with than Streams for
+analyzing large numbers of pieces, since each column can be worked on with
+NumPy all at once:
+
+>>> bach = corpus.parse('bach/bwv66.6')
+>>> table = bach.toNoteTable()
+>>> len(table)
+165
+>>> table.dtype.names
+('offset', 'quarterLength', 'midi', 'part', 'tie', 'velocity')
+>>> table[:3].tolist()
+[(0.0, 0.5, 73, 0, 0, -1), (0.0, 1.0, 64, 1, 0, -1), (0.0, 0.5, 57, 2, 0, -1)]
+>>> int(table['midi'].max())
+76
+'''
+from __future__ import annotations
+
+from collections.abc import Mapping
+import typing as t
+import unittest
+
+from music21 import chord
+from music21 import environment
+from music21 import note
+from music21 import tie
+from music21.common.numberTools import opFrac
+from music21.exceptions21 import StreamException
+
+if t.TYPE_CHECKING:
+    import numpy as np
+    from music21 import stream
+
+
+environLocal = environment.Environment('stream.noteTable')
+
+
+NOTE_TABLE_FIELDS: tuple[tuple[str, str], ...] = (
+    ('offset', 'f8'),
+    ('quarterLength', 'f8'),
+    ('midi', 'i2'),
+    ('part', 'i2'),
+    ('tie', 'i1'),
+    ('velocity', 'i2'),
+)
+
+# values of the `tie` column
+TIE_CODES: dict[str, int] = {'start': 1, 'continue': 2, 'stop': 3}
+_TIE_TYPES: dict[int, str] = {code: tieType for tieType, code in TIE_CODES.items()}
+
+
+# -----------------------------------------------------------------------------
+def toNoteTable(
+    s: stream.Stream,
+    *,
+    expandChords: bool = True,
+    ties: t.Literal['keep', 'merge'] = 'keep',
+) -> np.ndarray:
+    '''
+    Return a NumPy structured array with one row for each Note in `s`
+    (at any level) with the fields:
+
+    * `offset`: the offset of the note from the start of `s`, in quarter notes
+    * `quarterLength`: its duration
+    * `midi`: its MIDI pitch number
+    * `part`: the index of the Part (or other Stream holding parts) that it is in;
+      always 0 if `s` does not contain parts
+    * `tie`: 0 for no tie; 1, 2, or 3 for a tie that starts, continues, or stops
+      (see `TIE_CODES`)
+    * `velocity`: the MIDI velocity of the note, or -1 if it has not been set
+
+    Rows are sorted by offset; rows at the same offset stay in part order.
+    Normally :meth:`~music21.stream.Stream.toNoteTable` is called instead of this function.
+
+    >>> m1 = stream.Measure([note.Note('C4', type='half'), chord.Chord('E4 G4', type='half')])
+    >>> m2 = stream.Measure([note.Note('D4', type='whole')])
+    >>> m1.notes.first().tie = tie.Tie('start')
+    >>> m2.notes.first().volume.velocity = 90
+    >>> p = stream.Part([m1, m2])
+    >>> table = stream.noteTable.toNoteTable(p)
+    >>> table.dtype
+    dtype([('offset', '<f8'), ('quarterLength', '<f8'), ('midi', '<i2'),
+           ('part', '<i2'), ('tie', 'i1'), ('velocity', '<i2')])
+    >>> table.tolist()
+    [(0.0, 2.0, 60, 0, 1, -1), (2.0, 2.0, 64, 0, 0, -1), (2.0, 2.0, 67, 0, 0, -1),
+     (4.0, 4.0, 62, 0, 0, 90)]
+
+    If `expandChords` is False, a Chord gets a single row, with the MIDI number
+    of its lowest pitch:
+
+    >>> stream.noteTable.toNoteTable(p, expandChords=False)['midi']
+    array([60, 64, 62], dtype=int16)
+
+    If `ties` is 'merge', notes tied to notes before them of the same pitch (in the
+    same part) are merged into them, as :meth:`~music21.stream.Stream.stripTies` would:
+
+    >>> m2.notes.first().pitch.midi = 60
+    >>> m2.notes.first().tie = tie.Tie('stop')
+    >>> merged = stream.noteTable.toNoteTable(p, ties='merge')
+    >>> merged['quarterLength']
+    array([6., 2., 2.])
+    >>> merged['tie']
+    array([0, 0, 0], dtype=int8)
+
+    Unpitched notes and chord symbols are not included.
+    '''
+    import numpy as np
+
+    if ties not in ('keep', 'merge'):
+        raise StreamException(f'ties must be "keep" or "merge", not {ties!r}')
+    mergeTies = (ties == 'merge')
+
+    offsets: list[float] = []
+    quarterLengths: list[float] = []
+    midis: list[int] = []
+    partIndices: list[int] = []
+    tieCodes: list[int] = []
+    velocities: list[int] = []
+    # (part index, midi) -> row of the note whose tie is still open.
+    openTies: dict[tuple[int, int], int] = {}
+
+    def addRow(offset, quarterLength, midi, partIndex, tieObj, velocity):
+        tieCode = TIE_CODES.get(tieObj.type, 0) if tieObj is not None else 0
+        if mergeTies and tieCode:
+            key = (partIndex, midi)
+            if tieCode != TIE_CODES['start'] and key in openTies:
+                quarterLengths[openTies[key]] += quarterLength
+                if tieCode == TIE_CODES['stop']:
+                    del openTies[key]
+                return
+            if tieCode == TIE_CODES['stop']:
+                tieCode = 0  # nothing to stop.
+            else:  # start, or continue without a start
+                openTies[key] = len(offsets)
+                tieCode = 0
+        offsets.append(offset)
+        quarterLengths.append(quarterLength)
+        midis.append(midi)
+        partIndices.append(partIndex)
+        tieCodes.append(tieCode)
+        velocities.append(velocity)
+
+    def velocityOf(n: note.NotRest, default: int = -1) -> int:
+        # do not create Volume objects where there are none.
+        if not n.hasVolumeInformation():
+            return default
+        velocity = n.volume.velocity
+        return default if velocity is None else velocity
+
+    def addNotes(container: stream.Stream, containerOffset: float, partIndex: int) -> None:
+        # .elements sorts the container if need be
+        for e in container.elements:
+            if e.isStream:
+                addNotes(t.cast('stream.Stream', e),
+                         containerOffset + container.elementOffset(e),
+                         partIndex)
+                continue
+            if isinstance(e, note.Note):
+                addRow(float(containerOffset + container.elementOffset(e)),
+                       float(e.duration.quarterLength),
+                       e.pitch.midi,
+                       partIndex,
+                       e.tie,
+                       velocityOf(e))
+            elif isinstance(e, chord.Chord) and 'Harmony' not in e.classSet:
+                if not e.pitches:
+                    continue
+                offset = float(containerOffset + container.elementOffset(e))
+                quarterLength = float(e.duration.quarterLength)
+                chordVelocity = velocityOf(e)
+                if expandChords:
+                    for n in e:
+                        addRow(offset,
+                               quarterLength,
+                               n.pitch.midi,
+                               partIndex,
+                               n.tie if n.tie is not None else e.tie,
+                               velocityOf(n, chordVelocity))
+                else:
+                    addRow(offset,
+                           quarterLength,
+                           min(p.midi for p in e.pitches),
+                           partIndex,
+                           e.tie,
+                           chordVelocity)
+
+    if s.hasPartLikeStreams():
+        for partIndex, part in enumerate(s.getElementsByClass('Stream')):
+            addNotes(part, float(s.elementOffset(part)), partIndex)
+    else:
+        addNotes(s, 0.0, 0)
+
+    table = np.empty(len(offsets), dtype=list(NOTE_TABLE_FIELDS))
+    table['offset'] = offsets
+    table['quarterLength'] = quarterLengths
+    table['midi'] = midis
+    table['part'] = partIndices
+    table['tie'] = tieCodes
+    table['velocity'] = velocities
+    return table[np.argsort(table['offset'], kind='stable')]
+
+
+def fromNoteTable(
+    table: np.ndarray|Mapping[str, t.Any],
+    *,
+    makeChords: bool = True,
+) -> stream.Part|stream.Score:
+    '''
+    Make a minimal Part (or a Score of Parts, if the table has more than one
+    value in its `part` column) from a note table, such as one returned by
+    :meth:`~music21.stream.Stream.toNoteTable`.  A dict of equal-length arrays
+    (or lists) with the same keys also works.  Only `offset`, `quarterLength`,
+    and `midi` are required.
+
+    >>> table = {'offset': [0.0, 1.0, 1.0, 2.0],
+    ...          'quarterLength': [1.0, 1.0, 1.0, 2.0],
+    ...          'midi': [60, 64, 67, 62]}
+    >>> p = stream.fromNoteTable(table)
+    >>> p.show('text')
+    {0.0} <music21.note.Note C>
+    {1.0} <music21.chord.Chord E4 G4>
+    {2.0} <music21.note.Note D>
+
+    Rows in the same part with the same offset and quarterLength become a Chord
+    unless `makeChords` is False:
+
+    >>> len(stream.fromNoteTable(table, makeChords=False).notes)
+    4
+
+    Going from a Score to a note table and back keeps the notes, though
+    not the Measures or anything else:
+
+    >>> bach = corpus.parse('bach/bwv66.6')
+    >>> bachTable = bach.toNoteTable()
+    >>> rebuilt = stream.fromNoteTable(bachTable)
+    >>> rebuilt
+    <music21.stream.Score 0x...>
+    >>> len(rebuilt.parts)
+    4
+    >>> bool((rebuilt.toNoteTable() == bachTable).all())
+    True
+    '''
+    from music21 import stream
+
+    columns = {name: list(table[name]) for name in ('offset', 'quarterLength', 'midi')}
+    numRows = len(columns['offset'])
+    for name, default in (('part', 0), ('tie', 0), ('velocity', -1)):
+        try:
+            columns[name] = list(table[name])
+        except (KeyError, ValueError):  # ValueError for structured arrays
+            columns[name] = [default] * numRows
+
+    # part index -> (offset, quarterLength) -> notes
+    # with makeChords=False, the row index is added to the key so that
+    # each note is kept by itself.
+    partNotes: dict[int, dict[tuple[float, ...], list[note.Note]]] = {}
+    for i in range(numRows):
+        n = note.Note(int(columns['midi'][i]),
+                      quarterLength=opFrac(float(columns['quarterLength'][i])))
+        tieType = _TIE_TYPES.get(int(columns['tie'][i]), None)
+        if tieType is not None:
+            n.tie = tie.Tie(tieType)
+        velocity = int(columns['velocity'][i])
+        if velocity >= 0:
+            n.volume.velocity = velocity
+        key: tuple[float, ...] = (float(columns['offset'][i]),
+                                  float(columns['quarterLength'][i]))
+        if not makeChords:
+            key = key + (i,)
+        partNotes.setdefault(int(columns['part'][i]), {}).setdefault(key, []).append(n)
+
+    parts: list[stream.Part] = []
+    for unused_partIndex, notesByOffset in sorted(partNotes.items()):
+        p = stream.Part()
+        offsetElementPairs = []
+        for key, notes in notesByOffset.items():
+            el: note.Note|chord.Chord
+            if len(notes) == 1:
+                el = notes[0]
+            else:
+                el = chord.Chord(notes)
+            offsetElementPairs.append((opFrac(key[0]), el))
+        p.insertMany(offsetElementPairs)
+        parts.append(p)
+
+    if not parts:
+        return stream.Part()
+    if len(parts) == 1:
+        return parts[0]
+    sc = stream.Score()
+    sc.insertMany((0.0, p) for p in parts)
+    return sc
+
+
+# -----------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def testRoundTrip(self):
+        from music21 import corpus
+
+        sc = corpus.parse('bach/bwv66.6')
+        table = sc.toNoteTable()
+        expected = []
+        for partIndex, p in enumerate(sc.parts):
+            for n in p.recurse().notes:
+                expected.append((float(n.getOffsetInHierarchy(sc)),
+                                 float(n.quarterLength),
+                                 n.pitch.midi,
+                                 partIndex))
+        expected.sort(key=lambda row: row[0])  # stable, so still in part order
+        self.assertEqual([(float(row['offset']), float(row['quarterLength']),
+                           int(row['midi']), int(row['part'])) for row in table],
+                         expected)
+
+        rebuilt = fromNoteTable(table)
+        self.assertEqual(len(rebuilt.parts), 4)
+        self.assertTrue((rebuilt.toNoteTable() == table).all())
+
+    def testTiesAndChords(self):
+        from music21 import stream
+
+        c1 = chord.Chord('C4 E4', quarterLength=2)
+        c1.tie = tie.Tie('start')
+        c2 = chord.Chord('C4 E4', quarterLength=1)
+        c2.tie = tie.Tie('stop')
+        n = note.Note('G4', quarterLength=0.5)
+        n.volume.velocity = 100
+        s = stream.Stream()
+        s.append([c1, c2, n, note.Rest()])
+
+        table = toNoteTable(s)
+        self.assertEqual(table['tie'].tolist(), [1, 1, 3, 3, 0])
+        self.assertEqual(table['velocity'].tolist(), [-1, -1, -1, -1, 100])
+
+        merged = toNoteTable(s, ties='merge')
+        self.assertEqual(merged['quarterLength'].tolist(), [3.0, 3.0, 0.5])
+        self.assertEqual(merged['tie'].tolist(), [0, 0, 0])
+        self.assertEqual(len(toNoteTable(s, expandChords=False, ties='merge')), 2)
+
+        with self.assertRaises(StreamException):
+            toNoteTable(s, ties='strip')
+
+        rebuilt = fromNoteTable(table)
+        self.assertEqual([str(el) for el in rebuilt.notes],
+                         [str(el) for el in s.notes])
+        self.assertEqual(rebuilt.notes[0].notes[0].tie, tie.Tie('start'))
+        self.assertEqual(rebuilt.notes[2].volume.velocity, 100)
+
+    def testEmpty(self):
+        from music21 import stream
+
+        table = toNoteTable(stream.Score())
+        self.assertEqual(len(table), 0)
+        self.assertIsInstance(fromNoteTable(table), stream.Part)
+
+
+# -----------------------------------------------------------------------------
+_DOC_ORDER = [toNoteTable, fromNoteTable]
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
@@ -10,6 +10,7 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import os
 import random
@@ -18,6 +19,7 @@ import unittest
 import music21
 from music21.note import GeneralNote
 
+from music21.stream.base import ImmutableStreamException
 from music21.stream.base import StreamException
 from music21.stream.base import Stream
 from music21.stream.base import Voice
@@ -1378,6 +1380,48 @@ class Test(unittest.TestCase):
         v2.notes.first().tie = tie.Tie('continue')
         _ = p.stripTies(inPlace=False, matchByPitch=False)
 
+    def testStripTiesLongTiedPassage(self):
+        '''
+        Long chains of ties across many measures, alternating notes and chords,
+        as in MIDI imports.
+        '''
+        p = Part()
+        for i in range(200):
+            m = Measure(number=i + 1)
+            if (i // 10) % 2:
+                el = chord.Chord(['C4', 'E4', 'G4'], quarterLength=4)
+            else:
+                el = note.Note('D4', quarterLength=4)
+            if i % 10 == 0:
+                el.tie = tie.Tie('start')
+            elif i % 10 == 9:
+                el.tie = tie.Tie('stop')
+            else:
+                el.tie = tie.Tie('continue')
+            if isinstance(el, chord.Chord):
+                for n in el:
+                    n.tie = tie.Tie(el.tie.type)
+            m.append(el)
+            p.append(m)
+        firstNotes = [m.notes.first() for m in p.getElementsByClass(Measure)[::10]]
+        p.insert(0, spanner.Slur(firstNotes[0], p.getElementsByClass(Measure)[-1].notes.first()))
+
+        for matchByPitch in (True, False):
+            stripped = p.stripTies(matchByPitch=matchByPitch)
+            strippedNotes = list(stripped.recurse().notes)
+            self.assertEqual(len(strippedNotes), 20)
+            self.assertEqual([n.quarterLength for n in strippedNotes], [40.0] * 20)
+            self.assertEqual([n.getOffsetInHierarchy(stripped) for n in strippedNotes],
+                             [40.0 * i for i in range(20)])
+            self.assertTrue(all(n.tie is None for n in strippedNotes))
+            self.assertEqual(len(stripped.getElementsByClass(Measure)), 200)
+            slur = stripped.spanners.first()
+            self.assertIs(slur.getFirst(), strippedNotes[0])
+            self.assertIs(slur.getLast(), strippedNotes[-1])
+
+        # the original is unchanged
+        self.assertEqual(len(p.recurse().notes), 200)
+
     def testGetElementsByOffsetZeroLength(self):
         '''
         Testing multiple zero-length elements with mustBeginInSpan:
@@ -4135,6 +4179,144 @@ class Test(unittest.TestCase):
         s2.quantize(inPlace=True, quarterLengthDivisors=[2])
         self.assertEqual(len(s2.notesAndRests), 3)
 
+    def testQuantizeMatchesOneAtATime(self):
+        '''
+        The quantization engine finds the same matches as choosing the smallest
+        BestQuantizationMatch for each target by itself.
+        '''
+        from music21.stream.base import _bestQuantizationMatches
+        from music21.stream.base import BestQuantizationMatch
+
+        def bestMatch(target, divisors, zeroAllowed, gapToFill):
+            found = []
+            for div in divisors:
+                tick = 1 / div
+                match, error, signedError = common.nearestMultiple(target, tick)
+                if not zeroAllowed and match == 0.0:
+                    match = tick
+                    signedError = round(target - match, 7)
+                    error = abs(signedError)
+                if gapToFill % tick == 0:
+                    remainingGap = 0.0
+                else:
+                    remainingGap = max(gapToFill - match, 0.0)
+                found.append(BestQuantizationMatch(
+                    remainingGap, error, tick, match, signedError, div))
+            return min(found)
+
+        rng = random.Random(133)
+        targets = [rng.uniform(0, 8) for _ in range(2000)]
+        targets += [0.0, 0.25, 1 / 3, 0.29166666666666667, 0.00000005, 2.5]
+        zeroAllowed = [rng.random() < 0.5 for _ in targets]
+        gaps = [rng.choice([0.0, 0.25, 1 / 3, 0.5, rng.uniform(0, 1)]) for _ in targets]
+        for divisors in ([4], [4, 3], [8, 6], [3, 4, 6, 12]):
+            matches, errors = _bestQuantizationMatches(
+                targets, divisors, zeroAllowed=zeroAllowed, gapsToFill=gaps)
+            for i, target in enumerate(targets):
+                expected = bestMatch(target, divisors, zeroAllowed[i], gaps[i])
+                self.assertEqual(matches[i], expected.match)
+                self.assertEqual(errors[i], expected.signedError)
+
+        with self.assertRaises(StreamException):
+            _bestQuantizationMatches([0.5], [])
+
+    def testContentHash(self):
+        s = corpus.parse('bach/bwv66.6')
+        sHash = s.contentHash()
+        self.assertEqual(copy.deepcopy(s).contentHash(), sHash)
+        self.assertNotEqual(s.transpose(2).contentHash(), sHash)
+
+        # a change deep in the hierarchy reaches the Score
+        n = s.parts[1].getElementsByClass(Measure)[3].notes.first()
+        n.duration.quarterLength = n.duration.quarterLength / 2
+        self.assertNotEqual(s.contentHash(), sHash)
+
+        # lyrics and articulations are content
+        m1 = Measure([note.Note('C4')])
+        m2 = Measure([note.Note('C4')])
+        self.assertEqual(m1.contentHash(), m2.contentHash())
+        m2.notes.first().addLyric('la')
+        m2.coreElementsChanged()
+        self.assertNotEqual(m1.contentHash(), m2.contentHash())
+
+        # a spanner in a Measure that spans the Measure
+        m3 = Measure([note.Note('C4')])
+        m3.insert(0, spanner.RepeatBracket(m3, number=1))
+        self.assertEqual(len(m3.contentHash()), 64)
+
+    def testDeepcopySites(self):
+        n1 = note.Note('C4')
+        n2 = note.Note('D4')
+        s = Stream([n1, n2])
+        s.insert(0, spanner.Slur(n1, n2))
+        other = Stream()
+        other.insert(0, n1)
+
+        sCopy = copy.deepcopy(s)
+        n1Copy = sCopy.notes.first()
+        slCopy = sCopy.spanners.first()
+        self.assertIs(slCopy.getFirst(), n1Copy)
+        # the copy is only in the new Stream and the new Slur's storage
+        self.assertEqual(len(n1Copy.sites), 3)  # including the None site
+        self.assertIn(sCopy, n1Copy.sites)
+        self.assertIn(slCopy.spannerStorage, n1Copy.sites)
+        self.assertNotIn(other, n1Copy.sites)
+        self.assertNotIn(s, n1Copy.sites)
+
+        # a copy of the Note alone keeps the original spanner's storage
+        n1Alone = copy.deepcopy(n1)
+        self.assertEqual(n1Alone.getSpannerSites(), n1.getSpannerSites())
+        self.assertNotIn(s, n1Alone.sites)
+
+    def testFreezeThreads(self):
+        s = corpus.parse('bach/bwv66.6')
+
+        def query(unused_i):
+            found = []
+            for p in s.parts:
+                pFlat = p.flatten()
+                for n in p.recurse().notes:
+                    found.append((n.nameWithOctave, n.beat, n.measureNumber,
+                                  pFlat.elementOffset(n), n.activeSite))
+                found.append(p.flatten(retainContainers=True).highestTime)
+            found.append(s.contentHash())
+            return found
+
+        expected = query(0)
+        s.freeze()
+        self.assertTrue(all(x.isFrozen for x in s.recurse(streamsOnly=True)))
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(query, range(8)))
+        for result in results:
+            self.assertEqual(result, expected)
+
+        m1 = s.parts[0].getElementsByClass(Measure).first()
+        with self.assertRaises(ImmutableStreamException):
+            m1.insert(0, note.Note())
+        with self.assertRaises(ImmutableStreamException):
+            m1.notes.first().offset = 0.5
+        self.assertEqual(s.contentHash(), expected[-1])
+
+        sCopy = copy.deepcopy(s)
+        self.assertFalse(sCopy.recurse().getElementsByClass(Measure).first().isFrozen)
+        s.makeMutable()
+        m1.insert(0, note.Note())
+        self.assertNotEqual(s.contentHash(), expected[-1])
+
+    def testFreezeMeasures(self):
+        s = corpus.parse('bach/bwv66.6')
+        expectedScore = [repr(e) for e in s.measures(2, 4).recurse()]
+        expectedPart = [repr(e) for e in s.parts[0].measures(2, 4).recurse()]
+        s.freeze()
+        # the clef, key, and meter found for the excerpt are copied, since
+        # their priority cannot be changed in a frozen Stream
+        self.assertEqual([repr(e) for e in s.measures(2, 4).recurse()], expectedScore)
+        partExcerpt = s.parts[0].measures(2, 4)
+        self.assertEqual([repr(e) for e in partExcerpt.recurse()], expectedPart)
+        self.assertIsNot(partExcerpt.getElementsByClass(clef.Clef).first(),
+                         s.parts[0].recurse().getElementsByClass(clef.Clef).first())
+        self.assertTrue(all(x.isFrozen for x in s.recurse(streamsOnly=True)))
+
     def testAnalyze(self):
 
         s = corpus.parse('bach/bwv66.6')
@@ -7937,6 +8119,23 @@ class Test(unittest.TestCase):
 
         # s.show()
 
+    def testMakeNotationOverlapsManyMeasures(self):
+        p = Part()
+        for i in range(60):
+            p.insert(i * 2, note.Note('C4', quarterLength=3))
+            p.insert(i * 2 + 1, note.Note('E4', quarterLength=1 / 3))
+        p.makeNotation(inPlace=True)
+        measures = p.getElementsByClass(Measure)
+        self.assertEqual(len(measures), 31)
+        self.assertEqual({len(m.voices) for m in measures}, {2})
+        self.assertEqual(p.highestTime, 121.0)
+        self.assertEqual(common.opFrac(sum(n.quarterLength for n in p.recurse().notes)), 200.0)
+        # every note C that crosses a barline is tied into the next measure
+        for m in measures[:-1]:
+            lastC = m.voices[1].notes.last()
+            self.assertEqual(lastC.name, 'C')
+            self.assertEqual(lastC.tie.type, 'start')
+
     def testMakeVoicesB(self):
         s = corpus.parse('bwv66.6')
         # s.measures(6, 7).show()
@@ -8817,6 +9016,525 @@ class Test(unittest.TestCase):
         self.assertIs(n.activeSite, s2)
         self.assertTrue(s1.notes)
         self.assertIs(n.activeSite, s2)
+
+    def testOffsetIndexMatchesScan(self):
+        from music21.stream import filters
+        rng = random.Random(21)
+        s = Stream()
+        for _ in range(300):
+            if rng.random() < 0.2:
+                el = clef.TrebleClef()
+            else:
+                el = note.Note(quarterLength=rng.choice([0, 0.5, 1, 1.5, 4]))
+            s.insert(rng.choice([0, 0.5, 1, 2.25, 3]) * rng.randint(0, 40), el)
+        s.storeAtEnd(bar.Barline('final'))
+        self.assertIsNotNone(s.coreOffsetIndex())
+
+        def scanByOffset(start, end, **keywords):
+            offsetFilter = filters.OffsetFilter(start, end, **keywords)
+            return [e for e in s.elements
+                    if offsetFilter.isElementOffsetInRange(e, s.elementOffset(e))]
+
+        def scanAtOrBefore(offset, classList=None, beforeNotAt=False):
+            candidates = []
+            for e in s.elements:
+                if classList and e.classSet.isdisjoint(classList):
+                    continue
+                o = s.elementOffset(e)
+                if o < 0 or o > offset or (o == offset and beforeNotAt):
+                    continue
+                candidates.append(e)
+            if not candidates:
+                return None
+            return max(candidates, key=lambda x: (s.elementOffset(x), x.sortTuple(s)))
+
+        for _ in range(200):
+            start = rng.randint(-4, 130) / 2
+            end = start + rng.choice([0, 0.5, 1, 3, 10])
+            keywords = {
+                'mustBeginInSpan': rng.random() < 0.5,
+                'mustFinishInSpan': rng.random() < 0.5,
+                'includeEndBoundary': rng.random() < 0.5,
+                'includeElementsThatEndAtStart': rng.random() < 0.5,
+            }
+            self.assertEqual(list(s.getElementsByOffset(start, end, **keywords)),
+                             scanByOffset(start, end, **keywords))
+            self.assertIs(s.getElementAtOrBefore(start), scanAtOrBefore(start))
+            self.assertIs(s.getElementAtOrBefore(start, [clef.Clef]),
+                          scanAtOrBefore(start, ['Clef']))
+            self.assertIs(s.getElementBeforeOffset(start), scanAtOrBefore(start, beforeNotAt=True))
+
+        # editing invalidates the index
+        n = note.Note()
+        s.insert(1000, n)
+        self.assertIs(s.getElementAtOrBefore(2000), s[-1])
+        self.assertIn(n, s.getElementsByOffset(999, 1001))
+        s.remove(n)
+        self.assertNotIn(n, s.getElementsByOffset(999, 1001))
+
+    def testClassIndexMatchesScan(self):
+        rng = random.Random(2)
+        s = Measure()
+
+        def scan(classList):
+            return [e for e in s.elements if not e.classSet.isdisjoint(classList)]
+
+        def check():
+            self.assertEqual(list(s.notes), scan(['NotRest']))
+            self.assertEqual(list(s.getElementsByClass(note.Rest)), scan([note.Rest]))
+            self.assertEqual(list(s.getElementsByClass(['Clef', 'Barline'])),
+                             scan(['Clef', 'Barline']))
+            self.assertEqual(list(s.iter().getElementsByClass(note.GeneralNote).notes),
+                             scan(['NotRest']))
+            self.assertEqual(len(s.notesAndRests), len(scan(['GeneralNote'])))
+
+        for i in range(200):
+            choice = rng.random()
+            if choice < 0.4:
+                s.append(note.Note(quarterLength=rng.choice([0.5, 1, 2])))
+            elif choice < 0.55:
+                s.append(note.Rest())
+            elif choice < 0.65:
+                s.insert(rng.randint(0, 20), chord.Chord('C E G'))
+            elif choice < 0.7:
+                s.insert(rng.randint(0, 20), clef.BassClef())
+            elif choice < 0.8 and s.notes:
+                s.remove(rng.choice(list(s.notes)))
+            elif choice < 0.9 and s.notes:
+                rng.choice(list(s.notes)).quarterLength = 3
+            elif i % 50 == 0:
+                s.rightBarline = bar.Barline('double')
+            check()
+
+        # containers keep their index when a contained stream changes
+        p = Part()
+        p.append(s)
+        p.insert(0, clef.TrebleClef())
+        self.assertEqual(len(p.getElementsByClass(Measure)), 1)
+        classIndex = p.coreClassIndex()
+        s.append(note.Note())
+        self.assertIs(p.coreClassIndex(), classIndex)
+        self.assertEqual(list(p.getElementsByClass(clef.Clef)),
+                         [e for e in p.elements if isinstance(e, clef.Clef)])
+
+    def testInsertManyAppendMany(self):
+        rng = random.Random(3)
+        offsets = [rng.randint(0, 100) / 4 for _ in range(500)]
+        notes = [note.Note(quarterLength=rng.choice([0.25, 1, 3])) for _ in offsets]
+
+        s1 = Stream()
+        for o, n in zip(offsets, notes):
+            s1.insert(o, n)
+        s2 = Stream()
+        s2.insertMany(zip(offsets, copy.deepcopy(notes)))
+        self.assertEqual([(s1.elementOffset(e), e.quarterLength) for e in s1],
+                         [(s2.elementOffset(e), e.quarterLength) for e in s2])
+        self.assertEqual(s1.highestTime, s2.highestTime)
+
+        s3 = Stream()
+        for n in notes[:100]:
+            s3.append(copy.deepcopy(n))
+        s4 = Stream()
+        s4.appendMany(copy.deepcopy(n) for n in notes[:100])
+        self.assertEqual([(s3.elementOffset(e), e.quarterLength) for e in s3],
+                         [(s4.elementOffset(e), e.quarterLength) for e in s4])
+
+        # streams make the container non-flat
+        p = Part()
+        p.insertMany([(0, Measure()), (4, Measure())])
+        self.assertFalse(p.isFlat)
+        p2 = Part()
+        p2.appendMany([Measure(), Measure()])
+        self.assertFalse(p2.isFlat)
+
+        # elements already in the Stream cannot be added again
+        with self.assertRaises(StreamException):
+            s2.insertMany([(0, s2[0])])
+        with self.assertRaises(StreamException):
+            s4.appendMany([note.Note(), s4[0]])
+        self.assertEqual(len(s4), 100)
+
+    def testBatchEdit(self):
+        sc = Score()
+        p = Part()
+        sc.insert(0, p)
+        m = Measure()
+        p.insert(0, m)
+        self.assertEqual(sc.flatten().highestTime, 0.0)
+
+        with m.batchEdit():
+            with m.batchEdit():
+                m.insert(1.0, note.Note('D'))
+            self.assertEqual(m._batchEditDepth, 1)
+            m.insert(0.0, note.Note('C'))
+            m.append(note.Note('E'))
+            m.insert(0.0, Voice())
+            self.assertEqual(m.highestTime, 3.0)
+        self.assertEqual(m._batchEditDepth, 0)
+        self.assertFalse(m.isFlat)
+        self.assertEqual([n.name for n in m.notes], ['C', 'D', 'E'])
+        # containers were told about the changes
+        self.assertEqual(sc.flatten().highestTime, 3.0)
+        self.assertEqual(len(sc.recurse().notes), 3)
+
+        # the block ends even if there is an error
+        with self.assertRaises(StreamException):
+            with m.batchEdit():
+                m.insert(5.0, note.Note('F'))
+                m.insert(6.0, 'not a Music21Object')
+        self.assertEqual(m._batchEditDepth, 0)
+        self.assertEqual(sc.flatten().highestTime, 6.0)
+
+    def testComputeBeats(self):
+        import math
+
+        def checkAgainstProperties(s):
+            beatMaps = s.computeBeats(classFilter=(GeneralNote, clef.Clef))
+            elements = list(s.recurse().getElementsByClass((GeneralNote, clef.Clef)))
+            self.assertEqual(len(beatMaps), len(elements))
+            for bm, el in zip(beatMaps, elements):
+                self.assertIs(bm.element, el)
+                for attr in ('beat', 'beatStrength'):
+                    expected = getattr(el, attr)
+                    if isinstance(expected, float) and math.isnan(expected):
+                        self.assertTrue(math.isnan(getattr(bm, attr)))
+                    else:
+                        self.assertEqual(getattr(bm, attr), expected, (el, attr))
+                self.assertEqual(bm.beatDuration.quarterLength, el.beatDuration.quarterLength)
+
+        checkAgainstProperties(corpus.parse('bwv66.6'))
+        checkAgainstProperties(corpus.parse('demos/two-voices'))
+
+        # pickup measure, a change of meter in the middle of a measure,
+        # voices, and a measure with no TimeSignature.
+        p = converter.parse('tinynotation: 3/4 c4 d8 e f4 g4 a b 2/4 c8 d e f g a b c')
+        m1 = p.getElementsByClass(Measure).first()
+        m1.paddingLeft = 1.0
+        m2 = p.getElementsByClass(Measure)[1]
+        m2.insert(1.0, meter.TimeSignature('6/8'))
+        m3 = p.getElementsByClass(Measure)[2]
+        v1 = Voice()
+        v1.repeatAppend(note.Note('E'), 2)
+        v2 = Voice()
+        v2.repeatAppend(note.Note('G', type='half'), 1)
+        m3.insert(0, v1)
+        m3.insert(0, v2)
+        checkAgainstProperties(p)
+
+        # elements outside of Measures
+        s = Stream()
+        s.insert(0, meter.TimeSignature('3/8'))
+        s.repeatAppend(note.Note(type='eighth'), 7)
+        checkAgainstProperties(s)
+        checkAgainstProperties(Stream([note.Note()]))
+
+        # a change of meter in a Measure with no notes
+        p = converter.parse('tinynotation: 3/4 c4 d e f g a b c d')
+        m2 = p.getElementsByClass(Measure)[1]
+        m2.remove(list(m2.notes))
+        m2.insert(0, meter.TimeSignature('2/4'))
+        checkAgainstProperties(p)
+        lastBeatMap = p.computeBeats()[-1]
+        self.assertEqual((lastBeatMap.beat, lastBeatMap.beatStrength), (1.0, 1.0))
+
+    def testChordifyIter(self):
+        sc = corpus.parse('bwv66.6')
+        expected = sc.flatten().chordify()
+
+        tuples = list(sc.chordifyIter())
+        elements = list(sc.chordifyIter(makeElements=True))
+        self.assertEqual(len(tuples), len(elements))
+        for (offset, ql, pitches), el in zip(tuples, elements):
+            self.assertEqual(el.offset, offset)
+            self.assertEqual(el.quarterLength, ql)
+            self.assertEqual([p.nameWithOctave for p in pitches],
+                             [p.nameWithOctave for p in el.pitches])
+
+        # same as chordify() without measures
+        self.assertEqual(
+            [(el.offset, el.quarterLength, el.pitches) for el in elements],
+            [(el.offset, el.quarterLength, el.pitches) for el in expected.notesAndRests],
+        )
+        self.assertEqual(sum(ql for unused, ql, unused2 in tuples), sc.highestTime)
+
+        # the pitches are the original ones, and are kept if not removed.
+        offset, ql, pitches = tuples[0]
+        self.assertIn(pitches[0], sc.pitches)
+        unreduced = list(sc.chordifyIter(removeRedundantPitches=False))
+        self.assertEqual(len(unreduced[0][2]), 4)
+        self.assertEqual(len(pitches), 3)
+
+    def testTempoMap(self):
+        rng = random.Random(9)
+        s = Stream()
+        for i in range(200):
+            s.insert(i * 0.75, note.Note(quarterLength=rng.choice([0.25, 0.5, 1.0, 1.5])))
+        for o in (0.0, 10.0, 10.0, 30.25, 61.0, 100.5, 140.0):
+            s.insert(o, tempo.MetronomeMark(number=rng.randint(40, 200)))
+        mmBoundaries = s.metronomeMarkBoundaries()
+        tm = s.tempoMap()
+        self.assertIs(s.tempoMap(), tm)
+        lowest = mmBoundaries[0][0]
+
+        offsets = [rng.uniform(-1.0, 160.0) for _ in range(300)]
+        offsets.extend(b[0] for b in mmBoundaries)
+        offsets.extend(b[1] for b in mmBoundaries)
+        offsets.extend([s.highestTime, s.highestTime + 5])
+        for o in offsets:
+            if o < lowest:
+                # offsets before the start count as the start
+                self.assertEqual(tm.offsetToSeconds(o), 0.0)
+            else:
+                self.assertEqual(tm.offsetToSeconds(o),
+                                 s._accumulatedSeconds(mmBoundaries, lowest, o))
+            end = o + rng.choice([0.0, 0.5, 3.0, 40.0])
+            # whole regions in between are counted from the seconds at their
+            # starts, so may differ in the last place.
+            self.assertAlmostEqual(tm.secondsBetween(o, end),
+                                   s._accumulatedSeconds(mmBoundaries, o, end))
+            if lowest <= o <= s.highestTime:
+                self.assertAlmostEqual(tm.secondsToOffset(tm.offsetToSeconds(o)), o)
+
+        vectorSeconds = tm.offsetsToSeconds(offsets)
+        for o, sec in zip(offsets, vectorSeconds):
+            self.assertAlmostEqual(sec, tm.offsetToSeconds(o))
+        for sec, o in zip(vectorSeconds, tm.secondsToOffsets(vectorSeconds)):
+            self.assertAlmostEqual(o, tm.secondsToOffset(sec))
+
+        # secondsMap is unchanged
+        for entry in s.secondsMap:
+            o = entry['element'].offset
+            dur = entry['element'].quarterLength
+            self.assertEqual(entry['offsetSeconds'],
+                             s._accumulatedSeconds(mmBoundaries, lowest, o))
+            self.assertEqual(entry['durationSeconds'],
+                             s._accumulatedSeconds(mmBoundaries, o, o + dur))
+
+        # a change of tempo makes a new map
+        s.insert(150.0, tempo.MetronomeMark(number=30))
+        self.assertIsNot(s.tempoMap(), tm)
+        self.assertEqual(s.tempoMap().offsetToSeconds(s.highestTime),
+                         s._accumulatedSeconds(s.metronomeMarkBoundaries(),
+                                               lowest, s.highestTime))
+
+    def testSecondsMapAfterMetronomeMarkChange(self):
+        s = Stream()
+        mm = tempo.MetronomeMark(number=60)
+        s.insert(0, mm)
+        s.repeatAppend(note.Note(), 8)
+        self.assertEqual(s.seconds, 8.0)
+        self.assertEqual(s.secondsMap[-1]['endTimeSeconds'], 8.0)
+
+        # the change of tempo makes a new tempoMap for secondsMap.
+        mm.number = 120
+        self.assertEqual(s.seconds, 4.0)
+        self.assertEqual(s.secondsMap[-1]['endTimeSeconds'], 4.0)
+
+    def testRecursiveIteratorClassFastPath(self):
+        sc = corpus.parse('bach/bwv66.6')
+        m = sc.parts[0].getElementsByClass(Measure)[2]
+        m.insert(0, Voice([note.Note('G'), note.Rest()]))
+        m.storeAtEnd(bar.Barline('final'))
+
+        def slowList(ri):
+            # a filter that is not a ClassFilter turns off the fast paths
+            return list(ri.addFilter(lambda el: True))
+
+        for makeIterator in (
+            lambda: sc.recurse().notes,
+            lambda: sc.recurse().notesAndRests,
+            lambda: sc.recurse().getElementsByClass(bar.Barline),
+            lambda: sc.recurse().getElementsByClass([Measure, clef.Clef]),
+            lambda: sc.recurse(streamsOnly=True),
+            lambda: sc.recurse(includeSelf=True).getElementsByClass(Stream),
+            lambda: sc.recurse().getElementsByClass(note.GeneralNote).getElementsByClass('Note'),
+            lambda: sc.recurse(restoreActiveSites=False).getElementsByClass(Voice),
+        ):
+            expected = slowList(makeIterator())
+            ri = makeIterator()
+            self.assertIsNotNone(ri.recursiveClassIndexPositions())
+            self.assertEqual(ri.matchingElements(), expected)
+            self.assertEqual(len(makeIterator()), len(expected))
+            self.assertEqual(list(makeIterator()), expected)
+
+        # activeSites are restored by matchingElements
+        n = m.getElementsByClass(Voice).first().notes.first()
+        otherSite = Stream([n])
+        self.assertIs(n.activeSite, otherSite)
+        sc.recurse().notes.matchingElements(restoreActiveSites=False)
+        self.assertIs(n.activeSite, otherSite)
+        sc.recurse().notes.matchingElements()
+        self.assertIs(n.activeSite, m.getElementsByClass(Voice).first())
+
+    def testFlattenIncremental(self):
+        def fullFlatten(s, retainContainers):
+            method = 'flatten_retain_containers' if retainContainers else 'flatten'
+            s._cache.pop(method, None)
+            post = s.flatten(retainContainers=retainContainers)
+            s._cache.pop(method, None)
+            return post
+
+        def assertMatchesFullFlatten(s, retainContainers):
+            incremental = s.flatten(retainContainers=retainContainers, incremental=True)
+            full = fullFlatten(s, retainContainers)
+            self.assertEqual(
+                [(id(e), incremental.elementOffset(e)) for e in incremental.elements],
+                [(id(e), full.elementOffset(e)) for e in full.elements])
+            self.assertEqual(incremental.highestTime, full.highestTime)
+            return incremental
+
+        def containerOf(sc, el):
+            for s in sc.recurse(streamsOnly=True, includeSelf=True):
+                if any(e is el for e in s._elements):
+                    return s
+            return None
+
+        for seed in range(40):
+            rng = random.Random(seed)
+            retainContainers = (seed % 3 == 0)
+            sc = Score()
+            for unused_part in range(2):
+                p = Part()
+                for mNumber in range(1, 5):
+                    m = Measure(number=mNumber)
+                    for i in range(rng.randint(0, 4)):
+                        m.insert(i, note.Note(60 + i))
+                    if rng.random() < 0.3:
+                        m.rightBarline = bar.Barline('final')
+                    p.append(m)
+                sc.insert(0, p)
+            sf = assertMatchesFullFlatten(sc, retainContainers)
+
+            for unused_step in range(25):
+                containers = list(sc.recurse(streamsOnly=True))
+                measures = [s for s in containers if isinstance(s, Measure)]
+                notes = list(sc.recurse().notes)
+                action = rng.randrange(8)
+                if action == 0:
+                    rng.choice(containers).insert(
+                        rng.randint(0, 6) / 2,
+                        note.Note(rng.randint(50, 70), quarterLength=rng.choice([0.5, 1, 2])))
+                elif action == 1 and notes:
+                    n = rng.choice(notes)
+                    containerOf(sc, n).remove(n)
+                elif action == 2 and notes:
+                    n = rng.choice(notes)
+                    containerOf(sc, n).setElementOffset(n, rng.randint(0, 6) / 2)
+                elif action == 3 and notes:
+                    rng.choice(notes).quarterLength = rng.choice([0.5, 1, 3])
+                elif action == 4 and measures:
+                    rng.choice(measures).insert(0, Voice([note.Note('G', quarterLength=0.5)]))
+                elif action == 5 and measures and rng.random() < 0.5:
+                    m = rng.choice(measures)
+                    containerOf(sc, m).remove(m)
+                elif action == 5:
+                    rng.choice(sc.parts).append(Measure([note.Note('A')]))
+                elif action == 6 and notes:
+                    # move a note from one container to another
+                    n = rng.choice(notes)
+                    source = containerOf(sc, n)
+                    destination = rng.choice(containers)
+                    if destination is not source:
+                        source.remove(n)
+                        destination.insert(rng.randint(0, 4), n)
+                elif action == 7 and notes:
+                    rng.choice(notes).priority = rng.randint(-2, 2)
+                if rng.random() < 0.5:
+                    self.assertIs(assertMatchesFullFlatten(sc, retainContainers), sf)
+            self.assertIs(assertMatchesFullFlatten(sc, retainContainers), sf)
+
+        # an object in the hierarchy twice cannot be patched, but still flattens.
+        n = note.Note()
+        s = Stream()
+        s.insert(0, n)
+        sf = s.flatten(incremental=True)
+        s.insert(1, Stream([n]))
+        self.assertIsNot(s.flatten(incremental=True), sf)
+        self.assertEqual(len(s.flatten(incremental=True)), 2)
+        self.assertNotIn('flatten', s._cache['incrementalFlatten'])
+
+    def testTreeStorageMatchesList(self):
+        rng = random.Random(24)
+        plain = Stream()
+        treeStored = Stream()
+        treeStored.treeStorage = True
+        trebleClef = clef.TrebleClef()
+        finalBarline = bar.Barline('final')
+        for s in (plain, treeStored):
+            s.insert(0, trebleClef)
+            s.storeAtEnd(finalBarline)
+
+        def check():
+            self.assertEqual(list(treeStored), list(plain))
+            self.assertEqual([treeStored.elementOffset(e) for e in treeStored],
+                             [plain.elementOffset(e) for e in plain])
+            self.assertEqual(treeStored.highestTime, plain.highestTime)
+            et = treeStored.coreElementTree()
+            self.assertEqual(sorted(id(e) for e in et),
+                             sorted(id(e) for e in treeStored._elements))
+            for e in treeStored._elements:
+                self.assertIn(e, et.elementsStartingAt(treeStored.elementOffset(e)))
+            self.assertEqual(et.endTime, plain.highestTime)
+
+        for i in range(300):
+            choice = rng.random()
+            if choice < 0.45 or len(plain) < 3:
+                n = note.Note(quarterLength=rng.choice([0, 0.5, 1, 4]))
+                if rng.random() < 0.2:
+                    n.priority = -1
+                offset = rng.randint(0, 40) / 2
+                plain.insert(offset, n)
+                treeStored.insert(offset, n)
+                # no need to sort
+                self.assertTrue(treeStored.isSorted)
+            elif choice < 0.65:
+                n = plain[rng.randrange(len(plain) - 1)]
+                plain.remove(n)
+                treeStored.remove(n)
+            elif choice < 0.8:
+                n = plain[rng.randrange(len(plain) - 1)]
+                offset = rng.randint(0, 40) / 2
+                plain.setElementOffset(n, offset)
+                treeStored.setElementOffset(n, offset)
+            elif choice < 0.9:
+                # pop() does not sort the Stream first; getting an item does.
+                index = rng.randrange(len(plain) - 1)
+                self.assertIs(plain[index], treeStored[index])
+                self.assertIs(plain.pop(index), treeStored.pop(index))
+            else:
+                # changes the tree does not follow throw it away
+                n = note.Note(quarterLength=2)
+                plain.append(n)
+                treeStored.append(n)
+                n.quarterLength = 3
+            if i % 10 == 0:
+                check()
+        check()
+        self.assertEqual(treeStored.index(finalBarline), len(treeStored) - 1)
+
+        # the tree is kept, not built again, by the edits that know about it
+        et = treeStored.coreElementTree()
+        treeStored.insert(3.25, note.Note())
+        treeStored.setElementOffset(treeStored[2], 1.75)
+        treeStored.remove(treeStored[1])
+        treeStored.pop(0)
+        self.assertIs(treeStored.coreElementTree(), et)
+        self.assertEqual(len(et), len(treeStored) - 1)
+
+        # a frozen Stream is left as it was by the edits that it refuses
+        frozen = Stream()
+        frozen.treeStorage = True
+        frozen.repeatAppend(note.Note(), 4)
+        frozen.insert(1.5, note.Rest())
+        frozen.freeze()
+        before = list(frozen)
+        with self.assertRaises(ImmutableStreamException):
+            frozen.setElementOffset(frozen[1], 3.25)
+        with self.assertRaises(ImmutableStreamException):
+            frozen.insert(2.25, note.Note())
+        self.assertEqual(list(frozen), before)
+        self.assertEqual(len(frozen._offsetDict), len(before))
+        self.assertEqual(list(frozen.coreElementTree()), before)
 # -----------------------------------------------------------------------------
 
 
@@ -13,6 +13,7 @@ This module defines objects for describing tempo and changes in tempo.
 '''
 from __future__ import annotations
 
+import bisect
 import copy
 import typing as t
 import unittest
@@ -28,7 +29,9 @@ from music21 import spanner
 from music21 import style
 
 if t.TYPE_CHECKING:
-    from music21.common.types import OffsetQLIn
+    from collections.abc import Iterable
+    import numpy as np
+    from music21.common.types import OffsetQL, OffsetQLIn
 
 
 environLocal = environment.Environment('tempo')
@@ -505,6 +508,8 @@ class MetronomeMark(TempoIndication):
             # Music21Object with a duration or None
         else:
             raise TempoException(f'Cannot get a Duration from the supplied object: {value}')
+        # Streams that contain this MetronomeMark cache their TempoMap.
+        self.informSites({'changedElement': 'referent', 'referent': self._referent})
 
     referent = property(_getReferent, _setReferent, doc='''
         Get or set the referent, or the Duration object that is the
@@ -556,10 +561,13 @@ class MetronomeMark(TempoIndication):
         # optional second attribute.
         if not common.isNum(value):
             raise TempoException('cannot set number to a string')
+        oldNumber = self._number
         self._number = common.numToIntOrFloat(value)
         self.numberImplicit = False
         if updateTextFromNumber:
             self._updateTextFromNumber()
+        if self._number != oldNumber:
+            self.informSites({'changedElement': 'number', 'number': self._number})
 
     number = property(_getNumber, _setNumber, doc='''
         Get and set the number, or the numerical value of the Metronome.
@@ -582,7 +590,9 @@ class MetronomeMark(TempoIndication):
     def _setNumberSounding(self, value):
         if not common.isNum(value) and value is not None:
             raise TempoException('cannot set numberSounding to a string')
-        self._numberSounding = value
+        if self._numberSounding != value:
+            self._numberSounding = value
+            self.informSites({'changedElement': 'numberSounding', 'numberSounding': value})
 
     numberSounding = property(_getNumberSounding, _setNumberSounding, doc='''
         Get and set the numberSounding, or the numerical value of the Metronome that
@@ -1316,6 +1326,192 @@ def interpolateElements(element1, element2, sourceStream,
             el.setOffsetBySite(destinationStream, destinationOffset)
 
 
+# ------------------------------------------------------------------------------
+class TempoMap:
+    '''
+    A map between offsets and times in seconds, made from the
+    (start, end, MetronomeMark) boundaries returned by
+    :meth:`~music21.stream.Stream.metronomeMarkBoundaries`.  The number of
+    seconds at the start of each boundary is computed once, so that each
+    conversion needs only a binary search.
+
+    Normally obtained from :meth:`~music21.stream.Stream.tempoMap`, which
+    caches it until the Stream changes:
+
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note(), 8)
+    >>> s.insert(4, tempo.MetronomeMark(number=60))
+    >>> tm = s.tempoMap()
+    >>> tm
+    <music21.tempo.TempoMap 2 regions 0.0 to 8.0 (6.0 seconds)>
+    >>> tm.offsetToSeconds(3.0)
+    1.5
+    >>> tm.offsetToSeconds(6.0)
+    4.0
+    >>> tm.secondsToOffset(4.0)
+    6.0
+
+    Offsets past the end of the Stream count as its end, and offsets
+    before its start as its start:
+
+    >>> tm.offsetToSeconds(100)
+    6.0
+    >>> tm.offsetToSeconds(-1)
+    0.0
+    >>> tm.offsetsToSeconds([-1, 100]).tolist()
+    [0.0, 6.0]
+    >>> tm.secondsToOffset(100)
+    8.0
+
+    The seconds between two offsets:
+
+    >>> tm.secondsBetween(3.0, 5.0)
+    1.5
+
+    NumPy arrays (or any iterable) of offsets or of seconds can be converted
+    all at once:
+
+    >>> tm.offsetsToSeconds([0, 3.0, 6.0]).tolist()
+    [0.0, 1.5, 4.0]
+    >>> tm.secondsToOffsets([0, 1.5, 4.0]).tolist()
+    [0.0, 3.0, 6.0]
+
+    * New in v11.
+    '''
+    __slots__ = ('boundaries', 'starts', 'ends', 'secondsPerQuarter', 'startSeconds')
+
+    def __init__(self,
+                 mmBoundaries: Iterable[tuple[OffsetQL, OffsetQL, MetronomeMark]] = ()):
+        self.boundaries: list[tuple[OffsetQL, OffsetQL, MetronomeMark]] = list(mmBoundaries)
+        self.starts: list[OffsetQL] = [b[0] for b in self.boundaries]
+        self.ends: list[OffsetQL] = [b[1] for b in self.boundaries]
+        self.secondsPerQuarter: list[float] = [
+            b[2].secondsPerQuarter() for b in self.boundaries
+        ]
+        # accumulated in the same order as Stream._accumulatedSeconds() so
+        # that the results are exactly the same.
+        self.startSeconds: list[float] = []
+        totalSeconds = 0.0
+        for start, end, spq in zip(self.starts, self.ends, self.secondsPerQuarter):
+            self.startSeconds.append(totalSeconds)
+            if end > start:
+                totalSeconds += spq * (end - start)
+        self.startSeconds.append(totalSeconds)
+
+    def __repr__(self) -> str:
+        if not self.boundaries:
+            return f'<{self.__module__}.{self.__class__.__name__} empty>'
+        return (f'<{self.__module__}.{self.__class__.__name__} '
+                f'{len(self.boundaries)} regions {self.starts[0]} to {self.ends[-1]} '
+                f'({self.startSeconds[-1]} seconds)>')
+
+    def _regionIndex(self, offset: OffsetQL) -> int:
+        '''
+        Return the index of the last region starting at or before offset.
+
+        Regions that are empty because two MetronomeMarks are at the
+        same offset are skipped, since the next region starts at the same offset.
+        '''
+        return bisect.bisect_right(self.starts, offset) - 1
+
+    def offsetToSeconds(self, offset: OffsetQLIn) -> float:
+        '''
+        Return the time in seconds from the beginning of the map to `offset`.
+        '''
+        if not self.boundaries:
+            return 0.0
+        if offset >= self.ends[-1]:
+            return self.startSeconds[-1]
+        if offset <= self.starts[0]:
+            return 0.0
+        i = self._regionIndex(offset)
+        return self.startSeconds[i] + self.secondsPerQuarter[i] * (offset - self.starts[i])
+
+    def secondsToOffset(self, seconds: float) -> float:
+        '''
+        Return the offset that is `seconds` from the beginning of the map.
+        '''
+        if not self.boundaries:
+            return 0.0
+        if seconds <= 0.0:
+            return float(self.starts[0])
+        if seconds >= self.startSeconds[-1]:
+            return float(self.ends[-1])
+        i = bisect.bisect_right(self.startSeconds, seconds, 0, len(self.boundaries)) - 1
+        return float(self.starts[i] + (seconds - self.startSeconds[i]) / self.secondsPerQuarter[i])
+
+    def secondsBetween(self, start: OffsetQLIn, end: OffsetQLIn) -> float:
+        '''
+        Return the time in seconds between two offsets, counting only
+        the time within the map.
+
+        The regions with `start` and `end` in them are found by binary search;
+        the regions in between are counted from the seconds at their starts.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 12)
+        >>> s.insert(4, tempo.MetronomeMark(number=60))
+        >>> s.insert(8, tempo.MetronomeMark(number=30))
+        >>> tm = s.tempoMap()
+        >>> tm.secondsBetween(1.0, 3.0)
+        1.0
+        >>> tm.secondsBetween(3.0, 9.0)
+        6.5
+        >>> tm.secondsBetween(11.0, 20.0)
+        2.0
+        '''
+        i = self._regionIndex(start)
+        if i < 0 or start >= self.ends[i]:
+            return 0.0
+        secondsPerQuarter = self.secondsPerQuarter
+        if end <= self.ends[i]:
+            return secondsPerQuarter[i] * (end - start)
+
+        # the same order of additions as Stream._accumulatedSeconds() when
+        # there are no whole regions in between.
+        totalSeconds = secondsPerQuarter[i] * (self.ends[i] - start)
+        j = self._regionIndex(end)
+        if j == i:  # end is past the end of the map
+            return totalSeconds
+        if j > i + 1:
+            totalSeconds += self.startSeconds[j] - self.startSeconds[i + 1]
+        activeEnd = end if end < self.ends[j] else self.ends[j]
+        totalSeconds += secondsPerQuarter[j] * (activeEnd - self.starts[j])
+        return totalSeconds
+
+    def offsetsToSeconds(self, offsets: Iterable[OffsetQLIn]) -> np.ndarray:
+        '''
+        Return a NumPy array of the times in seconds of each of the `offsets`,
+        as in :meth:`offsetToSeconds`.
+        '''
+        import numpy as np
+
+        offsetArray = np.asarray(offsets, dtype=np.float64)
+        if not self.boundaries:
+            return np.zeros(offsetArray.shape)
+        starts = np.asarray(self.starts, dtype=np.float64)
+        clipped = np.clip(offsetArray, starts[0], float(self.ends[-1]))
+        i = np.maximum(np.searchsorted(starts, clipped, side='right') - 1, 0)
+        return (np.asarray(self.startSeconds[:-1])[i]
+                + np.asarray(self.secondsPerQuarter)[i] * (clipped - starts[i]))
+
+    def secondsToOffsets(self, seconds: Iterable[float]) -> np.ndarray:
+        '''
+        Return a NumPy array of the offsets at each of the times in `seconds`,
+        as in :meth:`secondsToOffset`.
+        '''
+        import numpy as np
+
+        secondsArray = np.asarray(seconds, dtype=np.float64)
+        if not self.boundaries:
+            return np.zeros(secondsArray.shape)
+        startSeconds = np.asarray(self.startSeconds[:-1])
+        clipped = np.clip(secondsArray, 0.0, self.startSeconds[-1])
+        i = np.maximum(np.searchsorted(startSeconds, clipped, side='right') - 1, 0)
+        starts = np.asarray(self.starts, dtype=np.float64)
+        return starts[i] + (clipped - startSeconds[i]) / np.asarray(self.secondsPerQuarter)[i]
+
+
 # ------------------------------------------------------------------------------
 class TempoChangeSpanner(spanner.Spanner):
     '''
@@ -1763,6 +1959,7 @@ _DOC_ORDER = [MetronomeMark,
               TempoText,
               MetricModulation,
               TempoIndication,
+              TempoMap,
               AccelerandoSpanner,
               RitardandoSpanner,
               TempoChangeSpanner,
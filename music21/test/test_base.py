@@ -102,6 +102,44 @@ class Test(unittest.TestCase):
         self.assertEqual(a, b)
         self.assertEqual(b.id, 'test')
 
+    def testLazyBookkeeping(self):
+        from music21 import chord
+        import pickle
+
+        c = chord.Chord('C4 E4 G4')
+        n = c.notes[0]
+        self.assertEqual(n.getSpannerSites(), [])
+        n.informSites()
+        for obj in (c, n):
+            self.assertIsNone(obj._sites)
+            self.assertIsNone(obj._groups)
+        self.assertIsNone(n._cacheDict)
+
+        cCopy = copy.deepcopy(c)
+        self.assertIsNone(cCopy._sites)
+        self.assertIsNone(cCopy._groups)
+
+        n.groups.append('melody')
+        s = stream.Stream([n])
+        nCopy = copy.deepcopy(n)
+        self.assertIn('melody', nCopy.groups)
+        self.assertIsNot(nCopy.groups, n.groups)
+        self.assertIn(s, n.sites)
+        self.assertNotIn(s, nCopy.sites)
+
+        # state stored before these were created lazily
+        oldState = n.__getstate__()
+        oldState['sites'] = oldState.pop('_sites')
+        oldState['groups'] = oldState.pop('_groups')
+        oldState['_cache'] = {'x': 1}
+        del oldState['_cacheDict']
+        nOld = note.Note.__new__(note.Note)
+        nOld.__setstate__(oldState)
+        self.assertIs(nOld.sites, n.sites)
+        self.assertIn('melody', nOld.groups)
+        self.assertEqual(nOld._cache, {'x': 1})
+        self.assertIn('melody', pickle.loads(pickle.dumps(nCopy)).groups)
+
     def testM21BaseSites(self):
         '''
         Basic testing of M21 base object sites
@@ -792,6 +830,70 @@ class Test(unittest.TestCase):
         self.assertEqual(str(n2.getContextByClass(meter.TimeSignature)),
                          '<music21.meter.TimeSignature 3/4>')
 
+    def testGetContextByClassCache(self):
+        from music21 import chord
+
+        def allContexts(s):
+            out = []
+            for el in s.recurse():
+                for cls in (meter.TimeSignature, clef.Clef, key.KeySignature,
+                            stream.Measure, note.Note, chord.Chord):
+                    for method in (ElementSearch.AT_OR_BEFORE, ElementSearch.AFTER,
+                                   ElementSearch.AT_OR_BEFORE_OFFSET):
+                        out.append(el.getContextByClass(cls, getElementMethod=method))
+            return out
+
+        cache = base.contextCache
+        s = corpus.parse('bwv66.6')
+        try:
+            cache.enabled = False
+            expected = allContexts(s)
+            cache.enabled = True
+            cache.clear()
+            self.assertEqual(allContexts(s), expected)
+            self.assertEqual(cache.hits, 0)
+            misses = cache.misses
+            self.assertEqual(allContexts(s), expected)
+            self.assertEqual(cache.misses, misses)
+            self.assertEqual(cache.hits, misses)
+        finally:
+            cache.enabled = True
+
+        # an edit anywhere in the hierarchy drops stored results
+        n = s.parts[1].recurse().notes.last()
+        m = n.getContextByClass(stream.Measure)
+        oldTs = n.getContextByClass(meter.TimeSignature)
+        newTs = meter.TimeSignature('2/4')
+        m.insert(0, newTs)
+        self.assertIs(n.getContextByClass(meter.TimeSignature), newTs)
+        m.remove(newTs)
+        self.assertIs(n.getContextByClass(meter.TimeSignature), oldTs)
+
+        # results depend on the activeSite, which is part of the key
+        n1 = note.Note('C')
+        s1 = stream.Measure([meter.TimeSignature('3/4'), n1])
+        s2 = stream.Measure([meter.TimeSignature('6/8')])
+        s2.insert(0, n1)
+        n1.activeSite = s1
+        self.assertEqual(n1.getContextByClass(meter.TimeSignature).ratioString, '3/4')
+        n1.activeSite = s2
+        self.assertEqual(n1.getContextByClass(meter.TimeSignature).ratioString, '6/8')
+        n1.activeSite = s1
+        self.assertEqual(n1.getContextByClass(meter.TimeSignature).ratioString, '3/4')
+
+        # stored results do not keep Streams alive
+        import gc
+        import weakref
+        p = stream.Part()
+        p.append(stream.Measure([meter.TimeSignature('5/4'), note.Note()]))
+        n2 = p.recurse().notes.first()
+        self.assertIsNotNone(n2.getContextByClass(stream.Part))
+        partRef = weakref.ref(p)
+        del p
+        gc.collect()
+        self.assertIsNone(partRef())
+        self.assertIsNone(n2.getContextByClass(stream.Part))
+
     def testNextA(self):
         s = stream.Stream()
         sc = scale.MajorScale()
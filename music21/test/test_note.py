@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import contextlib
 import copy
+import fractions
 import unittest
+from unittest import mock
+import weakref
 
 from music21 import articulations
+from music21 import beam
+from music21 import chord
+from music21 import common
 from music21 import corpus
+from music21 import duration
 from music21.duration import DurationTuple
 from music21 import expressions
 from music21.lily.translate import LilypondConverter
 from music21 import meter
 from music21 import note
+from music21 import pitch
+from music21 import spanner
 from music21 import stream
 from music21 import tie
 from music21 import volume
@@ -76,6 +86,133 @@ class Test(unittest.TestCase):
         b = copy.deepcopy(a)
         self.assertEqual(b.name, a.name)
 
+    def assertCopiesMatch(self, original, fast, generic, path='', seen=None):
+        '''
+        Walk the state of two copies of `original` in parallel and check that
+        they are built the same way: same types and values, the same objects
+        shared with the original, and the same references back into the copy.
+        '''
+        if seen is None:
+            seen = {}
+        if generic is original:
+            self.assertIs(fast, original, path)
+            return
+        if id(generic) in seen:
+            self.assertIs(fast, seen[id(generic)], path)
+            return
+        self.assertIs(type(fast), type(generic), path)
+        if type(generic) is int and generic in seen:  # pylint: disable=unidiomatic-typecheck
+            # an id() of an object in the copy, such as Derivation._clientId
+            self.assertEqual(fast, id(seen[generic]), path)
+            return
+        if generic is None or isinstance(generic, (int, float, str, fractions.Fraction)):
+            self.assertEqual(fast, generic, path)
+            return
+        seen[id(generic)] = fast
+        if not isinstance(generic, tuple):
+            # immutable tuples (such as DurationTuples) may be shared
+            self.assertIsNot(fast, original, path)
+
+        if isinstance(generic, weakref.ReferenceType):
+            self.assertCopiesMatch(original() if isinstance(original, weakref.ReferenceType)
+                                   else None,
+                                   fast(), generic(), path + '()', seen)
+        elif isinstance(generic, (list, tuple)):
+            self.assertEqual(len(fast), len(generic), path)
+            for i, (f, g) in enumerate(zip(fast, generic)):
+                o = original[i] if isinstance(original, (list, tuple)) else None
+                self.assertCopiesMatch(o, f, g, f'{path}[{i}]', seen)
+        elif isinstance(generic, dict):
+            self.assertEqual(list(fast), list(generic), path)
+            for k, g in generic.items():
+                o = original.get(k) if isinstance(original, dict) else None
+                self.assertCopiesMatch(o, fast[k], g, f'{path}[{k!r}]', seen)
+        else:
+            def state(obj):
+                out = dict(getattr(obj, '__dict__', {}))
+                if hasattr(obj, '_getSlotsRecursive'):
+                    for slot in obj._getSlotsRecursive():
+                        out[slot] = getattr(obj, slot, None)
+                return out
+
+            fastState = state(fast)
+            genericState = state(generic)
+            originalState = state(original)
+            self.assertEqual(sorted(fastState), sorted(genericState), path)
+            for k, g in genericState.items():
+                if k == 'globalSiteIndex':  # a global counter, different on every copy
+                    continue
+                self.assertCopiesMatch(originalState.get(k), fastState[k], g,
+                                       f'{path}.{k}', seen)
+
+    def testFastDeepcopyMatchesGeneric(self):
+        '''
+        The specialized deepcopy paths of the leaf classes give the same
+        copy as the general deepcopy machinery.
+        '''
+        n = note.Note('E-4', type='16th')
+        n.pitch.microtone = 20
+        n.beams.fill('16th', type='start')
+        n.beams.beamsList[0].style.color = 'red'
+        n.tie = tie.Tie('start')
+        n.tie.placement = 'above'
+        n.lyric = 'la'
+        n.articulations.append(articulations.Staccato())
+        n.expressions.append(expressions.Fermata())
+        n.volume.velocity = 80
+        n.style.color = 'blue'
+        n.groups.append('melody')
+        n.editorial.comments.append('check')
+
+        r = note.Rest('eighth', stepShift=2)
+        r.duration.appendTuplet(duration.Tuplet(3, 2))
+
+        c = chord.Chord(['C4', 'E4', 'G#4'], quarterLength=1/3)
+        c.notes[0].volume.velocity = 40
+        c.notes[1].tie = tie.Tie('stop')
+        c.notes[2].pitch.spellingIsInferred = True
+        c.beams.append('continue')
+
+        s = stream.Stream([n, r, c])
+        s.insert(0, spanner.Slur(n, c))
+
+        bs = beam.Beams()
+        bs.fill('32nd', type='stop')
+        # the Stream keeps the Slur, and so the spanner storage sites, alive
+        objects = [n, r, c, n.pitch, c.notes[2].pitch, n.duration, r.duration, bs]
+
+        fastCopies = [copy.deepcopy(obj) for obj in objects]
+
+        with contextlib.ExitStack() as stack:
+            def generic(*, ignore=()):
+                def genericDeepcopy(self, memo=None):
+                    return common.defaultDeepcopy(self, memo, ignoreAttributes=ignore)
+                return genericDeepcopy
+
+            stack.enter_context(mock.patch.object(common, 'dictDeepcopy',
+                                                  common.defaultDeepcopy))
+            stack.enter_context(mock.patch.object(pitch.Pitch, '__deepcopy__',
+                                                  generic(ignore={'_client'})))
+            stack.enter_context(mock.patch.object(duration.Duration, '__deepcopy__',
+                                                  generic(ignore={'client'})))
+            for cls in (beam.Beam, beam.Beams, tie.Tie):
+                stack.enter_context(mock.patch.object(cls, '__deepcopy__', generic()))
+            genericCopies = [copy.deepcopy(obj) for obj in objects]
+
+        for obj, fast, gen in zip(objects, fastCopies, genericCopies):
+            self.assertEqual(fast, gen)
+            self.assertCopiesMatch(obj, fast, gen, path=type(obj).__name__)
+
+        nCopy, _rCopy, cCopy = fastCopies[:3]
+        self.assertIs(nCopy.pitch._client, nCopy)
+        self.assertIs(nCopy.volume.client, nCopy)
+        self.assertIs(nCopy.derivation.origin, n)
+        self.assertIsNone(nCopy.activeSite)
+        self.assertEqual(nCopy.getSpannerSites(), n.getSpannerSites())
+        for chordNote in cCopy.notes:
+            self.assertIs(chordNote._chordAttached, cCopy)
+            self.assertIs(chordNote.pitch._client, chordNote)
+
     def testMusicXMLFermata(self):
         a = corpus.parse('bach/bwv5.7')
         found = []
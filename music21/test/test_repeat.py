@@ -1672,6 +1672,47 @@ class Test(unittest.TestCase):
         self.assertEqual(exp.partName, 'my_part_name')
         self.assertEqual(exp.partAbbreviation, 'my_part_abbreviation')
 
+    def testUnrolledViewMatchesExpandRepeats(self):
+        def assertSameAsExpanded(p):
+            view = p.unrolledView()
+            post = p.expandRepeats()
+            postMeasures = list(post.getElementsByClass(stream.Measure))
+            self.assertEqual(len(view), len(postMeasures))
+            for (offset, m), mPost in zip(view.items(), postMeasures):
+                self.assertIn(m, p.getElementsByClass(stream.Measure))
+                self.assertEqual(offset, post.elementOffset(mPost))
+                self.assertEqual([n.nameWithOctave for n in m.recurse().notes],
+                                 [n.nameWithOctave for n in mPost.recurse().notes])
+            self.assertEqual(view.highestTime, post.highestTime)
+            self.assertEqual([(offset, n.nameWithOctave) for offset, n
+                              in view.iterElements(note.Note)],
+                             [(n.offset, n.nameWithOctave) for n in post.flatten().notes])
+
+        # repeat brackets
+        s = converter.parse(testFiles.mysteryReel)
+        assertSameAsExpanded(s.parts[0])
+
+        # da capo al fine, with measures that are not numbered
+        m1 = stream.Measure()
+        m1.repeatAppend(note.Note('c4', type='half'), 2)
+        m2 = stream.Measure()
+        m2.repeatAppend(note.Note('e4', type='half'), 2)
+        m2.append(repeat.Fine())
+        m3 = stream.Measure()
+        m3.repeatAppend(note.Note('g4', type='half'), 2)
+        m3.append(repeat.DaCapoAlFine())
+        m4 = stream.Measure()
+        m4.repeatAppend(note.Note('a4', type='half'), 2)
+        p = stream.Part()
+        p.append([m1, m2, m3, m4])
+        self.assertEqual(p.unrolledView().measureIndices, [0, 1, 2, 0, 1])
+        assertSameAsExpanded(p)
+
+        # no repeats at all
+        p = converter.parse('tinyNotation: 4/4 c1 d e')
+        self.assertEqual(p.unrolledView().measureIndices, [0, 1, 2])
+        assertSameAsExpanded(p)
+
 
 if __name__ == '__main__':
     import music21
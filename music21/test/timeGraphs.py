@@ -14,6 +14,7 @@ from __future__ import annotations
 import copy
 import cProfile
 import pstats
+import random
 # import time
 
 import music21
@@ -442,6 +443,92 @@ class TestRecursion(Test):
             pass
 
 
+class TestRecurseGetElementsByClass(Test):
+    '''
+    Class-filtered recursion through a large score: iterating, len(), and
+    matchingElements() (which walks the hierarchy directly when only
+    ClassFilters are used).  Compare to TestRecurseGetElementsByClassSlow.
+    '''
+    def __init__(self):
+        self.score = music21.corpus.parse('beethoven/opus133')
+
+    def iterator(self):
+        return self.score.recurse().getElementsByClass(music21.note.GeneralNote)
+
+    def testFocus(self):
+        for _ in self.iterator():
+            pass
+        len(self.iterator())
+        self.iterator().matchingElements()
+
+
+class TestRecurseGetElementsByClassSlow(TestRecurseGetElementsByClass):
+    def iterator(self):
+        # a filter that is not a ClassFilter checks every element at every level
+        return self.score.recurse().addFilter(
+            lambda el: isinstance(el, music21.note.GeneralNote)
+        )
+
+
+class TestBeatContextCache(Test):
+    '''
+    Beat, beat strength, and beat duration of every note in a large score.
+    Each one looks up the TimeSignature with getContextByClass, so after the
+    first lookup the rest come from base.contextCache.
+    Compare to TestBeatNoContextCache.
+    '''
+    cacheEnabled = True
+
+    def __init__(self):
+        self.score = music21.corpus.parse('beethoven/opus133')
+
+    def testFocus(self):
+        cache = music21.base.contextCache
+        cache.enabled = self.cacheEnabled
+        try:
+            for _ in range(2):
+                for n in self.score.recurse().notes:
+                    unused_beatContext = (n.beat, n.beatStrength, n.beatDuration)
+        finally:
+            cache.enabled = True
+
+
+class TestBeatNoContextCache(TestBeatContextCache):
+    cacheEnabled = False
+
+
+class TestComputeBeats(Test):
+    '''
+    Beat, beat strength, and beat duration of every note in a large score
+    at once.  Compare to TestBeatContextCache.
+    '''
+    def __init__(self):
+        self.score = music21.corpus.parse('beethoven/opus133')
+
+    def testFocus(self):
+        for _ in range(2):
+            self.score.computeBeats()
+
+
+class TestTempoMap(Test):
+    '''
+    secondsMap and offset-to-seconds conversion for every element of a
+    large flat score with a tempo change every ten measures.
+    '''
+    def __init__(self):
+        self.flat = music21.corpus.parse('beethoven/opus133').flatten()
+        for o in range(0, int(self.flat.highestTime), 40):
+            self.flat.insert(o, music21.tempo.MetronomeMark(number=60 + (o % 7) * 10))
+        self.offsets = [el.offset for el in self.flat]
+
+    def testFocus(self):
+        unused_secondsMap = self.flat.secondsMap
+        tempoMap = self.flat.tempoMap()
+        for o in self.offsets:
+            tempoMap.offsetToSeconds(o)
+        tempoMap.offsetsToSeconds(self.offsets)
+
+
 class TestChordifySchumann(Test):
     def __init__(self):
         self.schumann = music21.corpus.parse('schumann_robert/opus41no1/movement1')
@@ -450,6 +537,402 @@ class TestChordifySchumann(Test):
         self.schumann.chordify()
 
 
+class TestChordifyIterSchumann(TestChordifySchumann):
+    def testFocus(self):
+        for unused in self.schumann.chordifyIter():
+            pass
+
+
+class TestStripTiesMidi(Test):
+    '''
+    stripTies on a large score imported from MIDI, with ties at every barline
+    '''
+    def __init__(self):
+        sc = music21.corpus.parse('beethoven/opus133')
+        mf = music21.midi.translate.streamToMidiFile(sc)
+        self.score = music21.midi.translate.midiFileToStream(mf)
+
+    def testFocus(self):
+        self.score.stripTies()
+
+
+class TestMakeNotationMidi(Test):
+    '''
+    makeNotation on the parts of a large score imported from MIDI,
+    flattened so that voices and measures must be made again
+    '''
+    def __init__(self):
+        sc = music21.corpus.parse('beethoven/opus133')
+        mf = music21.midi.translate.streamToMidiFile(sc)
+        sc = music21.midi.translate.midiFileToStream(mf)
+        self.score = music21.stream.Score()
+        for p in sc.parts:
+            self.score.insert(0, p.flatten().notesAndRests.stream())
+
+    def testFocus(self):
+        self.score.makeNotation(inPlace=True)
+
+
+class TestQuantizeLarge(Test):
+    '''
+    quantize on a large flat stream of slightly unquantized notes and chords,
+    as from a MIDI performance
+    '''
+    def __init__(self):
+        rng = random.Random(5)
+        notes = music21.corpus.parse('beethoven/opus133').flatten().notes.stream()
+        self.stream = music21.stream.Stream()
+        for n in notes:
+            o = max(notes.elementOffset(n) + rng.uniform(-0.03, 0.03), 0.0)
+            if n.quarterLength:
+                n.quarterLength = max(n.quarterLength + rng.uniform(-0.04, 0.04), 0.01)
+            self.stream.coreInsert(o, n)
+        self.stream.coreElementsChanged()
+        self.stream.sort()
+
+    def testFocus(self):
+        self.stream.quantize(inPlace=True)
+
+
+class TestUnrolledView(Test):
+    '''
+    Notes of each tune of a folk-tune opus in performance order,
+    from an unrolled view of the repeats.  Compare to TestExpandRepeats.
+    '''
+    def __init__(self):
+        self.parts = [sc.parts.first()
+                      for sc in music21.corpus.parse('airdsAirs/book1.abc').scores]
+
+    def testFocus(self):
+        for p in self.parts:
+            for unused in p.unrolledView().iterElements(music21.note.Note):
+                pass
+
+
+class TestExpandRepeats(Test):
+    '''
+    Notes of each tune of a folk-tune opus in performance order,
+    after expanding the repeats.  Compare to TestUnrolledView.
+    '''
+    def __init__(self):
+        self.parts = [sc.parts.first()
+                      for sc in music21.corpus.parse('airdsAirs/book1.abc').scores]
+
+    def testFocus(self):
+        for p in self.parts:
+            for unused in p.expandRepeats().flatten().notes:
+                pass
+
+
+class TestTransposeCopy(Test):
+    '''
+    Transpose (and thus deepcopy) a large score with many slurs and ties.
+    '''
+    def __init__(self):
+        self.score = music21.corpus.parse('beethoven/opus133')
+
+    def testFocus(self):
+        self.score.transpose('M2')
+
+
+class TestDeepcopyLeaves(Test):
+    '''
+    Deepcopy each Note, Rest, and chordified Chord of a string quartet movement
+    on its own, as transposition, chordify, and makeNotation do.
+    '''
+    def __init__(self):
+        score = music21.corpus.parse('schumann_robert/opus41no1/movement1')
+        self.leaves = list(score.recurse().notesAndRests)
+        self.leaves.extend(score.chordify().recurse().getElementsByClass(music21.chord.Chord))
+
+    def testFocus(self):
+        for leaf in self.leaves:
+            copy.deepcopy(leaf)
+
+
+class TestMemoryPerNote(Test):
+    '''
+    Not timed: prints the memory (from tracemalloc) that a parsed string quartet
+    movement keeps, per Note.
+    '''
+    def testFocus(self):
+        import gc
+        import tracemalloc
+
+        # load the corpus index before measuring.
+        path = music21.corpus.getWork('schumann_robert/opus41no1/movement1')
+        gc.collect()
+        tracemalloc.start()
+        score = music21.corpus.parse(path, forceSource=True)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        numNotes = len(score.recurse().notes)
+        print(f'{numNotes} notes, {retained / numNotes:.0f} bytes per note')
+
+
+class TestEditMemory(Test):
+    '''
+    Not timed: a long run of edits to a chorale, each followed by a flatten()
+    and a Stream made from an iterator, as an editor or generative program would do.
+    Prints the memory (from tracemalloc) retained after each 100 edits and the mean
+    number of sites per Note, which should level off rather than grow.
+    '''
+    def __init__(self):
+        self.sc = music21.corpus.parse('bach/bwv66.6')
+        self.measures = list(self.sc.recurse().getElementsByClass(music21.stream.Measure))
+        self.notes = list(self.sc.recurse().notes)
+
+    def testFocus(self):
+        import gc
+        import tracemalloc
+
+        gc.collect()
+        tracemalloc.start()
+        for i in range(1, 501):
+            m = self.measures[(i * 37) % len(self.measures)]
+            n = music21.note.Note('G', quarterLength=0.5)
+            m.insert(1.5, n)
+            self.sc.flatten()
+            self.sc.recurse().notes.stream()
+            m.remove(n)
+            if i % 100 == 0:
+                gc.collect()
+                retained = tracemalloc.get_traced_memory()[0]
+                sitesPerNote = sum(len(n.sites) for n in self.notes) / len(self.notes)
+                print(f'{i} edits: {retained / 1024:.0f} KiB, {sitesPerNote:.1f} sites per note')
+        tracemalloc.stop()
+
+
+class TestGetElementsByOffsetIndexed(Test):
+    '''
+    Offset queries on a large flat score, using the sorted offset index.
+    Compare to TestGetElementsByOffsetScan.
+    '''
+    def __init__(self):
+        self.flat = music21.corpus.parse('beethoven/opus59no2/movement3').flatten()
+        self.offsets = sorted({n.offset for n in self.flat.notes})
+
+    def testFocus(self):
+        flat = self.flat
+        for o in self.offsets:
+            len(flat.getElementsByOffset(o, o + 1.0, mustBeginInSpan=False))
+            flat.getElementAtOrBefore(o, [music21.meter.TimeSignature])
+
+
+class TestGetElementsByOffsetScan(TestGetElementsByOffsetIndexed):
+    '''
+    The same queries as TestGetElementsByOffsetIndexed, checking every element
+    the way getElementsByOffset and getElementAtOrBefore did before the offset index.
+    '''
+    def testFocus(self):
+        from music21.stream import filters
+        flat = self.flat
+        elements = flat.elements
+        for o in self.offsets:
+            offsetFilter = filters.OffsetFilter(o, o + 1.0, mustBeginInSpan=False)
+            len([e for e in elements
+                 if offsetFilter.isElementOffsetInRange(e, flat.elementOffset(e))])
+            candidates = [e for e in elements
+                          if 'TimeSignature' in e.classSet and flat.elementOffset(e) <= o]
+            max(candidates, key=lambda x: (flat.elementOffset(x), x.sortTuple(flat)))
+
+
+class TestInsertLoop(Test):
+    '''
+    Insert 10,000 notes in order into a Measure in a Part in a Score, one at a time.
+    Compare to TestInsertMany and TestInsertBatchEdit.
+    '''
+    numNotes = 10_000
+
+    def __init__(self):
+        self.notes = [music21.note.Note(quarterLength=0.5) for _ in range(self.numNotes)]
+        self.offsets = [i / 2 for i in range(self.numNotes)]
+        sc = music21.stream.Score()
+        p = music21.stream.Part()
+        sc.insert(0, p)
+        self.m = music21.stream.Measure()
+        p.insert(0, self.m)
+
+    def testFocus(self):
+        for o, n in zip(self.offsets, self.notes):
+            self.m.insert(o, n)
+
+
+class TestInsertMany(TestInsertLoop):
+    def testFocus(self):
+        self.m.insertMany(zip(self.offsets, self.notes))
+
+
+class TestInsertBatchEdit(TestInsertLoop):
+    def testFocus(self):
+        with self.m.batchEdit():
+            for o, n in zip(self.offsets, self.notes):
+                self.m.insert(o, n)
+
+
+class TestFlattenAfterEdit(Test):
+    '''
+    Insert a note into a Measure of a four-Part Score and flatten the Score
+    again, 200 times.  Compare to TestFlattenIncrementalAfterEdit.
+    '''
+    incremental = False
+
+    def __init__(self):
+        sc = music21.stream.Score()
+        for unused_part in range(4):
+            p = music21.stream.Part()
+            for i in range(200):
+                m = music21.stream.Measure(number=i + 1)
+                for pitchNumber in range(60, 64):
+                    m.append(music21.note.Note(pitchNumber))
+                p.append(m)
+            sc.insert(0, p)
+        self.sc = sc
+        self.measures = list(sc.recurse().getElementsByClass(music21.stream.Measure))
+        sc.flatten(incremental=self.incremental)
+
+    def testFocus(self):
+        for i in range(200):
+            m = self.measures[(i * 37) % len(self.measures)]
+            m.insert(1.5, music21.note.Note('G', quarterLength=0.5))
+            self.sc.flatten(incremental=self.incremental)
+
+
+class TestFlattenIncrementalAfterEdit(TestFlattenAfterEdit):
+    incremental = True
+
+
+class TestTreesFromDeepScore(Test):
+    '''
+    Build flattened timespan, offset, and element trees directly from a large
+    (not flat) score, as analysis and chordify do.
+    '''
+    def __init__(self):
+        self.score = music21.corpus.parse('beethoven/opus59no2/movement3')
+
+    def testFocus(self):
+        from music21 import tree
+        tree.fromStream.asTimespans(self.score, flatten=True,
+                                    classList=(music21.note.Note, music21.chord.Chord))
+        tree.fromStream.asTree(self.score, flatten=True, groupOffsets=True)
+        tree.fromStream.asTree(self.score, flatten=True)
+
+
+class TestTimespansOverlapping(Test):
+    '''
+    One-beat window queries over the timespans of a large score.
+    Compare to TestTimespansOverlappingScan.
+    '''
+    def __init__(self):
+        score = music21.corpus.parse('beethoven/opus59no2/movement3')
+        self.tsTree = score.asTimespans(classList=(music21.note.Note, music21.chord.Chord))
+        self.offsets = self.tsTree.allOffsets()
+
+    def testFocus(self):
+        tsTree = self.tsTree
+        for o in self.offsets:
+            tsTree.overlapping(o, o + 1.0)
+
+
+class TestIterateVerticalities(Test):
+    '''
+    Iterate over every verticality of a large score, searching the tree for each one.
+    Compare to TestIterateVerticalitiesSweep.
+    '''
+    sweep = False
+
+    def __init__(self):
+        score = music21.corpus.parse('beethoven/opus59no2/movement3')
+        self.tsTree = score.asTimespans(classList=(music21.note.Note, music21.chord.Chord))
+
+    def testFocus(self):
+        for unused in self.tsTree.iterateVerticalities(sweep=self.sweep):
+            pass
+
+
+class TestIterateVerticalitiesSweep(TestIterateVerticalities):
+    sweep = True
+
+
+class TestTimespansOverlappingScan(TestTimespansOverlapping):
+    '''
+    The same queries as TestTimespansOverlapping, checking every timespan.
+    '''
+    def testFocus(self):
+        timespans = list(self.tsTree)
+        for o in self.offsets:
+            end = o + 1.0
+            tuple(ts for ts in timespans if ts.offset < end and o < ts.endTime)
+
+
+class TestRandomInsert(Test):
+    '''
+    Insert 500 notes at random places in a Stream of 5,000 notes, checking
+    the highestTime after each one, as an editor would.
+    Compare to TestRandomInsertTreeStorage.
+    '''
+    treeStorage = False
+
+    def __init__(self):
+        rng = random.Random(24)
+        self.s = music21.stream.Stream()
+        self.s.append([music21.note.Note() for _ in range(5000)])
+        self.s.treeStorage = self.treeStorage
+        self.offsets = [rng.randrange(20_000) / 4 for _ in range(500)]
+
+    def testFocus(self):
+        s = self.s
+        for o in self.offsets:
+            s.insert(o, music21.note.Note('G', quarterLength=0.5))
+            unused_highestTime = s.highestTime
+
+
+class TestRandomInsertTreeStorage(TestRandomInsert):
+    treeStorage = True
+
+
+class TestRandomRemove(TestRandomInsert):
+    '''
+    Remove 500 notes from random places in a Stream of 5,000 notes, checking
+    the highestTime after each one.  Compare to TestRandomRemoveTreeStorage.
+    '''
+    def __init__(self):
+        super().__init__()
+        self.toRemove = random.Random(24).sample(list(self.s), 500)
+
+    def testFocus(self):
+        s = self.s
+        for n in self.toRemove:
+            s.remove(n)
+            unused_highestTime = s.highestTime
+
+
+class TestRandomRemoveTreeStorage(TestRandomRemove):
+    treeStorage = True
+
+
+class TestThawTimespans(Test):
+    '''
+    Thaw a frozen large score and get its timespans, building the tree again.
+    Compare to TestThawTimespansFrozenTree.
+    '''
+    timespanTrees = False
+
+    def __init__(self):
+        score = music21.corpus.parse('beethoven/opus59no2/movement3')
+        score.asTimespans(classList=(music21.note.Note, music21.chord.Chord))
+        self.data = music21.converter.freezeStr(score, timespanTrees=self.timespanTrees)
+
+    def testFocus(self):
+        s = music21.converter.thawStr(self.data)
+        s.asTimespans(classList=(music21.note.Note, music21.chord.Chord))
+
+
+class TestThawTimespansFrozenTree(TestThawTimespans):
+    timespanTrees = True
+
+
 def main(TestClass):
     MIN_FRACTION_TO_REPORT = 0.3
 
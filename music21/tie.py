@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import unittest
 
+from music21 import common
 from music21 import exceptions21
 from music21.common.objects import SlottedObjectMixin
 from music21 import prebase
@@ -145,6 +146,31 @@ class Tie(prebase.ProtoM21Object, SlottedObjectMixin):
     def __hash__(self):
         return id(self) >> 4
 
+    def __deepcopy__(self, memo=None):
+        '''
+        All the slots of a Tie hold scalars, so a plain Tie is copied
+        by setting them directly:
+
+        >>> import copy
+        >>> t1 = tie.Tie('stop')
+        >>> t1.placement = 'below'
+        >>> t2 = copy.deepcopy(t1)
+        >>> t2 == t1, t2 is t1
+        (True, False)
+        >>> t2.placement
+        'below'
+
+        * New in v11.
+        '''
+        if type(self) is not Tie:  # pylint: disable=unidiomatic-typecheck
+            return common.defaultDeepcopy(self, memo)
+        new = Tie.__new__(Tie)
+        new.id = self.id
+        new.type = self.type
+        new.style = self.style
+        new.placement = self.placement
+        return new
+
     def _reprInternal(self):
         return self.type
 
@@ -551,7 +551,8 @@ class AVLTree[PayloadType](prebase.ProtoM21Object):
         31 vs. 300ms for 10,000 items) than running createNodeAtPosition()
         for each element in a list if it is
         already sorted.  Thus, it should be used when converting a
-        Stream where .isSorted is True into a tree.
+        Stream where .isSorted is True into a tree.  The list is never sliced,
+        so building is O(n).
 
         This method assumes that the current tree is empty (or will be wiped) and
         that listOfTuples is a non-empty
@@ -587,24 +588,22 @@ class AVLTree[PayloadType](prebase.ProtoM21Object):
         <AVLNode: Start:1 Height:1 L:0 R:0> '1'
         <AVLNode: Start:0 Height:0 L:None R:None> '0'
         '''
-        def recurse(
-            subListOfTuples: list[tuple[AVLPosition, PayloadType]]
-        ) -> AVLNode[PayloadType] | None:
+        def recurse(start: int, stop: int) -> AVLNode[PayloadType] | None:
             '''
-            Divide and conquer.
+            Divide and conquer on listOfTuples[start:stop], without copying it.
             '''
-            if not subListOfTuples:
+            if start >= stop:
                 return None
-            midpoint = len(subListOfTuples) // 2
-            midtuple = subListOfTuples[midpoint]
+            midpoint = start + (stop - start) // 2
+            midtuple = listOfTuples[midpoint]
             n = NodeClass(midtuple[0], midtuple[1])
-            n.leftChild = recurse(subListOfTuples[:midpoint])
-            n.rightChild = recurse(subListOfTuples[midpoint + 1:])
+            n.leftChild = recurse(start, midpoint)
+            n.rightChild = recurse(midpoint + 1, stop)
             n.update()
             return n
 
         NodeClass = self.nodeClass
-        self.rootNode = recurse(listOfTuples)
+        self.rootNode = recurse(0, len(listOfTuples))
 
     def createNodeAtPosition(self, position: AVLPosition) -> None:
         '''
@@ -717,27 +716,27 @@ class AVLTree[PayloadType](prebase.ProtoM21Object):
         >>> scoreTree = score.asTree(flatten=True)
         >>> node1 = scoreTree.getNodeAfter(0.5)
         >>> node1
-        <ElementNode: Start:1.0 <0.20...> Indices:(l:27 *29* r:33) Payload:<music21.note.Note A>>
+        <ElementNode: Start:1.0 <0.20...> Indices:(l:29 *29* r:30) Payload:<music21.note.Note A>>
         >>> node2 = scoreTree.getNodeAfter(0.6)
         >>> node2 is node1
         True
 
         >>> endNode = scoreTree.getNodeAfter(9999)
         >>> endNode
-        <ElementNode: Start:End <0.-5...> Indices:(l:191 *195* r:199)
+        <ElementNode: Start:End <0.-5...> Indices:(l:194 *195* r:196)
                Payload:<music21.bar.Barline type=final>>
 
         >>> while endNode is not None:
         ...     print(endNode)
         ...     endNodePosition = endNode.position
         ...     endNode = scoreTree.getNodeAfter(endNodePosition)
-        <ElementNode: Start:End <0.-5...> Indices:(l:191 *195* r:199)
+        <ElementNode: Start:End <0.-5...> Indices:(l:194 *195* r:196)
             Payload:<music21.bar.Barline type=final>>
-        <ElementNode: Start:End <0.-5...> Indices:(l:196 *196* r:197)
+        <ElementNode: Start:End <0.-5...> Indices:(l:194 *196* r:199)
             Payload:<music21.bar.Barline type=final>>
-        <ElementNode: Start:End <0.-5...> Indices:(l:196 *197* r:199)
+        <ElementNode: Start:End <0.-5...> Indices:(l:197 *197* r:198)
             Payload:<music21.bar.Barline type=final>>
-        <ElementNode: Start:End <0.-5...> Indices:(l:198 *198* r:199)
+        <ElementNode: Start:End <0.-5...> Indices:(l:197 *198* r:199)
             Payload:<music21.bar.Barline type=final>>
 
         >>> note1 = score.flatten().notes[30]
@@ -749,7 +748,7 @@ class AVLTree[PayloadType](prebase.ProtoM21Object):
         SortTuple(atEnd=0, offset=6.0, priority=0, classSortOrder=20, isNotGrace=1, insertIndex=...)
 
         >>> scoreTree.getNodeAfter(st)
-        <ElementNode: Start:6.5 <0.20...> Indices:(l:55 *56* r:57)
+        <ElementNode: Start:6.5 <0.20...> Indices:(l:50 *56* r:62)
             Payload:<music21.note.Note D>>
         '''
         def recurse(
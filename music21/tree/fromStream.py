@@ -104,6 +104,8 @@ def listOfTreesByClass(
         outputTrees = [treeClass(source=lastParentage)]
     else:
         outputTrees = [treeClass(source=lastParentage) for _ in classLists]
+    # gather everything first and build each tree at once at the end.
+    treeContents: list[list[tuple[t.Any, t.Any]]] = [[] for _ in outputTrees]
     # do this to avoid munging activeSites
     inputStreamElements = inputStream._elements[:] + inputStream._endElements
     for element in inputStreamElements:
@@ -119,11 +121,13 @@ def listOfTreesByClass(
                                                 flatten=flatten,
                                                 classLists=classLists,
                                                 useTimespans=useTimespans)
-            for outputTree, subTree in zip(outputTrees, containedTrees):
+            for contents, subTree in zip(treeContents, containedTrees):
                 if flatten is not False:  # True or semiFlat
-                    outputTree.insert(subTree[:])
+                    contents.extend((node.position, el)
+                                    for node in subTree.iterNodes()
+                                    for el in node.payload)
                 else:
-                    outputTree.insert(subTree.lowestPosition(), subTree)
+                    contents.append((subTree.lowestPosition(), subTree))
             wasStream = True
 
         if not wasStream or flatten == 'semiFlat':
@@ -131,7 +135,7 @@ def listOfTreesByClass(
             parentEndTime = initialOffset + lastParentage.duration.quarterLength
             endTime = offset + element.duration.quarterLength
 
-            for classBasedTree, classList in zip(outputTrees, classLists):
+            for contents, classList in zip(treeContents, classLists):
                 if classList and element.classSet.isdisjoint(classList):
                     continue
                 if useTimespans:
@@ -146,10 +150,12 @@ def listOfTreesByClass(
                                                 parentEndTime=parentEndTime,
                                                 offset=offset,
                                                 endTime=endTime)
-                    classBasedTree.insert(elementTimespan)
+                    contents.append((offset, elementTimespan))
                 else:
-                    classBasedTree.insert(offset, element)
+                    contents.append((offset, element))
 
+    for outputTree, contents in zip(outputTrees, treeContents):
+        populateFromUnsortedList(outputTree, contents)
     return outputTrees
 
 
@@ -184,19 +190,19 @@ def asTree(
 
     >>> for x in etFlat.iterNodes():
     ...     x
-    <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:2)
+    <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:1)
         Payload:<music21.instrument.Instrument 'PartA: : '>>
-    <ElementNode: Start:0.0 <0.-25...> Indices:(l:1 *1* r:2)
+    <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *1* r:2)
         Payload:<music21.instrument.Instrument 'PartB: : '>>
-    <ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:4) Payload:<music21.clef.BassClef>>
+    <ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:5) Payload:<music21.clef.BassClef>>
     <ElementNode: Start:0.0 <0.0...> Indices:(l:3 *3* r:4) Payload:<music21.clef.BassClef>>
     ...
-    <ElementNode: Start:0.0 <0.20...> Indices:(l:5 *6* r:8) Payload:<music21.note.Note C>>
-    <ElementNode: Start:0.0 <0.20...> Indices:(l:7 *7* r:8) Payload:<music21.note.Note C#>>
-    <ElementNode: Start:1.0 <0.20...> Indices:(l:0 *8* r:20) Payload:<music21.note.Note D>>
+    <ElementNode: Start:0.0 <0.20...> Indices:(l:6 *6* r:7) Payload:<music21.note.Note C>>
+    <ElementNode: Start:0.0 <0.20...> Indices:(l:6 *7* r:8) Payload:<music21.note.Note C#>>
+    <ElementNode: Start:1.0 <0.20...> Indices:(l:6 *8* r:10) Payload:<music21.note.Note D>>
     ...
-    <ElementNode: Start:7.0 <0.20...> Indices:(l:15 *17* r:20) Payload:<music21.note.Note C>>
-    <ElementNode: Start:End <0.-5...> Indices:(l:18 *18* r:20)
+    <ElementNode: Start:7.0 <0.20...> Indices:(l:16 *17* r:18) Payload:<music21.note.Note C>>
+    <ElementNode: Start:End <0.-5...> Indices:(l:16 *18* r:20)
         Payload:<music21.bar.Barline type=final>>
     <ElementNode: Start:End <0.-5...> Indices:(l:19 *19* r:20)
         Payload:<music21.bar.Barline type=final>>
@@ -213,12 +219,9 @@ def asTree(
             innerStream,
             currentParentage,
             initialOffset,
-            inner_outputTree=None):
+            positionsAndElements):
         lastParentage = currentParentage[-1]
 
-        if inner_outputTree is None:
-            inner_outputTree = treeClass(source=lastParentage)
-
         # do this to avoid munging activeSites
         innerStreamElements = innerStream._elements[:] + innerStream._endElements
         parentEndTime = initialOffset + lastParentage.duration.quarterLength
@@ -228,10 +231,10 @@ def asTree(
 
             if element.isStream and flatten is not False:  # True or 'semiFlat'
                 localParentage = currentParentage + (element,)
-                recurseGetTreeByClass(element,  # put the elements into the current tree
+                recurseGetTreeByClass(element,  # put the elements into the current list
                                       currentParentage=localParentage,
                                       initialOffset=flatOffset,
-                                      inner_outputTree=inner_outputTree)
+                                      positionsAndElements=positionsAndElements)
                 if flatten != 'semiFlat':
                     continue  # do not insert the stream itself unless we are doing semiflat
 
@@ -247,16 +250,16 @@ def asTree(
                     parentEndTime=parentEndTime,
                     offset=flatOffset,
                     endTime=endTime)
-                inner_outputTree.insert(pitchedTimespan)
+                positionsAndElements.append((flatOffset, pitchedTimespan))
             elif groupOffsets is False:
                 # for sortTuples
                 position = element.sortTuple(lastParentage)
                 flatPosition = position.modify(offset=flatOffset)
-                inner_outputTree.insert(flatPosition, element)
+                positionsAndElements.append((flatPosition, element))
             else:
-                inner_outputTree.insert(flatOffset, element)
+                positionsAndElements.append((flatOffset, element))
 
-        return inner_outputTree
+        return positionsAndElements
 
     # first time through
     treeClass: type[trees.ElementTree]
@@ -275,16 +278,57 @@ def asTree(
 
     # check to see if we can shortcut and make a Tree very fast from a sorted list.
     if (inputStream.isSorted
-            and groupOffsets is False  # currently we can't populate for an OffsetTree*
+            and treeClass is trees.ElementTree  # OffsetTrees need grouping, below.
             and (inputStream.isFlat or flatten is False)):
         outputTree: trees.OffsetTree|trees.ElementTree = treeClass(source=inputStream)
         return makeFastShallowTreeFromSortedStream(inputStream,
                                                    outputTree=outputTree,
                                                    classList=classList)
     else:
-        return recurseGetTreeByClass(inputStream,
-                                     currentParentage=(inputStream,),
-                                     initialOffset=0.0)
+        outputTree = treeClass(source=inputStream)
+        positionsAndElements = recurseGetTreeByClass(inputStream,
+                                                     currentParentage=(inputStream,),
+                                                     initialOffset=0.0,
+                                                     positionsAndElements=[])
+        populateFromUnsortedList(outputTree, positionsAndElements)
+        return outputTree
+
+
+def populateFromUnsortedList(
+    outputTree: trees.OffsetTree|trees.ElementTree,
+    positionsAndElements: list[tuple[t.Any, t.Any]],
+) -> None:
+    '''
+    Sorts a list of (position, element) tuples (in place) by position and
+    builds `outputTree` from it in a single balanced pass, which is O(n log n) for the sort
+    and O(n) for the tree, rather than inserting (and rebalancing, and reindexing) one
+    element at a time, which is O(n^2) for a deep score.
+
+    Elements with equal positions keep their order in the list, so
+    the resulting tree is the same as one made by inserting each element in turn.
+    For an ElementTree, where there can be only one element at a position, the
+    last element at that position wins, just as with insert().
+
+    >>> notes = [note.Note('C'), note.Note('D'), note.Note('E')]
+    >>> ot = tree.trees.OffsetTree()
+    >>> tree.fromStream.populateFromUnsortedList(ot, [(2.0, notes[0]), (0.0, notes[1]),
+    ...                                                (2.0, notes[2])])
+    >>> for n in ot:
+    ...     n
+    <music21.note.Note D>
+    <music21.note.Note C>
+    <music21.note.Note E>
+
+    * New in v11.
+    '''
+    positionsAndElements.sort(key=lambda pe: pe[0])
+    if not isinstance(outputTree, trees.OffsetTree):
+        # keep only the last element at any position
+        positionsAndElements = [
+            pe for i, pe in enumerate(positionsAndElements)
+            if i == len(positionsAndElements) - 1 or pe[0] != positionsAndElements[i + 1][0]
+        ]
+    outputTree.populateFromSortedList(positionsAndElements)
 
 def makeFastShallowTreeFromSortedStream(
     inputStream: stream.Stream,
@@ -308,8 +352,6 @@ def makeFastShallowTreeFromSortedStream(
         elementTupleList = [(e.sortTuple(inputStream), e) for e in inputStreamElements
                             if not e.classSet.isdisjoint(classList)]
     outputTree.populateFromSortedList(elementTupleList)
-    if outputTree.rootNode is not None:
-        outputTree.rootNode.updateEndTimes()
     return outputTree
 
 
@@ -376,6 +418,66 @@ def asTimespans(
     return timespanTreeFirst
 
 
+def sortedTimespans(
+    inputStream: stream.Stream,
+    *,
+    classList: Sequence[type[Music21Object]]|None = None
+) -> list[spans.ElementTimespan]:
+    r'''
+    Recurses through a score and returns a list of the timespans (flattened)
+    that :func:`asTimespans` would put in a TimespanTree, sorted by offset and then
+    by endTime, in the same order that they would be found in the tree.
+
+    Cheaper than building the tree when the timespans only need to be
+    gone through in order, as in
+    :func:`~music21.tree.verticality.sweepVerticalities`.
+
+    >>> score = tree.examples.makeExampleScore()
+    >>> for ts in tree.fromStream.sortedTimespans(score, classList=(note.Note,))[:4]:
+    ...     ts
+    <PitchedTimespan (0.0 to 1.0) <music21.note.Note C>>
+    <PitchedTimespan (0.0 to 2.0) <music21.note.Note C#>>
+    <PitchedTimespan (1.0 to 2.0) <music21.note.Note D>>
+    <PitchedTimespan (2.0 to 3.0) <music21.note.Note E>>
+
+    >>> scoreTree = tree.fromStream.asTimespans(score, flatten=True, classList=(note.Note,))
+    >>> timespans = tree.fromStream.sortedTimespans(score, classList=(note.Note,))
+    >>> [ts.element for ts in timespans] == [ts.element for ts in scoreTree]
+    True
+
+    * New in v11.
+    '''
+    timespans: list[spans.ElementTimespan] = []
+
+    def recurse(innerStream, currentParentage, initialOffset):
+        lastParentage = currentParentage[-1]
+        parentage = tuple(reversed(currentParentage))
+        parentEndTime = initialOffset + lastParentage.duration.quarterLength
+        # do this to avoid munging activeSites
+        for element in innerStream._elements + innerStream._endElements:
+            offset = lastParentage.elementOffset(element) + initialOffset
+            if element.isStream:
+                recurse(element, currentParentage + (element,), offset)
+                continue
+            if classList and element.classSet.isdisjoint(classList):
+                continue
+            spanClass: type[spans.ElementTimespan]
+            if isinstance(element, note.NotRest):
+                spanClass = spans.PitchedTimespan
+            else:
+                spanClass = spans.ElementTimespan
+            timespans.append(spanClass(element=element,
+                                       parentage=parentage,
+                                       parentOffset=initialOffset,
+                                       parentEndTime=parentEndTime,
+                                       offset=offset,
+                                       endTime=offset + element.duration.quarterLength))
+
+    recurse(inputStream, (inputStream,), 0.0)
+    timespans.sort(key=lambda ts: (ts.offset, ts.endTime))
+    return timespans
+
+
 # --------------------
 class Test(unittest.TestCase):
 
@@ -248,6 +248,19 @@ class ElementNode[PayloadType](core.AVLNode[PayloadType]):
             self.rightChild.updateIndices(parentStopIndex=self.subtreeElementsStopIndex)
             self.subtreeElementsStopIndex = self.rightChild.subtreeElementsStopIndex
 
+    def update(self):
+        r'''
+        Updates the height and balance attributes of the node, as
+        :meth:`~music21.tree.core.AVLNode.update` does, and also its endTimeLow and
+        endTimeHigh, from its children's.  Since every node that is moved when the
+        tree is rebalanced is updated, the endTimes stay correct as nodes
+        are created and removed.
+
+        * Changed in v11: updates endTimes as well.
+        '''
+        super().update()
+        self.updateLocalEndTimes()
+
     def updateEndTimes(self):
         r'''
         Traverses the tree structure and updates cached maximum and minimum
@@ -257,30 +270,68 @@ class ElementNode[PayloadType](core.AVLNode[PayloadType]):
 
         Returns None.
         '''
-        try:
-            endTimeLow = self.payload.endTime
-            endTimeHigh = endTimeLow
-        except AttributeError:  # elements do not have endTimes. do NOT mix elements and timespans.
-            pos = self.position
-            if isinstance(pos, SortTuple):
-                pos = pos.offset
-            endTimeLow = pos + self.payload.duration.quarterLength
-            endTimeHigh = endTimeLow
-
         leftChild = self.leftChild
         if leftChild:
             leftChild.updateEndTimes()
-            endTimeLow = min(endTimeLow, leftChild.endTimeLow)
-            endTimeHigh = max(endTimeHigh, leftChild.endTimeHigh)
-
         rightChild = self.rightChild
         if rightChild:
             rightChild.updateEndTimes()
-            endTimeLow = min(endTimeLow, rightChild.endTimeLow)
-            endTimeHigh = max(endTimeHigh, rightChild.endTimeHigh)
+        self.updateLocalEndTimes()
+
+    def updateLocalEndTimes(self):
+        r'''
+        Sets endTimeLow and endTimeHigh from the payload of this node and
+        the endTimes already cached on its children, without traversing the tree.
+
+        A node without a payload (such as one that has just been created)
+        or a child whose endTimes have not been set is skipped.
+
+        >>> n = tree.node.ElementNode(4.0, note.Note(type='half'))
+        >>> n.endTimeLow is None
+        True
+        >>> n.updateLocalEndTimes()
+        >>> n.endTimeLow, n.endTimeHigh
+        (6.0, 6.0)
+
+        * New in v11.
+        '''
+        endTimes = self.payloadEndTimeRange()
+        if endTimes is None:
+            endTimeLow = endTimeHigh = None
+        else:
+            endTimeLow, endTimeHigh = endTimes
+
+        for child in (self.leftChild, self.rightChild):
+            if child is None or child.endTimeLow is None:
+                continue
+            if endTimeLow is None:
+                endTimeLow = child.endTimeLow
+                endTimeHigh = child.endTimeHigh
+            else:
+                endTimeLow = min(endTimeLow, child.endTimeLow)
+                endTimeHigh = max(endTimeHigh, child.endTimeHigh)
         self.endTimeLow = endTimeLow
         self.endTimeHigh = endTimeHigh
 
+    def payloadEndTimeRange(self):
+        r'''
+        Returns a tuple of the lowest and highest endTime of the payload of this node
+        (the same, since an ElementNode holds one element), or None if there is no payload.
+
+        * New in v11.
+        '''
+        payload = self.payload
+        if payload is None:
+            return None
+        if isinstance(payload, Music21Object):  # elements do not have endTimes.
+            pos = self.position
+            if isinstance(pos, SortTuple):
+                pos = pos.offset
+            endTime = pos + payload.duration.quarterLength
+        else:
+            endTime = payload.endTime
+        return (endTime, endTime)
+
 
 # -----------------------------------------------------------------------------
 class OffsetNode(ElementNode[list[object]]):
@@ -317,39 +368,40 @@ class OffsetNode(ElementNode[list[object]]):
     >>> scoreTree = tree.fromStream.asTimespans(sf, flatten=False, classList=None)
     >>> rn = scoreTree.rootNode
 
-    The RootNode here represents the starting position of the Note F at 3.0; it is the center
-    of the elements in the flat Stream.  Its index is 5 (that is, it's the sixth note in the
-    element list) and its offset is 3.0.
+    The RootNode here represents the starting position of the Notes G and E# at 4.0; it is
+    the center of the offsets in the flat Stream.  Its first index is 12 (that is, the G is the
+    thirteenth element in the element list) and its offset is 4.0.
 
     >>> rn
-    <OffsetNode 3.0 Indices:0,11,12,20 Length:1>
-    >>> sf[11]
-    <music21.note.Note F>
-    >>> sf[11].offset
-    3.0
+    <OffsetNode 4.0 Indices:0,12,14,20 Length:2>
+    >>> sf[12]
+    <music21.note.Note G>
+    >>> sf[12].offset
+    4.0
 
-    Thus, the indices of 0,11,12,20 indicate that the left-side of the node handles indices
-    from >= 0 to < 11; and the right-side of the node handles indices >= 12 and < 20, and this node
-    handles indices >= 11 and < 12.
+    Thus, the indices of 0,12,14,20 indicate that the left-side of the node handles indices
+    from >= 0 to < 12; and the right-side of the node handles indices >= 14 and < 20, and this node
+    handles indices >= 12 and < 14.
 
-    The `Length: 1` indicates that there is exactly one element at this location, that is,
-    the F.
+    The `Length: 2` indicates that there are exactly two elements at this location, that is,
+    the G and the E#.
 
-    The "payload" of the node is just that element wrapped in a list wrapped in an
-    ElementTimespan or PitchedTimespan:
+    The "payload" of the node is just those elements wrapped in ElementTimespans or
+    PitchedTimespans in a list:
 
     >>> rn.payload
-    [<PitchedTimespan (3.0 to 4.0) <music21.note.Note F>>]
+    [<PitchedTimespan (4.0 to 5.0) <music21.note.Note G>>,
+     <PitchedTimespan (4.0 to 6.0) <music21.note.Note E#>>]
     >>> rn.payload[0].element
-    <music21.note.Note F>
-    >>> rn.payload[0].element is sf[11]
+    <music21.note.Note G>
+    >>> rn.payload[0].element is sf[12]
     True
 
     We can look at the leftChild of the root node to get some more interesting cases:
 
     >>> left = rn.leftChild
     >>> left
-    <OffsetNode 1.0 Indices:0,8,9,11 Length:1>
+    <OffsetNode 1.0 Indices:0,8,9,12 Length:1>
 
     In the leftNode of the leftNode of the rootNode there are eight elements:
     metadata and both notes that begin on offset 0.0:
@@ -488,35 +540,34 @@ class OffsetNode(ElementNode[list[object]]):
             self.rightChild.updateIndices(parentStopIndex=self.payloadElementsStopIndex)
             self.subtreeElementsStopIndex = self.rightChild.subtreeElementsStopIndex
 
-    def updateEndTimes(self):
+    def payloadEndTimeRange(self):
         r'''
-        Traverses the tree structure and updates cached maximum and minimum
-        endTime values for the subtrees rooted at each node.
+        Returns a tuple of the lowest and highest endTime of the elements in the payload,
+        or None if the payload is empty.
 
-        Used internally by OffsetTree.
-
-        Returns None
+        >>> offsetNode = tree.node.OffsetNode(40)
+        >>> offsetNode.payloadEndTimeRange() is None
+        True
+        >>> offsetNode.payload.append(note.Note(type='whole'))
+        >>> offsetNode.payload.append(note.Note(type='eighth'))
+        >>> offsetNode.payloadEndTimeRange()
+        (40.5, 44.0)
+
+        * New in v11.
         '''
-        try:
-            endTimeLow = min(x.endTime for x in self.payload)
-            endTimeHigh = max(x.endTime for x in self.payload)
-        except AttributeError:  # elements do not have endTimes. do NOT mix elements and timespans.
-            endTimeLow = self.position + min(x.duration.quarterLength for x in self.payload)
-            endTimeHigh = self.position + max(x.duration.quarterLength for x in self.payload)
-
-        leftChild = self.leftChild
-        if leftChild:
-            leftChild.updateEndTimes()
-            endTimeLow = min(endTimeLow, leftChild.endTimeLow)
-            endTimeHigh = max(endTimeHigh, leftChild.endTimeHigh)
-
-        rightChild = self.rightChild
-        if rightChild:
-            rightChild.updateEndTimes()
-            endTimeLow = min(endTimeLow, rightChild.endTimeLow)
-            endTimeHigh = max(endTimeHigh, rightChild.endTimeHigh)
-        self.endTimeLow = endTimeLow
-        self.endTimeHigh = endTimeHigh
+        payload = self.payload
+        if not payload:
+            return None
+        # do NOT mix elements and timespans.
+        if isinstance(payload[0], Music21Object):  # elements do not have endTimes.
+            if len(payload) == 1:
+                endTime = self.position + payload[0].duration.quarterLength
+                return (endTime, endTime)
+            quarterLengths = [x.duration.quarterLength for x in payload]
+            return (self.position + min(quarterLengths),
+                    self.position + max(quarterLengths))
+        endTimes = [x.endTime for x in payload]
+        return (min(endTimes), max(endTimes))
 
     def payloadEndTimes(self):
         '''
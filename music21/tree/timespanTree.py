@@ -15,7 +15,7 @@ and other positions.
 '''
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 import itertools
 import random
 import typing as t
@@ -32,7 +32,7 @@ from music21.tree import trees
 
 
 if t.TYPE_CHECKING:
-    from music21.tree.verticality import VerticalitySequence
+    from music21.tree.verticality import Verticality, VerticalitySequence
 
 
 environLocal = environment.Environment('tree.timespanTree')
@@ -448,6 +448,8 @@ class TimespanTree(trees.OffsetTree):
     def iterateVerticalities(
         self,
         reverse: bool = False,
+        *,
+        sweep: bool = False,
     ) -> Generator['music21.tree.verticality.Verticality', None, None]:
         r'''
         Iterates all vertical moments in this TimespanTree, represented as
@@ -493,8 +495,34 @@ class TimespanTree(trees.OffsetTree):
         <music21.tree.verticality.Verticality 31.0 {B2 C#4 E4 F#4}>
         <music21.tree.verticality.Verticality 30.0 {A#2 C#4 E4 F#4}>
         <music21.tree.verticality.Verticality 29.5 {A#2 F#3 D4 F#4}>
+
+        If the tree will not be changed while iterating, `sweep=True` gives the same
+        verticalities much faster, by walking through the timespans once and keeping
+        track of those that are still sounding
+        (see :func:`~music21.tree.verticality.sweepVerticalities`),
+        rather than searching the tree again for each verticality.
+
+        >>> swept = list(scoreTree.iterateVerticalities(sweep=True))
+        >>> swept[:3]
+        [<music21.tree.verticality.Verticality 0.0 {A3 E4 C#5}>,
+         <music21.tree.verticality.Verticality 0.5 {G#3 B3 E4 B4}>,
+         <music21.tree.verticality.Verticality 1.0 {F#3 C#4 F#4 A4}>]
+        >>> [v.offset for v in swept] == [v.offset for v in scoreTree.iterateVerticalities()]
+        True
+
+        * Changed in v11: added sweep.
         '''
-        if reverse:
+        if sweep and self.rootNode is not None:
+            from music21.tree.verticality import sweepVerticalities
+            verticalities: Iterator[Verticality] = (
+                v for v, unused in sweepVerticalities(self,
+                                                      timespanTree=self,
+                                                      includeStopPoints=False))
+            if reverse:
+                # the sweep only goes forward.
+                verticalities = reversed(list(verticalities))
+            yield from verticalities
+        elif reverse:
             offset = self.highestPosition()
             verticality = self.getVerticalityAt(offset)
             yield verticality
@@ -512,7 +540,7 @@ class TimespanTree(trees.OffsetTree):
                 verticality = verticality.nextVerticality
 
     def iterateVerticalitiesNwise(
-            self, n: int = 3, *, reverse: bool = False, padEnd: bool = False
+            self, n: int = 3, *, reverse: bool = False, padEnd: bool = False, sweep: bool = False
     ) -> Generator[VerticalitySequence, None, None]:
         r'''
         Iterates :class:`~music21.tree.verticality.Verticality` objects in groups of length `n`.
@@ -585,8 +613,16 @@ class TimespanTree(trees.OffsetTree):
             (36.0 {})
             ]>
 
+        `sweep=True` is passed on to :meth:`iterateVerticalities` and is much faster
+        when the tree is not changed while iterating:
+
+        >>> swept = list(scoreTree.iterateVerticalitiesNwise(n=3, sweep=True))
+        >>> len(swept) == len(list(scoreTree.iterateVerticalitiesNwise(n=3)))
+        True
+
         * Changed in v8: added padEnd.  Streams with fewer than n elements
             also return an empty sentinel entry.
+        * Changed in v11: added sweep.
         '''
         from music21.tree.verticality import VerticalitySequence, Verticality
 
@@ -604,7 +640,7 @@ class TimespanTree(trees.OffsetTree):
             ending = []
 
         for verticalities in more_itertools.windowed(
-            itertools.chain(self.iterateVerticalities(reverse=reverse), ending),
+            itertools.chain(self.iterateVerticalities(reverse=reverse, sweep=sweep), ending),
             n,
             sentinelVerticality
         ):
@@ -695,6 +731,179 @@ class TimespanTree(trees.OffsetTree):
             partwiseTimespanTree.insert(timespan)
         return partwiseTimespanTrees
 
+    def pack(self, referenceStream=None):
+        '''
+        Returns a compact, picklable representation of this tree, to be stored
+        alongside a frozen copy of `referenceStream` (by default, the
+        :attr:`source` of the tree) and turned back into a tree
+        with :meth:`unpack`.
+
+        Elements, sources, and the parentage of each timespan are not stored
+        themselves but as indices into `referenceStream` followed by everything
+        in `referenceStream.recurse()`, so the elements of a stream that is
+        frozen and thawed along with the tree are found again.  The nodes are
+        listed in pre-order with their positions, which children they have, and
+        their payloads, so the tree keeps its shape.
+
+        >>> score = tree.examples.makeExampleScore()
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> packed = scoreTree.pack()
+        >>> packed['source']
+        0
+        >>> packed['nodes'][0]
+        (3.0, 3, (('p', 3.0, 4.0, 10, 2.0, 4.0, 0),))
+        >>> packed['parentages'][0]
+        (8, 1, 0)
+        >>> score.recurse()[8 - 1]
+        <music21.stream.Measure 2 offset=2.0>
+
+        Elements that are not in the reference stream cannot be packed:
+
+        >>> scoreTree.pack(stream.Stream())
+        Traceback (most recent call last):
+        music21.tree.timespanTree.TimespanTreeException: <music21.stream.Measure 2 offset=2.0>
+            is not in the reference Stream <music21.stream.Stream 0x...>
+
+        * New in v11.
+        '''
+        if referenceStream is None:
+            referenceStream = self.source
+            if referenceStream is None:
+                raise TimespanTreeException(
+                    'A TimespanTree without a source needs a referenceStream to be packed')
+        indices = {id(el): i for i, el in enumerate(_packingOrder(referenceStream))}
+
+        def indexOf(obj):
+            try:
+                return indices[id(obj)]
+            except KeyError:
+                raise TimespanTreeException(
+                    f'{obj!r} is not in the reference Stream {referenceStream!r}'
+                ) from None
+
+        def pack(tsTree):
+            parentages = []
+            parentageIndices = {}
+
+            def packTimespan(ts):
+                if isinstance(ts, TimespanTree):
+                    return ('t', pack(ts))
+                tag = _packedTimespanTags.get(type(ts))
+                if tag is None:
+                    raise TimespanTreeException(f'Cannot pack {ts!r}')
+                if tag == 's':
+                    return (tag, ts.offset, ts.endTime)
+                parentageIndex = parentageIndices.get(ts.parentage)
+                if parentageIndex is None:
+                    parentageIndex = len(parentages)
+                    parentageIndices[ts.parentage] = parentageIndex
+                    parentages.append(tuple(indexOf(site) for site in ts.parentage))
+                return (tag, ts.offset, ts.endTime, indexOf(ts.element),
+                        ts.parentOffset, ts.parentEndTime, parentageIndex)
+
+            nodes = []
+
+            def recurse(node):
+                childFlags = 0
+                if node.leftChild is not None:
+                    childFlags |= 1
+                if node.rightChild is not None:
+                    childFlags |= 2
+                nodes.append((node.position,
+                              childFlags,
+                              tuple(packTimespan(ts) for ts in node.payload)))
+                if node.leftChild is not None:
+                    recurse(node.leftChild)
+                if node.rightChild is not None:
+                    recurse(node.rightChild)
+
+            if tsTree.rootNode is not None:
+                recurse(tsTree.rootNode)
+            source = tsTree.source
+            return {
+                'source': indexOf(source) if source is not None else None,
+                'parentages': parentages,
+                'nodes': nodes,
+            }
+
+        return pack(self)
+
+    @classmethod
+    def unpack(cls, packed, referenceStream):
+        '''
+        Rebuilds a tree from the representation made by :meth:`pack`, finding
+        its elements in `referenceStream`, which should be the stream that was
+        packed (or a frozen and thawed copy of it).
+
+        The nodes are made in the shape they were stored in, so no rebalancing
+        or re-sorting is needed, only one pass to set indices and endTimes.
+
+        >>> score = tree.examples.makeExampleScore()
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> packed = scoreTree.pack()
+
+        >>> newTree = tree.timespanTree.TimespanTree.unpack(packed, score)
+        >>> newTree
+        <TimespanTree {12} (0.0 to 8.0) <music21.stream.Score exampleScore>>
+        >>> list(newTree) == list(scoreTree)
+        False
+        >>> [ts.element for ts in newTree] == [ts.element for ts in scoreTree]
+        True
+        >>> newTree[-1]
+        <PitchedTimespan (7.0 to 8.0) <music21.note.Note C>>
+        >>> newTree[-1].parentage[0]
+        <music21.stream.Measure 4 offset=6.0>
+        >>> newTree.rootNode.debug() == scoreTree.rootNode.debug()
+        True
+
+        * New in v11.
+        '''
+        allElements = _packingOrder(referenceStream)
+
+        def unpack(packedTree):
+            parentages = [tuple(allElements[i] for i in indices)
+                          for indices in packedTree['parentages']]
+
+            def unpackTimespan(packedTimespan):
+                tag = packedTimespan[0]
+                if tag == 't':
+                    return unpack(packedTimespan[1])
+                spanClass = _packedTimespanClasses[tag]
+                if tag == 's':
+                    return spanClass(packedTimespan[1], packedTimespan[2])
+                (unused_tag, offset, endTime, elementIndex,
+                 parentOffset, parentEndTime, parentageIndex) = packedTimespan
+                return spanClass(offset,
+                                 endTime,
+                                 allElements[elementIndex],
+                                 parentOffset=parentOffset,
+                                 parentEndTime=parentEndTime,
+                                 parentage=parentages[parentageIndex])
+
+            packedNodes = iter(packedTree['nodes'])
+
+            def recurse():
+                position, childFlags, payload = next(packedNodes)
+                n = NodeClass(position)
+                n.payload = [unpackTimespan(ts) for ts in payload]
+                if childFlags & 1:
+                    n.leftChild = recurse()
+                if childFlags & 2:
+                    n.rightChild = recurse()
+                n.update()
+                return n
+
+            newTree = cls()
+            if packedTree['nodes']:
+                newTree.rootNode = recurse()
+                newTree.rootNode.updateIndices()
+            if packedTree['source'] is not None:
+                newTree.source = allElements[packedTree['source']]
+            return newTree
+
+        NodeClass = cls.nodeClass
+        return unpack(packed)
+
     @staticmethod
     def unwrapVerticalities(verticalities):
         # noinspection PyShadowingNames
@@ -756,7 +965,7 @@ class TimespanTree(trees.OffsetTree):
         Returns None if there is no verticality here.
         '''
         overlap = None
-        for v in self.iterateVerticalities():
+        for v in self.iterateVerticalities(sweep=True):
             degreeOfOverlap = len(v.startTimespans) + len(v.overlapTimespans)
             if overlap is None:
                 overlap = degreeOfOverlap
@@ -803,6 +1012,22 @@ class TimespanTree(trees.OffsetTree):
         self._source = common.wrapWeakref(expr)
 
 
+
+def _packingOrder(referenceStream):
+    '''
+    The list of objects that :meth:`TimespanTree.pack` refers to by index.
+    '''
+    return [referenceStream, *referenceStream.recurse(restoreActiveSites=False)]
+
+
+_packedTimespanClasses = {
+    'p': spans.PitchedTimespan,
+    'e': spans.ElementTimespan,
+    's': spans.Timespan,
+}
+_packedTimespanTags = {spanClass: tag for tag, spanClass in _packedTimespanClasses.items()}
+
+
 class Test(unittest.TestCase):
 
     def testGetVerticalityAtWithKey(self):
@@ -817,6 +1042,31 @@ class Test(unittest.TestCase):
         ps = v.pitchSet
         self.assertEqual(len(ps), 1)
 
+    def testIterateVerticalitiesSweep(self):
+        from music21 import corpus
+        from music21 import note
+
+        score = corpus.parse('bwv66.6')
+        # zero-length and long notes, so that timespans stop between verticalities.
+        score.parts[1].measure(2).insert(0.5, note.Note('F5', quarterLength=0))
+        score.parts[3].measure(3).insert(0.25, note.Note('C2', quarterLength=9.0))
+        for scoreTree in (score.asTimespans(),
+                          score.asTimespans(classList=(note.Note,)),
+                          score.parts[0].asTimespans(classList=(note.Note,))):
+            for reverse in (False, True):
+                fromTree = list(scoreTree.iterateVerticalities(reverse=reverse))
+                swept = list(scoreTree.iterateVerticalities(reverse=reverse, sweep=True))
+                self.assertEqual([v.offset for v in swept], [v.offset for v in fromTree])
+                for vSwept, vTree in zip(swept, fromTree):
+                    for attr in ('startTimespans', 'overlapTimespans', 'stopTimespans'):
+                        self.assertEqual(getattr(vSwept, attr), getattr(vTree, attr),
+                                         f'{attr} at {vTree.offset}')
+                    self.assertIs(vSwept.timespanTree, scoreTree)
+
+        emptyTree = TimespanTree()
+        self.assertEqual(len(list(emptyTree.iterateVerticalities(sweep=True))),
+                         len(list(emptyTree.iterateVerticalities())))
+
     def testTimespanTree(self):
         for attempt in range(100):
             starts = list(range(20))
@@ -100,10 +100,12 @@ def chordified(timespans, templateStream=None):  # pragma: no cover
             measureList[measureIndex].append(element)
         return outputStream
     else:
-        allTimePoints = timespans.allTimePoints()
+        from music21.tree.verticality import sweepVerticalities
         elements = []
-        for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
-            vert = timespans.getVerticalityAt(offset)
+        for vert, endTime in sweepVerticalities(timespans, timespanTree=timespans):
+            if endTime is None:
+                break
+            offset = vert.offset
             quarterLength = endTime - offset
             if quarterLength < 0:
                 raise TreeException(
@@ -304,14 +304,14 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         >>> n
         <music21.note.Note G#>
         >>> scoreTree.getNodeByIndex(10)
-        <ElementNode: Start:2.0 <0.20...> Indices:(l:10 *10* r:11)
+        <ElementNode: Start:2.0 <0.20...> Indices:(l:0 *10* r:20)
             Payload:<music21.note.Note G#>>
 
         >>> scoreTree[10] = note.Note('F#')
         >>> scoreTree[10]
         <music21.note.Note F#>
         >>> scoreTree.getNodeByIndex(10)
-        <ElementNode: Start:2.0 <0.20...> Indices:(l:10 *10* r:11)
+        <ElementNode: Start:2.0 <0.20...> Indices:(l:0 *10* r:20)
             Payload:<music21.note.Note F#>>
 
         >>> scoreTree[10:13]
@@ -457,9 +457,16 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
 
         if isinstance(node.payload, list):
             # OffsetTree
-            if element in node.payload:
-                node.payload.remove(element)
-            if not node.payload:
+            payload = node.payload
+            for i, payloadElement in enumerate(payload):
+                # equal elements (such as Notes of the same pitch) may share a node.
+                if payloadElement is element:
+                    del payload[i]
+                    break
+            else:
+                if element in payload:
+                    payload.remove(element)
+            if not payload:
                 self.removeNode(position)
         else:
             if node.payload is element:
@@ -467,6 +474,26 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
             if node.payload is None:
                 self.removeNode(position)
 
+    def _updateEndTimesAtPosition(self, position):
+        '''
+        Updates the endTimes of the node at `position` (if any) and of every node
+        above it, after the payload at `position` has changed, in O(log n) time.
+        The other nodes do not need to be updated, since
+        nodes keep their endTimes up to date as the tree is rebalanced.
+        '''
+        path = []
+        node = self.rootNode
+        while node is not None:
+            path.append(node)
+            if position < node.position:
+                node = node.leftChild
+            elif node.position < position:
+                node = node.rightChild
+            else:
+                break
+        for node in reversed(path):
+            node.updateLocalEndTimes()
+
     # PUBLIC METHODS #
     def getPositionFromElementUnsafe(self, el):
         '''
@@ -491,7 +518,8 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         This is about an order of magnitude faster (3ms vs 21ms for 1000 items; 31 vs. 300ms for
         10,000 items) than running createNodeAtPosition() for each element in a list if it is
         already sorted.  Thus, it should be used when converting a
-        Stream where .isSorted is True into a tree.
+        Stream where .isSorted is True into a tree.  The tree is built in O(n) time
+        and is perfectly balanced; the indices and endTimes of every node are set.
 
         If any of the conditions is not true, expect to get a dangerously
         badly sorted tree that will be useless.
@@ -549,28 +577,26 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         <ElementNode: Start:36.0 <0.-5...> Indices:(l:197 *198* r:199)
             Payload:<music21.bar.Barline type=final>>
         '''
-        def recurse(subListOfTuples, globalStartOffset) -> core.AVLNode|None:
+        def recurse(start, stop) -> core.AVLNode|None:
             '''
-            Divide and conquer.
+            Divide and conquer on listOfTuples[start:stop], without copying it.
             '''
-            lenL = len(subListOfTuples)
-            if lenL == 0:
+            if start >= stop:
                 return None
-            midpoint = lenL // 2
-            midtuple = subListOfTuples[midpoint]
+            midpoint = start + (stop - start) // 2
+            midtuple = listOfTuples[midpoint]
             n = NodeClass(midtuple[0], midtuple[1])
-            n.payloadElementIndex = globalStartOffset + midpoint
-            n.subtreeElementsStartIndex = globalStartOffset
-            n.subtreeElementsStopIndex = globalStartOffset + lenL
-            n.leftChild = recurse(subListOfTuples[:midpoint],
-                                  globalStartOffset)
-            n.rightChild = recurse(subListOfTuples[midpoint + 1:],
-                                   globalStartOffset + midpoint + 1)
+            n.payloadElementIndex = midpoint
+            n.subtreeElementsStartIndex = start
+            n.subtreeElementsStopIndex = stop
+            n.leftChild = recurse(start, midpoint)
+            n.rightChild = recurse(midpoint + 1, stop)
             n.update()
             return n
 
         NodeClass = self.nodeClass
-        self.rootNode = recurse(listOfTuples, 0)
+        # each node's endTimes are set by n.update()
+        self.rootNode = recurse(0, len(listOfTuples))
 
     def getNodeByIndex(self, i):
         '''
@@ -584,7 +610,7 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         <ElementTree {20} (0.0 <0.-25...> to 8.0) <music21.stream.Score exampleScore>>
 
         >>> scoreTree.getNodeByIndex(0)
-        <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:2)
+        <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:1)
             Payload:<music21.instrument.Instrument 'PartA: : '>>
 
         >>> scoreTree.getNodeByIndex(-1)
@@ -592,14 +618,14 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
             Payload:<music21.bar.Barline type=final>>
 
         >>> scoreTree.getNodeByIndex(slice(2, 5))
-        [<ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:4) Payload:<music21.clef.BassClef>>,
+        [<ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:5) Payload:<music21.clef.BassClef>>,
          <ElementNode: Start:0.0 <0.0...> Indices:(l:3 *3* r:4) Payload:<music21.clef.BassClef>>,
-         <ElementNode: Start:0.0 <0.4...> Indices:(l:0 *4* r:8)
+         <ElementNode: Start:0.0 <0.4...> Indices:(l:3 *4* r:5)
              Payload:<music21.meter.TimeSignature 2/4>>]
 
         >>> scoreTree.getNodeByIndex(slice(-6, -3))
-        [<ElementNode: Start:5.0 <0.20...> Indices:(l:9 *14* r:20) Payload:<music21.note.Note A>>,
-         <ElementNode: Start:6.0 <0.20...> Indices:(l:15 *15* r:17) Payload:<music21.note.Note B>>,
+        [<ElementNode: Start:5.0 <0.20...> Indices:(l:14 *14* r:15) Payload:<music21.note.Note A>>,
+         <ElementNode: Start:6.0 <0.20...> Indices:(l:11 *15* r:20) Payload:<music21.note.Note B>>,
          <ElementNode: Start:6.0 <0.20...> Indices:(l:16 *16* r:17) Payload:<music21.note.Note D#>>]
 
         >>> scoreTree.getNodeByIndex(slice(-100, -200))
@@ -661,24 +687,24 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
 
         >>> for node in scoreTree.iterNodes():
         ...     print(node)
-        <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:2)
+        <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *0* r:1)
                 Payload:<music21.instrument.Instrument 'PartA: : '>>
-        <ElementNode: Start:0.0 <0.-25...> Indices:(l:1 *1* r:2)
+        <ElementNode: Start:0.0 <0.-25...> Indices:(l:0 *1* r:2)
                 Payload:<music21.instrument.Instrument 'PartB: : '>>
-        <ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:4) Payload:<music21.clef.BassClef>>
+        <ElementNode: Start:0.0 <0.0...> Indices:(l:0 *2* r:5) Payload:<music21.clef.BassClef>>
         <ElementNode: Start:0.0 <0.0...> Indices:(l:3 *3* r:4) Payload:<music21.clef.BassClef>>
-        <ElementNode: Start:0.0 <0.4...> Indices:(l:0 *4* r:8)
+        <ElementNode: Start:0.0 <0.4...> Indices:(l:3 *4* r:5)
                 Payload:<music21.meter.TimeSignature 2/4>>
-        <ElementNode: Start:0.0 <0.4...> Indices:(l:5 *5* r:6)
+        <ElementNode: Start:0.0 <0.4...> Indices:(l:0 *5* r:10)
                 Payload:<music21.meter.TimeSignature 2/4>>
-        <ElementNode: Start:0.0 <0.20...> Indices:(l:5 *6* r:8) Payload:<music21.note.Note C>>
-        <ElementNode: Start:0.0 <0.20...> Indices:(l:7 *7* r:8) Payload:<music21.note.Note C#>>
-        <ElementNode: Start:1.0 <0.20...> Indices:(l:0 *8* r:20) Payload:<music21.note.Note D>>
-        <ElementNode: Start:2.0 <0.20...> Indices:(l:9 *9* r:11) Payload:<music21.note.Note E>>
+        <ElementNode: Start:0.0 <0.20...> Indices:(l:6 *6* r:7) Payload:<music21.note.Note C>>
+        <ElementNode: Start:0.0 <0.20...> Indices:(l:6 *7* r:8) Payload:<music21.note.Note C#>>
+        <ElementNode: Start:1.0 <0.20...> Indices:(l:6 *8* r:10) Payload:<music21.note.Note D>>
+        <ElementNode: Start:2.0 <0.20...> Indices:(l:9 *9* r:10) Payload:<music21.note.Note E>>
             ...
-        <ElementNode: Start:7.0 <0.20...> Indices:(l:15 *17* r:20)
+        <ElementNode: Start:7.0 <0.20...> Indices:(l:16 *17* r:18)
                 Payload:<music21.note.Note C>>
-        <ElementNode: Start:End <0.-5...> Indices:(l:18 *18* r:20)
+        <ElementNode: Start:End <0.-5...> Indices:(l:16 *18* r:20)
                 Payload:<music21.bar.Barline type=final>>
         <ElementNode: Start:End <0.-5...> Indices:(l:19 *19* r:20)
                 Payload:<music21.bar.Barline type=final>>
@@ -740,7 +766,7 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         '''
         return [self.getPositionFromElementUnsafe(el) for el in elements]
 
-    def insert(self, positionsOrElements, elements=None):
+    def insert(self, positionsOrElements, elements=None, *, runUpdate=True):
         r'''
         Inserts elements or `Timespans` into this tree.
 
@@ -759,6 +785,23 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         >>> ot.insert([n2, n3])
         >>> ot
         <OffsetTree {3} (5.0 to 21.0)>
+
+        Updating the indices of every node takes time proportional to the size of
+        the tree.  If `runUpdate` is False, only the endTimes of the nodes that
+        have changed are updated, which takes O(log n) time, and the indices are left
+        until `.rootNode.updateIndices()` is called (or something is inserted
+        or removed with `runUpdate` True).  The tree can still be searched by position,
+        but not by index, in the meantime.
+
+        >>> n4 = note.Note('F', type='whole')
+        >>> ot.insert(30.0, n4, runUpdate=False)
+        >>> ot.endTime
+        34.0
+        >>> ot.rootNode.updateIndices()
+        >>> ot
+        <OffsetTree {4} (5.0 to 34.0)>
+
+        * Changed in v11: added `runUpdate`.
         '''
         initialPosition = self.lowestPosition()
         initialEndTime = self.endTime
@@ -781,8 +824,11 @@ class ElementTree[PayloadType](core.AVLTree[PayloadType]):
         for i, el in enumerate(elements):
             pos = positions[i]
             self._insertCore(pos, el)
+            if not runUpdate:
+                self._updateEndTimesAtPosition(pos)
 
-        self._updateNodes(initialPosition, initialEndTime)
+        if runUpdate:
+            self._updateNodes(initialPosition, initialEndTime)
 
     def _insertCore(self, position, el):
         '''
@@ -1136,6 +1182,86 @@ class OffsetTree(ElementTree[list[object]]):
         node.payload.append(el)
         node.payload.sort(key=self._insertCorePayloadSortKey)
 
+    def populateFromSortedList(self, listOfTuples):
+        '''
+        Populate this tree from a list of two-tuples of (offset, element) that
+        is sorted by offset.  Unlike :meth:`ElementTree.populateFromSortedList`,
+        several elements may share the same offset; they are gathered
+        into one node whose payload is sorted just as :meth:`insert` would sort it
+        (elements with the same sort key keep their order in the list).
+
+        The tree is built bottom-up in O(n) time (plus sorting each payload), is
+        perfectly balanced, and has its indices and endTimes set, so it is
+        identical to a tree made by inserting each element one at a time, but
+        without rebalancing along the way.
+
+        As with the ElementTree version, the tree should be empty beforehand and the list
+        must really be sorted.
+
+        >>> notes = [note.Note(type='half'), note.Note(), note.Note(), note.Note(type='whole')]
+        >>> listOfTuples = [(0.0, notes[0]), (0.0, notes[1]), (1.0, notes[2]), (3.0, notes[3])]
+        >>> ot = tree.trees.OffsetTree()
+        >>> ot.populateFromSortedList(listOfTuples)
+        >>> ot
+        <OffsetTree {4} (0.0 to 7.0)>
+        >>> for node in ot.iterNodes():
+        ...     node
+        <OffsetNode 0.0 Indices:0,0,2,2 Length:2>
+        <OffsetNode 1.0 Indices:0,2,3,4 Length:1>
+        <OffsetNode 3.0 Indices:3,3,4,4 Length:1>
+        >>> ot.rootNode.endTimeLow, ot.rootNode.endTimeHigh
+        (1.0, 7.0)
+
+        TimespanTrees are populated the same way, with the offset of each timespan:
+
+        >>> tss = [tree.spans.Timespan(0, 2), tree.spans.Timespan(0, 1), tree.spans.Timespan(1, 3)]
+        >>> tsTree = tree.timespanTree.TimespanTree()
+        >>> tsTree.populateFromSortedList([(ts.offset, ts) for ts in tss])
+        >>> for ts in tsTree:
+        ...     ts
+        <Timespan 0.0 1.0>
+        <Timespan 0.0 2.0>
+        <Timespan 1.0 3.0>
+
+        * New in v11.
+        '''
+        def recurse(start, stop):
+            '''
+            Divide and conquer on the groups of equal offsets in groups[start:stop].
+            Unlike ElementTree, takes the lower of two middles, so that
+            any extra depth is on the right, as it usually is after inserting in order.
+            '''
+            if start >= stop:
+                return None
+            midpoint = start + (stop - start - 1) // 2
+            position, payload = groups[midpoint]
+            n = NodeClass(position)
+            n.payload = payload
+            n.leftChild = recurse(start, midpoint)
+            n.rightChild = recurse(midpoint + 1, stop)
+            n.update()
+            return n
+
+        groups = []
+        sortKey = self._insertCorePayloadSortKey
+        lastPosition = None
+        payload = None
+        for position, el in listOfTuples:
+            if payload is None or position != lastPosition:
+                payload = [el]
+                groups.append((position, payload))
+                lastPosition = position
+            else:
+                payload.append(el)
+        for unused_position, payload in groups:
+            if len(payload) > 1:
+                payload.sort(key=sortKey)
+
+        NodeClass = self.nodeClass
+        self.rootNode = recurse(0, len(groups))
+        if self.rootNode is not None:
+            self.rootNode.updateIndices()
+
     def copy(self):
         # noinspection PyShadowingNames
         r'''
@@ -1162,8 +1288,10 @@ class OffsetTree(ElementTree[list[object]]):
         True
         '''
         newTree = type(self)()
-        # this is just as efficient as ._insertCore, since it's given a list.
-        newTree.insert(list(self))
+        # the nodes are already in order, so no rebalancing is needed.
+        newTree.populateFromSortedList(
+            [(node.position, el) for node in self.iterNodes() for el in node.payload]
+        )
         newTree.source = self.source
         newTree.parentTrees = self.parentTrees.copy()
         return newTree
@@ -1265,6 +1393,125 @@ class OffsetTree(ElementTree[list[object]]):
         results = recurse(self.rootNode)
         return tuple(results)
 
+    def overlapping(self, start, end):
+        r'''
+        Finds elements or timespans in this tree which overlap the range from
+        `start` up to (but not including) `end`, in order.
+
+        Subtrees whose highest endTime is before `start` and nodes at or
+        after `end` are never visited, so this is much faster than checking
+        every timespan in the tree.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> for ts in scoreTree.overlapping(1.25, 2.0):
+        ...     ts
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note A>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note F#>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note C#>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note F#>>
+
+        Elements that end at `start` or begin at `end` do not overlap:
+
+        >>> len(scoreTree.overlapping(1.0, 2.0))
+        4
+        >>> len(scoreTree.overlapping(0.5, 2.0))
+        8
+
+        Zero-length elements count as overlapping if `start <= offset < end`, and
+        if `start` equals `end`, the query is for a single point, like
+        `elementsOverlappingOffset` but also including elements that begin there:
+
+        >>> for ts in scoreTree.overlapping(0.5, 0.5):
+        ...     ts
+        <PitchedTimespan (0.0 to 1.0) <music21.note.Note E>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note G#>>
+
+        Works on OffsetTrees as well:
+
+        >>> offsetTree = score.asTree(flatten=True, groupOffsets=True, classList=(note.Note,))
+        >>> offsetTree.overlapping(1.25, 2.0)
+        (<music21.note.Note A>, <music21.note.Note F#>,
+         <music21.note.Note C#>, <music21.note.Note F#>)
+
+        * New in v11.
+        '''
+        isPoint = (start == end)
+        elementEndTime = self.elementEndTime
+        results = []
+
+        def overlaps(offset, endTime):
+            # treat zero-length elements and queries as instants; see docs above.
+            return ((offset < end or (isPoint and offset == end))
+                    and (start < endTime or (offset == endTime and start <= offset)))
+
+        def recurse(node):
+            if node is None or node.endTimeHigh < start:
+                return
+            recurse(node.leftChild)
+            position = node.position
+            if position < end or (isPoint and position == end):
+                for el in node.payload:
+                    if overlaps(position, elementEndTime(el, node)):
+                        results.append(el)
+                recurse(node.rightChild)
+
+        recurse(self.rootNode)
+        return tuple(results)
+
+    def containedIn(self, start, end):
+        r'''
+        Finds elements or timespans in this tree which begin at or after `start`
+        and end at or before `end`, in order.
+
+        Subtrees whose lowest endTime is after `end` and nodes outside of `start`
+        to `end` are never visited.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> for ts in scoreTree.containedIn(0.5, 1.5):
+        ...     ts
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note G#>>
+
+        Compare to `overlapping`, which also finds the notes that begin before 0.5
+        or end after 1.5:
+
+        >>> len(scoreTree.overlapping(0.5, 1.5))
+        8
+
+        Zero-length elements at `start` or `end` are contained:
+
+        >>> scoreTree = tree.examples.makeExampleScore().asTimespans()
+        >>> for ts in scoreTree.containedIn(8.0, 8.0):
+        ...     ts
+        <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
+        <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
+
+        * New in v11.
+        '''
+        elementEndTime = self.elementEndTime
+        results = []
+
+        def recurse(node):
+            if node is None or node.endTimeLow > end:
+                return
+            position = node.position
+            if start < position:
+                recurse(node.leftChild)
+            if start <= position <= end:
+                for el in node.payload:
+                    if elementEndTime(el, node) <= end:
+                        results.append(el)
+            if position < end:
+                recurse(node.rightChild)
+
+        recurse(self.rootNode)
+        return tuple(results)
+
     def removeElements(self, elements, offsets=None, runUpdate=True):
         r'''
         Removes `elements` which can be Music21Objects or Timespans
@@ -1272,9 +1519,13 @@ class OffsetTree(ElementTree[list[object]]):
 
         Much safer (for non-timespans) if a list of offsets is used, but it is optional.
 
-        If runUpdate is False then the tree will be left with incorrect indices and
-        endTimes; but it can speed up operations where an element is going to be removed
+        If runUpdate is False then the tree will be left with incorrect indices
+        (only the endTimes of the nodes that have changed are updated, as in :meth:`insert`);
+        but it can speed up operations where an element is going to be removed
         and then immediately replaced: i.e., where the position of an element has changed.
+
+        * Changed in v11: elements are removed by identity when possible, and
+          the endTimes are kept up to date even if runUpdate is False.
         '''
         initialPosition = self.lowestPosition()
         initialEndTime = self.endTime
@@ -1289,9 +1540,12 @@ class OffsetTree(ElementTree[list[object]]):
 
         for i, el in enumerate(elements):
             if offsets is not None:
-                self._removeElementAtPosition(el, offsets[i])
+                position = offsets[i]
             else:
-                self._removeElementAtPosition(el, el.offset)
+                position = el.offset
+            self._removeElementAtPosition(el, position)
+            if not runUpdate:
+                self._updateEndTimesAtPosition(position)
 
         if runUpdate:
             self._updateNodes(initialPosition, initialEndTime)
@@ -1502,6 +1756,176 @@ class Test(unittest.TestCase):
         st3 = et.getPositionAfter(5.0)
         self.assertIsNotNone(st3)
 
+    def assertTreeWellFormed(self, t):
+        '''
+        Check the balance, indices, and endTimes of every node against brute force.
+        '''
+        def recurse(node, start):
+            if node is None:
+                return -1, start, []
+            leftHeight, payloadStart, leftEnds = recurse(node.leftChild, start)
+            if isinstance(node.payload, list):
+                payloadEnds = [t.elementEndTime(el, node) for el in node.payload]
+                self.assertEqual(node.payloadElementsStartIndex, payloadStart)
+                payloadStop = payloadStart + len(node.payload)
+                self.assertEqual(node.payloadElementsStopIndex, payloadStop)
+            else:
+                payloadEnds = [node.position.offset + node.payload.duration.quarterLength]
+                self.assertEqual(node.payloadElementIndex, payloadStart)
+                payloadStop = payloadStart + 1
+            rightHeight, stop, rightEnds = recurse(node.rightChild, payloadStop)
+            self.assertIn(rightHeight - leftHeight, (-1, 0, 1))
+            self.assertEqual(node.height, max(leftHeight, rightHeight) + 1)
+            self.assertEqual(node.subtreeElementsStartIndex, start)
+            self.assertEqual(node.subtreeElementsStopIndex, stop)
+            allEnds = leftEnds + payloadEnds + rightEnds
+            self.assertEqual(node.endTimeLow, min(allEnds))
+            self.assertEqual(node.endTimeHigh, max(allEnds))
+            return node.height, stop, allEnds
+
+        recurse(t.rootNode, 0)
+
+    def testPopulateFromSortedListMatchesInsert(self):
+        from music21 import corpus
+        from music21 import note
+        from music21.tree import fromStream
+
+        score = corpus.parse('bwv66.6')
+        for kwargs in ({'useTimespans': True},
+                       {'groupOffsets': True},
+                       {'groupOffsets': False},
+                       {'useTimespans': True, 'classList': (note.Note,)}):
+            for flatten in (True, 'semiFlat'):
+                bulkTree = fromStream.asTree(score, flatten=flatten, **kwargs)
+                self.assertTreeWellFormed(bulkTree)
+
+                # build the same tree one insert at a time
+                insertTree = type(bulkTree)(source=score)
+                for node in bulkTree.iterNodes():
+                    if isinstance(node.payload, list):
+                        for el in node.payload:
+                            insertTree.insert(node.position, el)
+                    else:
+                        insertTree.insert(node.position, node.payload)
+                self.assertTreeWellFormed(insertTree)
+
+                self.assertEqual(len(bulkTree), len(insertTree))
+                self.assertEqual(list(bulkTree), list(insertTree))
+                self.assertEqual([n.position for n in bulkTree.iterNodes()],
+                                 [n.position for n in insertTree.iterNodes()])
+                self.assertEqual(bulkTree.endTime, insertTree.endTime)
+                for i in (0, 17, len(bulkTree) - 1):
+                    self.assertIs(bulkTree[i], insertTree[i])
+
+    def testOverlappingAndContainedInMatchBruteForce(self):
+        import random
+        from music21.tree import spans
+        from music21.tree import timespanTree
+
+        rand = random.Random(21)
+        timespans = []
+        for _ in range(300):
+            offset = rand.randrange(0, 80) / 2
+            # about a tenth of the timespans have no length
+            length = rand.choice((0, 0.5, 1, 1, 2, 3, 8, 20))
+            timespans.append(spans.Timespan(offset, offset + length))
+        tsTree = timespanTree.TimespanTree()
+        tsTree.insert(timespans)
+        inOrder = list(tsTree)
+
+        def bruteOverlapping(start, end):
+            out = []
+            for ts in inOrder:
+                if start == end and ts.offset == ts.endTime:
+                    hit = ts.offset == start
+                elif start == end:
+                    hit = ts.offset <= start < ts.endTime
+                elif ts.offset == ts.endTime:
+                    hit = start <= ts.offset < end
+                else:
+                    hit = ts.offset < end and start < ts.endTime
+                if hit:
+                    out.append(ts)
+            return tuple(out)
+
+        def bruteContainedIn(start, end):
+            return tuple(ts for ts in inOrder
+                         if start <= ts.offset and ts.endTime <= end)
+
+        queries = [(-5.0, 0.0), (0.0, 0.0), (40.0, 100.0), (-1.0, 100.0)]
+        for _ in range(300):
+            start = rand.randrange(-4, 130) / 2
+            queries.append((start, start + rand.choice((0, 0, 0.5, 1, 3, 10))))
+        for start, end in queries:
+            self.assertEqual(tsTree.overlapping(start, end), bruteOverlapping(start, end),
+                             (start, end))
+            self.assertEqual(tsTree.containedIn(start, end), bruteContainedIn(start, end),
+                             (start, end))
+
+        self.assertEqual(timespanTree.TimespanTree().overlapping(0, 10), ())
+        self.assertEqual(timespanTree.TimespanTree().containedIn(0, 10), ())
+
+    def testOverlappingOffsetTree(self):
+        from music21 import corpus
+
+        score = corpus.parse('bwv66.6')
+        offsetTree = score.asTree(flatten=True, groupOffsets=True)
+        flat = score.flatten()
+        timespans = flat.asTimespans()
+        for start, end in ((0.0, 0.0), (0.0, 4.0), (3.25, 3.75), (35.0, 36.0), (36.0, 36.0)):
+            # the TimespanTree version is tested against brute force above;
+            # payloads are sorted differently, so compare as sets.
+            self.assertEqual({id(el) for el in offsetTree.overlapping(start, end)},
+                             {id(ts.element) for ts in timespans.overlapping(start, end)})
+            self.assertEqual({id(el) for el in offsetTree.containedIn(start, end)},
+                             {id(ts.element) for ts in timespans.containedIn(start, end)})
+            self.assertTrue(offsetTree.overlapping(start, end))
+
+    def testPopulateFromSortedListEmpty(self):
+        for treeClass in (ElementTree, OffsetTree):
+            t = treeClass()
+            t.populateFromSortedList([])
+            self.assertIsNone(t.rootNode)
+            self.assertEqual(len(t), 0)
+
+    def testInsertAndRemoveWithoutUpdate(self):
+        import random
+        from music21 import note
+
+        rng = random.Random(24)
+        ot = OffsetTree()
+        ot.populateFromSortedList([(float(i), note.Note(quarterLength=1)) for i in range(50)])
+        contents = [(float(i), el) for i, el in enumerate(ot)]
+        for unused in range(200):
+            if contents and rng.random() < 0.5:
+                offset, el = contents.pop(rng.randrange(len(contents)))
+                ot.removeElements(el, offset, runUpdate=False)
+            else:
+                offset = rng.randrange(60) / 2
+                el = note.Note(quarterLength=rng.choice([0, 0.5, 1, 4]))
+                contents.append((offset, el))
+                ot.insert(offset, el, runUpdate=False)
+            # the endTimes are always right...
+            if contents:
+                self.assertEqual(ot.endTime,
+                                 max(o + el.duration.quarterLength for o, el in contents))
+        # ...and the indices are once they are updated.
+        ot.rootNode.updateIndices()
+        self.assertTreeWellFormed(ot)
+        self.assertEqual(sorted(id(el) for el in ot), sorted(id(el) for unused, el in contents))
+
+    def testRemoveEqualElementsByIdentity(self):
+        from music21 import note
+
+        n1 = note.Note('C')
+        n2 = note.Note('C')
+        self.assertEqual(n1, n2)
+        ot = OffsetTree()
+        ot.insert(0.0, n1)
+        ot.insert(0.0, n2)
+        ot.removeElements(n2, 0.0)
+        self.assertIs(ot[0], n1)
+
 #     def testBachDoctest(self):
 #         from music21 import corpus, note, chord, tree
 #         bach = corpus.parse('bwv66.6')
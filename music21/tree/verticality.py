@@ -14,7 +14,7 @@ Object for dealing with vertical simultaneities in a fast way w/o Chord's overhe
 '''
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Generator, Iterable, Sequence
 import copy
 import itertools
 import typing as t
@@ -1230,10 +1230,126 @@ class VerticalitySequence(prebase.ProtoM21Object, Sequence[Verticality]):
         return unwrapped
 
 
+# -----------------------------------------------------------------------------
+def sweepVerticalities(
+    timespans: Iterable[spans.ElementTimespan],
+    *,
+    startOffset: OffsetQL|None = None,
+    timespanTree=None,
+    includeStopPoints: bool = True,
+) -> Generator[tuple[Verticality, OffsetQL|None], None, None]:
+    r'''
+    Sweep once through `timespans`, which must already be sorted by offset
+    and then by endTime, and yield a tuple of a :class:`Verticality` and the
+    offset of the next time point (None for the last one) at each offset where
+    a timespan starts or stops.
+
+    The verticalities are the same as those from calling
+    :meth:`~music21.tree.trees.OffsetTree.getVerticalityAt` for each of the
+    :meth:`~music21.tree.trees.OffsetTree.allTimePoints` of a TimespanTree
+    holding the same timespans, but only the timespans sounding at the
+    current offset are looked at, so no tree needs to be built or searched.
+
+    >>> score = tree.examples.makeExampleScore()
+    >>> timespans = tree.fromStream.sortedTimespans(score, classList=(note.Note,))
+    >>> for vert, nextOffset in tree.verticality.sweepVerticalities(timespans):
+    ...     print(vert, nextOffset)
+    <music21.tree.verticality.Verticality 0.0 {C3 C#3}> 1.0
+    <music21.tree.verticality.Verticality 1.0 {C#3 D3}> 2.0
+    <music21.tree.verticality.Verticality 2.0 {E3 G#3}> 3.0
+    <music21.tree.verticality.Verticality 3.0 {F3 G#3}> 4.0
+    <music21.tree.verticality.Verticality 4.0 {E#3 G3}> 5.0
+    <music21.tree.verticality.Verticality 5.0 {E#3 A3}> 6.0
+    <music21.tree.verticality.Verticality 6.0 {D#3 B3}> 7.0
+    <music21.tree.verticality.Verticality 7.0 {C3 D#3}> 8.0
+    <music21.tree.verticality.Verticality 8.0 {}> None
+
+    If `startOffset` is given, there is also a verticality there, even if
+    nothing starts or stops at that offset.
+
+    `timespanTree` is stored on each Verticality, for methods such as
+    :attr:`~Verticality.nextVerticality` that need it.
+
+    If `includeStopPoints` is False, there are only verticalities where at least
+    one timespan starts, as in
+    :meth:`~music21.tree.timespanTree.TimespanTree.iterateVerticalities`;
+    timespans that stop in between are still dropped as the sweep moves on.
+
+    >>> for vert, nextOffset in tree.verticality.sweepVerticalities(
+    ...         timespans[-3:], includeStopPoints=False):
+    ...     print(vert, nextOffset)
+    <music21.tree.verticality.Verticality 6.0 {D#3 B3}> 7.0
+    <music21.tree.verticality.Verticality 7.0 {C3 D#3}> None
+
+    Each verticality takes time in proportion to the number of timespans
+    sounding, starting, or stopping there, not the number in the whole score.
+
+    * New in v11.
+    '''
+    timespanList = list(timespans)
+    timePointSet = {ts.offset for ts in timespanList}
+    if includeStopPoints:
+        timePointSet.update(ts.endTime for ts in timespanList)
+    if startOffset is not None:
+        timePointSet.add(startOffset)
+    timePoints = sorted(timePointSet)
+
+    numTimespans = len(timespanList)
+    i = 0
+    # timespans sounding before the current offset, in the order of timespanList.
+    active: list[spans.ElementTimespan] = []
+    for pointIndex, offset in enumerate(timePoints):
+        startIndex = i
+        while i < numTimespans and timespanList[i].offset <= offset:
+            i += 1
+        startTimespans = tuple(timespanList[startIndex:i])
+        overlapTimespans = tuple([ts for ts in active if ts.endTime > offset])
+        stopTimespans = tuple([ts for ts in active if ts.endTime == offset]
+                              + [ts for ts in startTimespans if ts.endTime == offset])
+
+        if pointIndex + 1 < len(timePoints):
+            nextOffset = timePoints[pointIndex + 1]
+        else:
+            nextOffset = None
+        yield (Verticality(offset=offset,
+                           overlapTimespans=overlapTimespans,
+                           startTimespans=startTimespans,
+                           stopTimespans=stopTimespans,
+                           timespanTree=timespanTree),
+               nextOffset)
+
+        active = list(overlapTimespans)
+        active.extend(ts for ts in startTimespans if ts.endTime > offset)
+
+
 # -----------------------------------------------------------------------------
 
 class Test(unittest.TestCase):
-    pass
+
+    def testSweepVerticalitiesMatchesTree(self):
+        from music21 import corpus
+        from music21.tree import fromStream
+
+        score = corpus.parse('bwv66.6')
+        # a zero-duration note starts and stops at the same time point
+        gn = note.Note('F5', quarterLength=0)
+        score.parts[0].measure(1).insert(1.0, gn)
+        scoreTree = fromStream.asTimespans(score, flatten=True, classList=(note.GeneralNote,))
+        timespans = fromStream.sortedTimespans(score, classList=(note.GeneralNote,))
+        self.assertEqual([ts.element for ts in timespans], [ts.element for ts in scoreTree])
+
+        timePoints = scoreTree.allTimePoints()
+        swept = list(sweepVerticalities(timespans, timespanTree=scoreTree))
+        self.assertEqual([v.offset for v, unused in swept], list(timePoints))
+        self.assertEqual([nextOffset for unused, nextOffset in swept],
+                         list(timePoints[1:]) + [None])
+        for vert, unused in swept:
+            fromTree = scoreTree.getVerticalityAt(vert.offset)
+            for attr in ('startTimespans', 'overlapTimespans', 'stopTimespans'):
+                self.assertEqual([ts.element for ts in getattr(vert, attr)],
+                                 [ts.element for ts in getattr(fromTree, attr)],
+                                 f'{attr} at {vert.offset}')
+            self.assertIs(vert.timespanTree, scoreTree)
 
 # -----------------------------------------------------------------------------
 
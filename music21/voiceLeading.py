@@ -2479,7 +2479,7 @@ def iterateAllVoiceLeadingQuartets(
     1 Alto Bass <music21.voiceLeading.VoiceLeadingQuartet v1n1=F#4, v1n2=E4, v2n1=F#3, v2n2=G#3>
     ...
     '''
-    for v in s.asTimespans().iterateVerticalities(reverse=reverse):
+    for v in s.asTimespans().iterateVerticalities(reverse=reverse, sweep=True):
         yield from v.getAllVoiceLeadingQuartets(
             includeRests=includeRests,
             includeOblique=includeOblique,